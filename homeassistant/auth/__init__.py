@@ -9,6 +9,7 @@ import time
 from typing import Any, cast, override
 
 import jwt
+from lru import LRU
 
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -32,6 +33,11 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+# Number of verified access tokens to remember so repeated requests
+# with the same token do not verify its signature again
+VERIFIED_ACCESS_TOKEN_CACHE_SIZE = 64
+ACCESS_TOKEN_LEEWAY = 10
+
 type _MfaModuleDict = dict[str, MultiFactorAuthModule]
 type _ProviderKey = tuple[str, str | None]
 type _ProviderDict = dict[_ProviderKey, AuthProvider]
@@ -190,6 +196,10 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, set[CALLBACK_TYPE]] = {}
+        # Access token -> refresh token it was verified for and when it expires
+        self._verified_access_tokens: LRU[str, tuple[models.RefreshToken, float]] = LRU(
+            VERIFIED_ACCESS_TOKEN_CACHE_SIZE
+        )
         self._expire_callback: CALLBACK_TYPE | None = None
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
@@ -534,11 +544,25 @@ class AuthManager:
     def async_remove_refresh_token(self, refresh_token: models.RefreshToken) -> None:
         """Delete a refresh token."""
         self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_verified_access_tokens(refresh_token)
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, ())
         for revoke_callback in callbacks:
             revoke_callback()
 
+    @callback
+    def _async_forget_verified_access_tokens(
+        self, refresh_token: models.RefreshToken
+    ) -> None:
+        """Forget the verified access tokens of a refresh token."""
+        verified = self._verified_access_tokens
+        for token in [
+            token
+            for token, (verified_refresh_token, _) in verified.items()
+            if verified_refresh_token is refresh_token
+        ]:
+            del verified[token]
+
     @callback
     def async_set_expiry(
         self, refresh_token: models.RefreshToken, *, enable_expiry: bool
@@ -655,6 +679,18 @@ class AuthManager:
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        if verified := self._verified_access_tokens.get(token):
+            refresh_token, valid_until = verified
+            if (
+                time.time() < valid_until
+                # The refresh token may have been removed with its user
+                and self._store.async_get_refresh_token(refresh_token.id)
+                is refresh_token
+                and refresh_token.user.is_active
+            ):
+                return refresh_token
+            del self._verified_access_tokens[token]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -672,8 +708,12 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
-                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            claims = jwt_wrapper.verify_and_decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
             )
         except jwt.InvalidTokenError, jwt.InvalidKeyError:
             return None
@@ -681,6 +721,10 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._verified_access_tokens[token] = (
+            refresh_token,
+            claims["exp"] + ACCESS_TOKEN_LEEWAY,
+        )
         return refresh_token
 
     @callback
@@ -100,6 +100,7 @@ from .setup import (
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
     _setup_started,
+    async_defer_setup_component,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
@@ -919,10 +920,26 @@ async def _async_set_up_integrations(
     all_domains = set(integrations_after_dependencies)
     domains = set(integrations) & all_domains
 
+    # Deferrable integrations nothing else depends on are set up on first use
+    if deferred_domains := {
+        domain for domain in domains if all_integrations[domain].deferrable
+    }:
+        deferred_domains.difference_update(
+            chain.from_iterable(
+                integrations_after_dependencies[domain]
+                for domain in all_domains - deferred_domains
+            )
+        )
+        domains -= deferred_domains
+        all_domains -= deferred_domains
+        for domain in deferred_domains:
+            async_defer_setup_component(hass, domain, config)
+
     _LOGGER.info(
-        "Domains to be set up: %s\nDependencies: %s",
+        "Domains to be set up: %s\nDependencies: %s\nDeferred: %s",
         domains or "{}",
         (all_domains - domains) or "{}",
+        deferred_domains or "{}",
     )
 
     async_set_domains_to_be_loaded(hass, all_domains)
@@ -47,7 +47,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import config_validation as cv, recorder, template
 from homeassistant.helpers.http import MIN_COMPRESSED_RESPONSE_SIZE
-from homeassistant.helpers.json import json_dumps, json_fragment
+from homeassistant.helpers.json import json_bytes, json_dumps, json_fragment
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.event_type import EventType
@@ -212,24 +212,65 @@ class APIStatesView(HomeAssistantView):
 
     @ha.callback
     def get(self, request: web.Request) -> web.Response:
-        """Get current states."""
+        """Get current states or the changes since a version.
+
+        The ETag of the response is the version of the states. When the
+        since query parameter is passed, only the states changed and the
+        entity ids removed after that version are returned.
+        """
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
-        if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+        since: int | None = None
+        if (since_str := request.query.get("since")) is not None:
+            try:
+                since = int(since_str)
+            except ValueError:
+                return self.json_message(
+                    "Invalid since specified.", HTTPStatus.BAD_REQUEST
+                )
+
+        version = hass.states.async_version()
+        etag = str(version)
+        if request.if_none_match and any(
+            match.value == etag for match in request.if_none_match
+        ):
+            response = web.Response(status=HTTPStatus.NOT_MODIFIED)
+            response.etag = etag
+            return response
+
+        changes = None if since is None else hass.states.async_changes_since(since)
+        states: list[ha.State]
+        removed: list[str]
+        if changes is None:
+            states, removed = hass.states.async_all(), []
         else:
+            states, removed = changes
+        if not user.is_admin:
             entity_perm = user.permissions.check_entity
-            states = (
-                state.as_dict_json
-                for state in hass.states.async_all()
-                if entity_perm(state.entity_id, POLICY_READ)
+            states = [
+                state for state in states if entity_perm(state.entity_id, POLICY_READ)
+            ]
+            removed = [
+                entity_id
+                for entity_id in removed
+                if entity_perm(entity_id, POLICY_READ)
+            ]
+        body = b"".join((b"[", b",".join(state.as_dict_json for state in states), b"]"))
+        if since is not None:
+            body = json_bytes(
+                {
+                    "version": version,
+                    "reset": changes is None,
+                    "changed": json_fragment(body),
+                    "removed": removed,
+                }
             )
-        body = b"".join((b"[", b",".join(states), b"]"))
         response = web.Response(
             body=body,
             content_type=CONTENT_TYPE_JSON,
             zlib_executor_size=32768,
         )
+        response.etag = etag
         if len(body) > MIN_COMPRESSED_RESPONSE_SIZE:
             response.enable_compression()
         return response
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 import logging
 from typing import Any, cast, override
 
@@ -97,6 +98,10 @@ from .helpers import async_get_blueprints
 from .trace import trace_automation
 
 DATA_COMPONENT: HassKey[EntityComponent[BaseAutomationEntity]] = HassKey(DOMAIN)
+# Automations referencing each id, by referenced_* property name
+DATA_REFERENCES: HassKey[dict[str, dict[str, list[str]]]] = HassKey(
+    f"{DOMAIN}_references"
+)
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
 
@@ -134,11 +139,23 @@ def _automations_with_x(
     if DATA_COMPONENT not in hass.data:
         return []
 
-    return [
-        automation_entity.entity_id
-        for automation_entity in hass.data[DATA_COMPONENT].entities
-        if referenced_id in getattr(automation_entity, property_name)
-    ]
+    all_references = hass.data.setdefault(DATA_REFERENCES, {})
+    if (references := all_references.get(property_name)) is None:
+        references = all_references[property_name] = {}
+        for automation_entity in hass.data[DATA_COMPONENT].entities:
+            for x_id in getattr(automation_entity, property_name):
+                references.setdefault(x_id, []).append(automation_entity.entity_id)
+
+    return list(references.get(referenced_id, ()))
+
+
+@callback
+def _async_clear_references(hass: HomeAssistant) -> None:
+    """Clear the automations referencing each id.
+
+    Called when an automation is added or removed.
+    """
+    hass.data.pop(DATA_REFERENCES, None)
 
 
 def _x_in_automation(
@@ -329,6 +346,13 @@ class BaseAutomationEntity(ToggleEntity, ABC):
     )
     raw_config: ConfigType | None
 
+    @override
+    async def async_internal_added_to_hass(self) -> None:
+        """Clear the referenced ids when added to and removed from hass."""
+        await super().async_internal_added_to_hass()
+        _async_clear_references(self.hass)
+        self.async_on_remove(partial(_async_clear_references, self.hass))
+
     @property
     @override
     def capability_attributes(self) -> dict[str, Any] | None:
@@ -20,11 +20,12 @@ from .agent import (
     OnProgressCallback,
 )
 from .config import BackupConfig, CreateBackupParametersDict
-from .const import DATA_MANAGER, DOMAIN
+from .const import DATA_BACKUP_AGENT_LISTENERS, DATA_MANAGER, DOMAIN
 from .coordinator import BackupConfigEntry, BackupDataUpdateCoordinator
 from .http import async_register_http_views
 from .manager import (
     AddonErrorData,
+    BackupFileSnapshots,
     BackupManager,
     BackupManagerError,
     BackupPlatformEvent,
@@ -33,6 +34,7 @@ from .manager import (
     BackupReaderWriterError,
     CoreBackupReaderWriter,
     CreateBackupEvent,
+    CreateBackupProgressEvent,
     CreateBackupStage,
     CreateBackupState,
     IdleEvent,
@@ -44,6 +46,7 @@ from .manager import (
     RestoreBackupState,
     UploadBackupEvent,
     WrittenBackup,
+    current_backup_file_snapshots,
 )
 from .models import AddonInfo, AgentBackup, BackupNotFound, Folder
 from .services import async_setup_services
@@ -58,6 +61,7 @@ __all__ = [
     "BackupAgentError",
     "BackupAgentPlatformProtocol",
     "BackupConfig",
+    "BackupFileSnapshots",
     "BackupManagerError",
     "BackupNotFound",
     "BackupPlatformEvent",
@@ -66,6 +70,7 @@ __all__ = [
     "BackupReaderWriterError",
     "CreateBackupEvent",
     "CreateBackupParametersDict",
+    "CreateBackupProgressEvent",
     "CreateBackupStage",
     "CreateBackupState",
     "Folder",
@@ -81,6 +86,7 @@ __all__ = [
     "UploadBackupEvent",
     "WrittenBackup",
     "async_get_manager",
+    "current_backup_file_snapshots",
     "suggested_filename",
     "suggested_filename_from_name_date",
 ]
@@ -131,12 +137,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: BackupConfigEntry) -> bo
     entry.async_on_unload(coordinator.async_unsubscribe)
 
     entry.runtime_data = coordinator
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: BackupConfigEntry) -> None:
+    """Reload the backup agents when the options change."""
+    for listener in hass.data.get(DATA_BACKUP_AGENT_LISTENERS, []):
+        listener()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: BackupConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
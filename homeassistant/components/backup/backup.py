@@ -1,17 +1,27 @@
 """Local backup support for Core and Container installations."""
 
+import asyncio
 from collections.abc import AsyncIterator, Callable, Coroutine
 import json
 from pathlib import Path
 from tarfile import TarError
 from typing import Any, override
+import zlib
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.hassio import is_hassio
+from homeassistant.util.async_iterator import AsyncIteratorReader
 
 from .agent import BackupAgent, LocalBackupAgent, OnProgressCallback
-from .const import DOMAIN, LOGGER
-from .models import AgentBackup, BackupNotFound, InvalidBackupFilename
+from .chunk_store import BackupManifest, ChunkStore
+from .const import (
+    CONF_DEDUPLICATED_BACKUPS,
+    DATA_BACKUP_AGENT_LISTENERS,
+    DEDUPLICATED_BACKUP_DIR,
+    DOMAIN,
+    LOGGER,
+)
+from .models import AgentBackup, BackupAgentError, BackupNotFound, InvalidBackupFilename
 from .util import read_backup, suggested_filename
 
 
@@ -19,10 +29,34 @@ async def async_get_backup_agents(
     hass: HomeAssistant,
     **kwargs: Any,
 ) -> list[BackupAgent]:
-    """Return the local backup agent."""
+    """Return the local backup agents."""
     if is_hassio(hass):
         return []
-    return [CoreLocalBackupAgent(hass)]
+    agents: list[BackupAgent] = [CoreLocalBackupAgent(hass)]
+    if any(
+        entry.options.get(CONF_DEDUPLICATED_BACKUPS)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    ):
+        agents.append(CoreDeduplicatedBackupAgent(hass))
+    return agents
+
+
+@callback
+def async_register_backup_agents_listener(
+    hass: HomeAssistant,
+    *,
+    listener: Callable[[], None],
+    **kwargs: Any,
+) -> Callable[[], None]:
+    """Register a listener to be called when agents are added or removed."""
+    hass.data.setdefault(DATA_BACKUP_AGENT_LISTENERS, []).append(listener)
+
+    @callback
+    def remove_listener() -> None:
+        """Remove the listener."""
+        hass.data[DATA_BACKUP_AGENT_LISTENERS].remove(listener)
+
+    return remove_listener
 
 
 class CoreLocalBackupAgent(LocalBackupAgent):
@@ -153,3 +187,132 @@ class CoreLocalBackupAgent(LocalBackupAgent):
         await self._hass.async_add_executor_job(backup_path.unlink, True)
         LOGGER.debug("Deleted backup located at %s", backup_path)
         self._backups.pop(backup_id)
+
+
+class CoreDeduplicatedBackupAgent(BackupAgent):
+    """Local backup agent storing backups deduplicated in a chunk store.
+
+    Backups are split into chunks and each chunk is only stored once, so
+    backups which share most of their content take little additional space.
+    """
+
+    domain = DOMAIN
+    name = "deduplicated"
+    unique_id = "deduplicated"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the backup agent."""
+        super().__init__()
+        self._hass = hass
+        self._store = ChunkStore(Path(hass.config.path(DEDUPLICATED_BACKUP_DIR)))
+        self._manifests: dict[str, BackupManifest] | None = None
+        # Chunks of a backup being stored must not be removed as unreferenced
+        self._lock = asyncio.Lock()
+
+    async def _async_get_manifests(self) -> dict[str, BackupManifest]:
+        """Return the manifests of the stored backups, loading them on first use."""
+        if self._manifests is None:
+            try:
+                self._manifests = await self._hass.async_add_executor_job(
+                    self._store.read_manifests
+                )
+            except (OSError, json.JSONDecodeError, KeyError, ValueError) as err:
+                raise BackupAgentError(f"Unable to read backups: {err}") from err
+            LOGGER.debug("Loaded %s deduplicated backups", len(self._manifests))
+        return self._manifests
+
+    async def _async_get_manifest(self, backup_id: str) -> BackupManifest:
+        """Return the manifest of a backup."""
+        if (manifest := (await self._async_get_manifests()).get(backup_id)) is None:
+            raise BackupNotFound(f"Backup {backup_id} not found")
+        return manifest
+
+    @override
+    async def async_download_backup(
+        self,
+        backup_id: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """Download a backup file."""
+        manifest = await self._async_get_manifest(backup_id)
+
+        async def read_chunks() -> AsyncIterator[bytes]:
+            for chunk_id in manifest.chunks:
+                try:
+                    yield await self._hass.async_add_executor_job(
+                        self._store.read_chunk, chunk_id
+                    )
+                except (OSError, ValueError, zlib.error) as err:
+                    raise BackupAgentError(
+                        f"Unable to read backup {backup_id}: {err}"
+                    ) from err
+
+        return read_chunks()
+
+    @override
+    async def async_upload_backup(
+        self,
+        *,
+        open_stream: Callable[[], Coroutine[Any, Any, AsyncIterator[bytes]]],
+        backup: AgentBackup,
+        on_progress: OnProgressCallback,
+        **kwargs: Any,
+    ) -> None:
+        """Upload a backup."""
+
+        async def report_progress(
+            stream: AsyncIterator[bytes],
+        ) -> AsyncIterator[bytes]:
+            bytes_uploaded = 0
+            async for chunk in stream:
+                bytes_uploaded += len(chunk)
+                on_progress(bytes_uploaded=bytes_uploaded)
+                yield chunk
+
+        async with self._lock:
+            manifests = await self._async_get_manifests()
+            reader = AsyncIteratorReader(
+                self._hass.loop, report_progress(await open_stream())
+            )
+            try:
+                manifest = await self._hass.async_add_executor_job(
+                    self._store.add_backup, reader, backup
+                )
+            except (OSError, TarError, ValueError, zlib.error) as err:
+                raise BackupAgentError(f"Unable to store backup: {err}") from err
+            finally:
+                reader.close()
+            manifests[backup.backup_id] = manifest
+
+    @override
+    async def async_list_backups(self, **kwargs: Any) -> list[AgentBackup]:
+        """List backups."""
+        return [
+            manifest.backup for manifest in (await self._async_get_manifests()).values()
+        ]
+
+    @override
+    async def async_get_backup(
+        self,
+        backup_id: str,
+        **kwargs: Any,
+    ) -> AgentBackup:
+        """Return a backup."""
+        return (await self._async_get_manifest(backup_id)).backup
+
+    @override
+    async def async_delete_backup(self, backup_id: str, **kwargs: Any) -> None:
+        """Delete a backup and the chunks no other backup uses."""
+        async with self._lock:
+            await self._async_get_manifest(backup_id)
+            try:
+                await self._hass.async_add_executor_job(
+                    self._store.remove_backup, backup_id
+                )
+            except (OSError, json.JSONDecodeError, KeyError, ValueError) as err:
+                raise BackupAgentError(
+                    f"Unable to delete backup {backup_id}: {err}"
+                ) from err
+            finally:
+                self._manifests = None
+            LOGGER.debug("Deleted deduplicated backup %s", backup_id)
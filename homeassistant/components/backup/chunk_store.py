@@ -0,0 +1,268 @@
+"""Deduplicating store of backups split into content-defined chunks."""
+
+import copy
+from dataclasses import dataclass, replace
+import gzip
+import hashlib
+import io
+import logging
+from pathlib import Path, PurePath
+import shutil
+import tarfile
+import tempfile
+from typing import IO, Any, Self, cast
+import zlib
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.file import write_utf8_file
+from homeassistant.util.json import json_loads_object
+
+from .const import BUF_SIZE
+from .models import AgentBackup, BackupAgentError, InvalidBackupFilename
+
+_LOGGER = logging.getLogger(__name__)
+
+CHUNK_MIN_SIZE = 2**18  # 256kB
+CHUNK_MAX_SIZE = 2**22  # 4MB
+# Most chunks are written once and rarely read, so compress them quickly
+CHUNK_COMPRESS_LEVEL = 1
+MANIFEST_VERSION = 1
+# Disk space which is kept free when storing a backup
+MIN_FREE_SPACE = 2**29  # 512MB
+
+# Tar headers are blocks of 512 bytes with the ustar magic at offset 257
+_TAR_BLOCK_SIZE = 512
+_TAR_MAGIC = b"ustar"
+_TAR_MAGIC_OFFSET = 257
+_CHUNK_LOOKAHEAD = CHUNK_MAX_SIZE + _TAR_BLOCK_SIZE
+
+
+def find_chunk_end(buffer: bytes | bytearray, offset: int) -> int:
+    """Return the end of the chunk at the start of the buffer.
+
+    A chunk ends before the first tar header which is at least CHUNK_MIN_SIZE
+    into the buffer, so unchanged files of an archive are split into the same
+    chunks even when files before them changed in size. Chunks without such
+    a header end after CHUNK_MAX_SIZE, so a large file which is changed in
+    place only changes the chunks of the changed parts.
+
+    The offset is the position of the buffer in the stream, tar headers are
+    aligned to 512 bytes in the stream.
+    """
+    max_end = min(len(buffer), CHUNK_MAX_SIZE)
+    search_end = max_end + _TAR_MAGIC_OFFSET + len(_TAR_MAGIC)
+    position = buffer.find(_TAR_MAGIC, CHUNK_MIN_SIZE + _TAR_MAGIC_OFFSET, search_end)
+    while position != -1:
+        header = position - _TAR_MAGIC_OFFSET
+        if (offset + header) % _TAR_BLOCK_SIZE == 0:
+            return header
+        position = buffer.find(_TAR_MAGIC, position + 1, search_end)
+    return max_end
+
+
+class InsufficientSpaceError(BackupAgentError):
+    """Raised when there is not enough free disk space to store a backup."""
+
+    error_code = "insufficient_space"
+
+
+@dataclass(frozen=True, kw_only=True)
+class BackupManifest:
+    """Backup stored as a list of chunks."""
+
+    backup: AgentBackup
+    chunks: list[str]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of this manifest."""
+        return {
+            "version": MANIFEST_VERSION,
+            "backup": self.backup.as_dict(),
+            "chunks": self.chunks,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Create an instance from a JSON serialization."""
+        if data["version"] != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version {data['version']}")
+        return cls(backup=AgentBackup.from_dict(data["backup"]), chunks=data["chunks"])
+
+
+class ChunkWriter:
+    """File object splitting the data written to it into stored chunks."""
+
+    def __init__(self, store: ChunkStore) -> None:
+        """Initialize the writer."""
+        self._store = store
+        self._buffer = bytearray()
+        self._offset = 0
+        self.chunks: list[str] = []
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes written."""
+        return self._offset + len(self._buffer)
+
+    def write(self, data: bytes) -> int:
+        """Write data, storing the chunks which are complete."""
+        self._buffer += data
+        while len(self._buffer) >= _CHUNK_LOOKAHEAD:
+            self._add_chunk(find_chunk_end(self._buffer, self._offset))
+        return len(data)
+
+    def finish(self) -> None:
+        """Store the remaining data."""
+        while self._buffer:
+            self._add_chunk(find_chunk_end(self._buffer, self._offset))
+
+    def _add_chunk(self, end: int) -> None:
+        """Store the chunk at the start of the buffer."""
+        self.chunks.append(self._store.add_chunk(self._buffer[:end]))
+        del self._buffer[:end]
+        self._offset += end
+
+
+class ChunkStore:
+    """Store of backups as manifests of chunks, each chunk is stored once.
+
+    Chunks are named by the SHA-256 hash of their content and compressed on
+    disk. Unprotected backups are stored with uncompressed inner archives,
+    compressed archives change almost entirely when anything in them changes.
+    Such a stored backup is not byte-identical to the added one: its inner
+    archives are .tar instead of .tar.gz, backup.json says it is not
+    compressed and the size in its manifest is the size of the stored backup.
+
+    The methods do blocking I/O and are not safe to call concurrently.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the store."""
+        self._chunk_dir = directory / "chunks"
+        self._manifest_dir = directory / "manifests"
+
+    def _chunk_path(self, chunk_id: str) -> Path:
+        """Return the path of a chunk."""
+        return self._chunk_dir / chunk_id[:2] / chunk_id
+
+    def _manifest_path(self, backup_id: str) -> Path:
+        """Return the path of the manifest of a backup."""
+        if PurePath(backup_id).name != backup_id or backup_id in ("", ".", ".."):
+            raise InvalidBackupFilename(f"Invalid backup id: {backup_id!r}")
+        return self._manifest_dir / f"{backup_id}.json"
+
+    def _check_free_space(self, path: Path) -> None:
+        """Raise if there is less than MIN_FREE_SPACE free disk space at path."""
+        if (free := shutil.disk_usage(path).free) < MIN_FREE_SPACE:
+            raise InsufficientSpaceError(
+                f"Not enough free disk space to store the backup, {free} bytes free"
+            )
+
+    def add_chunk(self, data: bytes | bytearray) -> str:
+        """Store a chunk unless it is already stored and return its id."""
+        chunk_id = hashlib.sha256(data).hexdigest()
+        path = self._chunk_path(chunk_id)
+        if path.exists():
+            return chunk_id
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._check_free_space(path.parent)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(zlib.compress(data, CHUNK_COMPRESS_LEVEL))
+        tmp_path.replace(path)
+        return chunk_id
+
+    def read_chunk(self, chunk_id: str) -> bytes:
+        """Read a chunk, raises ValueError if it is corrupt."""
+        data = zlib.decompress(self._chunk_path(chunk_id).read_bytes())
+        if hashlib.sha256(data).hexdigest() != chunk_id:
+            raise ValueError(f"Chunk {chunk_id} is corrupt")
+        return data
+
+    def add_backup(self, reader: IO[bytes], backup: AgentBackup) -> BackupManifest:
+        """Store a backup read from a stream and return its manifest."""
+        manifest_path = self._manifest_path(backup.backup_id)
+        self._manifest_dir.mkdir(parents=True, exist_ok=True)
+        writer = ChunkWriter(self)
+        # Streams are buffered by copying the buffer, so keep the default size
+        with (
+            tarfile.open(fileobj=reader, mode="r|") as source,
+            tarfile.open(fileobj=cast(IO[bytes], writer), mode="w|") as target,
+        ):
+            self._copy_backup(source, target)
+        writer.finish()
+        manifest = BackupManifest(
+            backup=replace(backup, size=writer.size), chunks=writer.chunks
+        )
+        write_utf8_file(manifest_path, json_bytes(manifest.as_dict()), mode="wb")
+        return manifest
+
+    def _copy_backup(self, source: tarfile.TarFile, target: tarfile.TarFile) -> None:
+        """Copy a backup, decompressing the inner archives if it is unprotected."""
+        decompress = False
+        for member in source:
+            fileobj = source.extractfile(member) if member.isfile() else None
+            name = PurePath(member.name).name
+            if fileobj is not None and name == "backup.json":
+                data = json_loads_object(fileobj.read())
+                if decompress := bool(
+                    data.get("compressed") and not data.get("protected")
+                ):
+                    data["compressed"] = False
+                raw_bytes = json_bytes(data)
+                fileobj = io.BytesIO(raw_bytes)
+                member = copy.copy(member)
+                member.size = len(raw_bytes)
+            elif fileobj is not None and decompress and name.endswith(".tar.gz"):
+                self._add_decompressed(target, member, fileobj)
+                continue
+            target.addfile(member, fileobj)
+
+    def _add_decompressed(
+        self, target: tarfile.TarFile, member: tarfile.TarInfo, fileobj: IO[bytes]
+    ) -> None:
+        """Add a gzip compressed inner archive to the target uncompressed."""
+        # The size of the archive is needed for its header, so spool it. The
+        # decompressed size is not known up front, so check the free space
+        # while spooling.
+        with tempfile.TemporaryFile(dir=self._manifest_dir) as spool:
+            with gzip.GzipFile(fileobj=fileobj, mode="rb") as archive:
+                while data := archive.read(BUF_SIZE):
+                    self._check_free_space(self._manifest_dir)
+                    spool.write(data)
+            member = copy.copy(member)
+            member.name = member.name.removesuffix(".gz")
+            member.size = spool.tell()
+            spool.seek(0)
+            target.addfile(member, spool)
+
+    def read_manifests(self) -> dict[str, BackupManifest]:
+        """Read the manifests of all stored backups."""
+        manifests: dict[str, BackupManifest] = {}
+        for manifest_path in self._manifest_dir.glob("*.json"):
+            manifest = BackupManifest.from_dict(
+                json_loads_object(manifest_path.read_bytes())
+            )
+            manifests[manifest.backup.backup_id] = manifest
+        return manifests
+
+    def remove_backup(self, backup_id: str) -> None:
+        """Remove a backup and the chunks no other backup refers to."""
+        self._manifest_path(backup_id).unlink(missing_ok=True)
+        self.remove_unreferenced_chunks()
+
+    def remove_unreferenced_chunks(self) -> None:
+        """Remove the chunks no backup refers to.
+
+        Chunks of backups which were not completely stored are removed too.
+        """
+        referenced = {
+            chunk_id
+            for manifest in self.read_manifests().values()
+            for chunk_id in manifest.chunks
+        }
+        removed = 0
+        for chunk_path in self._chunk_dir.glob("*/*"):
+            if chunk_path.name not in referenced:
+                chunk_path.unlink(missing_ok=True)
+                removed += 1
+        _LOGGER.debug("Removed %s unreferenced chunks", removed)
@@ -1,10 +1,47 @@
 """Config flow for Home Assistant Backup integration."""
 
-from typing import Any
+from typing import Any, override
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+import voluptuous as vol
 
-from .const import DOMAIN
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.hassio import is_hassio
+
+from .const import CONF_DEDUPLICATED_BACKUPS, DOMAIN
+
+
+class BackupOptionsFlow(OptionsFlow):
+    """Handle Backup options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage Backup options."""
+        if is_hassio(self.hass):
+            return self.async_abort(reason="not_supported")
+
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_DEDUPLICATED_BACKUPS,
+                        default=self.config_entry.options.get(
+                            CONF_DEDUPLICATED_BACKUPS, False
+                        ),
+                    ): bool,
+                }
+            ),
+        )
 
 
 class BackupConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -17,3 +54,12 @@ class BackupConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Handle the initial step."""
         return self.async_create_entry(title="Backup", data={})
+
+    @staticmethod
+    @callback
+    @override
+    def async_get_options_flow(
+        config_entry: ConfigEntry,
+    ) -> BackupOptionsFlow:
+        """Get the options flow for this handler."""
+        return BackupOptionsFlow()
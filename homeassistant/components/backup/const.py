@@ -1,5 +1,6 @@
 """Constants for the Backup integration."""
 
+from collections.abc import Callable
 from logging import getLogger
 from typing import TYPE_CHECKING
 
@@ -9,8 +10,14 @@ if TYPE_CHECKING:
     from .manager import BackupManager
 
 BUF_SIZE = 2**20 * 4  # 4MB
+COMPRESS_BLOCK_SIZE = 2**20  # 1MB
+COMPRESS_LEVEL = 6
+MAX_COMPRESS_WORKERS = 4
 DOMAIN = "backup"
 DATA_MANAGER: HassKey[BackupManager] = HassKey(DOMAIN)
+DATA_BACKUP_AGENT_LISTENERS: HassKey[list[Callable[[], None]]] = HassKey(
+    f"{DOMAIN}.backup_agent_listeners"
+)
 LOGGER = getLogger(__package__)
 
 EXCLUDE_FROM_BACKUP = [
@@ -21,6 +28,8 @@ EXCLUDE_FROM_BACKUP = [
     "*.log.*",
     "*.log",
     "backups/*.tar",
+    "backups/deduplicated",
+    "backups/deduplicated/**",
     "tmp_backups/*.tar",
     "OZW_Log.txt",
     "tts/*",
@@ -33,3 +42,6 @@ EXCLUDE_DATABASE_FROM_BACKUP = [
 ]
 
 SECURETAR_CREATE_VERSION = 3
+
+CONF_DEDUPLICATED_BACKUPS = "deduplicated_backups"
+DEDUPLICATED_BACKUP_DIR = "backups/deduplicated"
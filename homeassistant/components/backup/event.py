@@ -8,7 +8,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .coordinator import BackupConfigEntry, BackupDataUpdateCoordinator
 from .entity import BackupManagerBaseEntity
-from .manager import CreateBackupEvent, CreateBackupState
+from .manager import CreateBackupEvent, CreateBackupProgressEvent, CreateBackupState
 
 ATTR_BACKUP_STAGE: Final[str] = "backup_stage"
 ATTR_FAILED_REASON: Final[str] = "failed_reason"
@@ -45,6 +45,8 @@ class AutomaticBackupEvent(BackupManagerBaseEntity, EventEntity):
             not (data := self.coordinator.data)
             or (event := data.last_event) is None
             or not isinstance(event, CreateBackupEvent)
+            # Progress does not change the state of the backup
+            or isinstance(event, CreateBackupProgressEvent)
         ):
             return
 
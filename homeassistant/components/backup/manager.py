@@ -4,12 +4,14 @@ import abc
 import asyncio
 from collections import defaultdict
 from collections.abc import AsyncIterator, Callable, Coroutine
-from dataclasses import dataclass, replace
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from enum import StrEnum
 import hashlib
 import io
 from itertools import chain
 import json
+import os
 from pathlib import Path, PurePath, PureWindowsPath
 import shutil
 import sys
@@ -18,7 +20,7 @@ import time
 from typing import IO, TYPE_CHECKING, Any, Protocol, TypedDict, cast, override
 
 import aiohttp
-from securetar import SecureTarArchive, atomic_contents_add
+from securetar import SecureTarArchive, SecureTarRootKeyContext, atomic_contents_add
 
 from homeassistant.backup_restore import RESTORE_BACKUP_FILE, RESTORE_BACKUP_RESULT_FILE
 from homeassistant.const import __version__ as HAVERSION
@@ -55,6 +57,7 @@ from .const import (
     EXCLUDE_DATABASE_FROM_BACKUP,
     EXCLUDE_FROM_BACKUP,
     LOGGER,
+    MAX_COMPRESS_WORKERS,
     SECURETAR_CREATE_VERSION,
 )
 from .models import (
@@ -79,6 +82,7 @@ from .util import (
 )
 
 UPLOAD_PROGRESS_DEBOUNCE_SECONDS = 1
+CREATE_PROGRESS_INTERVAL_SECONDS = 1
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -221,6 +225,16 @@ class CreateBackupEvent(ManagerStateEvent):
     state: CreateBackupState
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CreateBackupProgressEvent(CreateBackupEvent):
+    """Backup in progress, with the bytes processed in the current stage."""
+
+    reason: str | None = None
+    state: CreateBackupState = CreateBackupState.IN_PROGRESS
+    bytes_processed: int
+    bytes_per_second: float
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class ReceiveBackupEvent(ManagerStateEvent):
     """Backup receive."""
@@ -274,6 +288,27 @@ class BackupPlatformProtocol(Protocol):
         """Perform operations after a backup finishes."""
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class BackupFileSnapshots:
+    """Consistent copies of files to back up instead of the live files.
+
+    While a Core backup is created, this is set in current_backup_file_snapshots
+    so backup platforms can copy files which are written to during the backup in
+    async_pre_backup, instead of blocking writes until async_post_backup. The
+    copies are keyed by their path relative to the config directory, a None
+    value leaves the live file out of the backup.
+    """
+
+    database_included: bool
+    directory: Path
+    files: dict[str, Path | None] = field(default_factory=dict)
+
+
+current_backup_file_snapshots: ContextVar[BackupFileSnapshots | None] = ContextVar(
+    "current_backup_file_snapshots", default=None
+)
+
+
 class BackupReaderWriter(abc.ABC):
     """Abstract class for reading and writing backups."""
 
@@ -1443,7 +1478,7 @@ class BackupManager:
         """Forward event to subscribers."""
         if (current_state := self.state) != (new_state := event.manager_state):
             LOGGER.debug("Backup state: %s -> %s", current_state, new_state)
-        if not isinstance(event, UploadBackupEvent):
+        if not isinstance(event, (CreateBackupProgressEvent, UploadBackupEvent)):
             self.last_event = event
             if not isinstance(event, (BlockedEvent, IdleEvent)):
                 self.last_action_event = event
@@ -1797,6 +1832,14 @@ class CoreBackupReaderWriter(BackupReaderWriter):
             local_agent = manager.local_backup_agents[self._local_agent_id]
             local_agent_tar_file_path = local_agent.get_new_backup_path(backup)
 
+        file_snapshots = BackupFileSnapshots(
+            database_included=include_database,
+            directory=self.temp_backup_dir / f"{backup_id}_snapshots",
+        )
+        # The backup runs in its own task, so the snapshots are only offered to
+        # the pre and post backup actions of this backup
+        current_backup_file_snapshots.set(file_snapshots)
+
         on_progress(
             CreateBackupEvent(
                 reason=None,
@@ -1829,6 +1872,8 @@ class CoreBackupReaderWriter(BackupReaderWriter):
                 include_database,
                 password,
                 local_agent_tar_file_path,
+                file_snapshots,
+                on_progress,
             )
         except (BackupManagerError, OSError, tarfile.TarError, ValueError) as err:
             # BackupManagerError from async_pre_backup_actions
@@ -1875,6 +1920,10 @@ class CoreBackupReaderWriter(BackupReaderWriter):
             # If there's an unhandled exception, we keep it so we can rethrow it in case
             # the post backup actions also fail.
             unhandled_exc = sys.exception()
+            if file_snapshots.files:
+                await self._hass.async_add_executor_job(
+                    shutil.rmtree, file_snapshots.directory, True
+                )
             try:
                 try:
                     await manager.async_post_backup_actions()
@@ -1897,6 +1946,8 @@ class CoreBackupReaderWriter(BackupReaderWriter):
         database_included: bool,
         password: str | None,
         tar_file_path: Path | None,
+        file_snapshots: BackupFileSnapshots,
+        on_progress: Callable[[CreateBackupEvent], None],
     ) -> tuple[Path, int]:
         """Generate backup contents and return the size."""
         if not tar_file_path:
@@ -1912,6 +1963,16 @@ class CoreBackupReaderWriter(BackupReaderWriter):
         excludes = EXCLUDE_FROM_BACKUP
         if not database_included:
             excludes = excludes + EXCLUDE_DATABASE_FROM_BACKUP
+        if file_snapshots.files:
+            snapshot_dir = file_snapshots.directory.relative_to(
+                self._hass.config.path()
+            ).as_posix()
+            excludes = [
+                *excludes,
+                *file_snapshots.files,
+                snapshot_dir,
+                f"{snapshot_dir}/**",
+            ]
 
         def is_excluded_by_filter(path: PurePath) -> bool:
             """Filter to filter excludes."""
@@ -1926,12 +1987,27 @@ class CoreBackupReaderWriter(BackupReaderWriter):
 
             return False
 
+        def add_contents(core_tar: tarfile.TarFile) -> None:
+            """Add the config directory and the file snapshots."""
+            atomic_contents_add(
+                tar_file=core_tar,
+                origin_path=Path(self._hass.config.path()),
+                file_filter=is_excluded_by_filter,
+                arcname="data",
+            )
+            for name, snapshot_path in file_snapshots.files.items():
+                if snapshot_path is not None:
+                    core_tar.add(snapshot_path, arcname=f"data/{name}")
+
+        root_key_context = (
+            SecureTarRootKeyContext(password) if password is not None else None
+        )
         with SecureTarArchive(
             tar_file_path,
             "w",
             bufsize=BUF_SIZE,
             create_version=SECURETAR_CREATE_VERSION,
-            password=password,
+            root_key_context=root_key_context,
         ) as outer_secure_tarfile:
             raw_bytes = json_bytes(backup_data)
             fileobj = io.BytesIO(raw_bytes)
@@ -1939,16 +2015,9 @@ class CoreBackupReaderWriter(BackupReaderWriter):
             tar_info.size = len(raw_bytes)
             tar_info.mtime = int(time.time())
             outer_secure_tarfile.tar.addfile(tar_info, fileobj=fileobj)
-            with outer_secure_tarfile.create_tar(
-                "./homeassistant.tar.gz",
-                gzip=True,
-            ) as core_tar:
-                atomic_contents_add(
-                    tar_file=core_tar,
-                    origin_path=Path(self._hass.config.path()),
-                    file_filter=is_excluded_by_filter,
-                    arcname="data",
-                )
+            self._add_core_tar(
+                outer_secure_tarfile.tar, root_key_context, add_contents, on_progress
+            )
         try:
             stat_result = tar_file_path.stat()
         except OSError as err:
@@ -1958,6 +2027,55 @@ class CoreBackupReaderWriter(BackupReaderWriter):
             ) from err
         return (tar_file_path, stat_result.st_size)
 
+    def _add_core_tar(
+        self,
+        outer_tar: tarfile.TarFile,
+        root_key_context: SecureTarRootKeyContext | None,
+        add_contents: Callable[[tarfile.TarFile], None],
+        on_progress: Callable[[CreateBackupEvent], None],
+    ) -> None:
+        """Add the core tar to the backup, compressing it in worker threads.
+
+        Reading the files, compressing blocks in the worker threads and
+        encrypting and writing the compressed blocks to the backup overlap.
+        """
+        workers = min(os.cpu_count() or 1, MAX_COMPRESS_WORKERS)
+        start_time = last_report_time = time.monotonic()
+
+        def report_progress(bytes_processed: int) -> None:
+            """Report the uncompressed bytes processed and the throughput."""
+            nonlocal last_report_time
+            now = time.monotonic()
+            if now - last_report_time < CREATE_PROGRESS_INTERVAL_SECONDS:
+                return
+            last_report_time = now
+            self._hass.loop.call_soon_threadsafe(
+                on_progress,
+                CreateBackupProgressEvent(
+                    stage=CreateBackupStage.HOME_ASSISTANT,
+                    bytes_processed=bytes_processed,
+                    bytes_per_second=bytes_processed / (now - start_time),
+                ),
+            )
+
+        # Tar streams copy their whole buffer on each write, so keep the
+        # default buffer size as most writes are small headers
+        with (
+            backup_util.open_inner_tar_stream(
+                outer_tar, "./homeassistant.tar.gz", root_key_context
+            ) as core_tar_file,
+            backup_util.ParallelGzipWriter(
+                core_tar_file, workers=workers, on_progress=report_progress
+            ) as gzip_writer,
+            tarfile.open(fileobj=cast(IO[bytes], gzip_writer), mode="w|") as core_tar,
+        ):
+            add_contents(core_tar)
+        LOGGER.debug(
+            "Compressed core tar with %s workers in %.2fs",
+            workers,
+            time.monotonic() - start_time,
+        )
+
     @override
     async def async_receive_backup(
         self,
@@ -1,16 +1,23 @@
 """Local backup support for Core and Container installations."""
 
 import asyncio
-from collections.abc import AsyncIterator, Callable, Coroutine
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Coroutine, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 import copy
 from dataclasses import dataclass, replace
 from io import BytesIO
 import json
 from pathlib import Path, PurePath, PureWindowsPath
 from queue import SimpleQueue
+import struct
 import tarfile
 import threading
-from typing import IO, Any, cast
+import time
+from types import TracebackType
+from typing import IO, Any, Self, cast
+import zlib
 
 import aiohttp
 from securetar import (
@@ -18,6 +25,7 @@ from securetar import (
     SecureTarArchive,
     SecureTarError,
     SecureTarFile,
+    SecureTarHeader,
     SecureTarReadError,
     SecureTarRootKeyContext,
     get_archive_max_ciphertext_size,
@@ -33,7 +41,13 @@ from homeassistant.util.async_iterator import (
 )
 from homeassistant.util.json import JsonObjectType, json_loads_object
 
-from .const import BUF_SIZE, LOGGER, SECURETAR_CREATE_VERSION
+from .const import (
+    BUF_SIZE,
+    COMPRESS_BLOCK_SIZE,
+    COMPRESS_LEVEL,
+    LOGGER,
+    SECURETAR_CREATE_VERSION,
+)
 from .models import AddonInfo, AgentBackup, Folder, InvalidBackupFilename
 
 
@@ -72,6 +86,190 @@ def make_backup_dir(path: Path) -> None:
     path.mkdir(exist_ok=True)
 
 
+_DEFLATE_WINDOW_SIZE = 2**15
+
+
+def _deflate_block(block: bytes, dictionary: bytes, last: bool, level: int) -> bytes:
+    """Compress a block to raw deflate data which can be concatenated."""
+    if dictionary:
+        compressor = zlib.compressobj(
+            level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary
+        )
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(block) + compressor.flush(
+        zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    )
+
+
+class ParallelGzipWriter:
+    """Write a gzip stream, compressing blocks in worker threads.
+
+    The output is a single gzip member, like pigz writes it: each block is
+    compressed to raw deflate data primed with the tail of the previous block
+    and ended with a sync flush, so the blocks can be compressed independently
+    and concatenated in order. zlib releases the GIL while compressing.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        *,
+        workers: int,
+        block_size: int = COMPRESS_BLOCK_SIZE,
+        level: int = COMPRESS_LEVEL,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> None:
+        """Initialize the writer.
+
+        on_progress is called with the number of uncompressed bytes written to
+        the output after each block.
+        """
+        self._fileobj = fileobj
+        self._on_progress = on_progress
+        self._block_size = block_size
+        self._level = level
+        self._buffer = bytearray()
+        self._closed = False
+        self._crc = 0
+        self._dictionary = b""
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="backup_compress"
+        )
+        self._max_pending = workers * 2
+        self._pending: deque[tuple[bytes, Future[bytes]]] = deque()
+        self._size = 0
+        # Gzip header without file name, the mtime is informational only
+        fileobj.write(
+            b"\x1f\x8b\x08\x00" + struct.pack("<L", int(time.time())) + b"\x00\xff"
+        )
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Finish the stream, or abort it if there was an error."""
+        if exc_type is None:
+            self.close()
+            return
+        self._closed = True
+        self._executor.shutdown(cancel_futures=True)
+
+    def write(self, data: bytes) -> int:
+        """Write data to the stream."""
+        if self._closed:
+            raise ValueError("write to closed file")
+        buffer = self._buffer
+        buffer += data
+        block_size = self._block_size
+        while len(buffer) >= block_size:
+            self._submit(bytes(buffer[:block_size]), last=False)
+            del buffer[:block_size]
+        return len(data)
+
+    def close(self) -> None:
+        """Compress the remaining data and write the gzip trailer."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(bytes(self._buffer), last=True)
+            self._buffer.clear()
+            while self._pending:
+                self._write_next()
+            self._fileobj.write(struct.pack("<LL", self._crc, self._size & 0xFFFFFFFF))
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+
+    def _submit(self, block: bytes, last: bool) -> None:
+        """Queue a block for compression, waiting if too many are pending."""
+        self._pending.append(
+            (
+                block,
+                self._executor.submit(
+                    _deflate_block, block, self._dictionary, last, self._level
+                ),
+            )
+        )
+        self._dictionary = block[-_DEFLATE_WINDOW_SIZE:]
+        while len(self._pending) > self._max_pending:
+            self._write_next()
+
+    def _write_next(self) -> None:
+        """Write the oldest compressed block to the output."""
+        block, future = self._pending.popleft()
+        self._crc = zlib.crc32(block, self._crc)
+        self._size += len(block)
+        self._fileobj.write(future.result())
+        if self._on_progress is not None:
+            self._on_progress(self._size)
+
+
+@contextmanager
+def open_inner_tar_stream(
+    outer_tar: tarfile.TarFile,
+    name: str,
+    root_key_context: SecureTarRootKeyContext | None,
+) -> Generator[IO[bytes]]:
+    """Open a stream writing a member of unknown size to a tar file on disk.
+
+    The data is encrypted if a root key context is given. Like
+    SecureTarArchive.create_tar does, the header is written first and
+    rewritten with the size when the stream is closed, so the data is written
+    as it comes and not spooled.
+    """
+    fileobj = cast(IO[bytes], outer_tar.fileobj)
+    tar_info = tarfile.TarInfo(name=name)
+    tar_info.mtime = int(time.time())
+    # A fixed width pax size keeps the length of the header the same when it
+    # is rewritten, also for members too large for the ustar size field
+    tar_info.pax_headers = {"size": f"{0:020d}"}
+    header_position = fileobj.tell()
+    header = tar_info.tobuf(outer_tar.format, outer_tar.encoding, outer_tar.errors)
+    fileobj.write(header)
+
+    if root_key_context is None:
+        yield fileobj
+    else:
+        key_material = root_key_context.derive_key_material(
+            None, SECURETAR_CREATE_VERSION
+        )
+        secure_header = SecureTarHeader(
+            key_material.cipher_initialization, 0, SECURETAR_CREATE_VERSION
+        )
+        fileobj.write(secure_header.to_bytes())
+        encrypt_writer = root_key_context.stream_factory.create_encrypt_writer(
+            fileobj, key_material
+        )
+        yield cast(IO[bytes], encrypt_writer)
+        encrypt_writer.close()
+        secure_header.plaintext_size = encrypt_writer.plaintext_size
+
+    end_position = fileobj.tell()
+    size = end_position - header_position - len(header)
+    padding = -size % tarfile.BLOCKSIZE
+    fileobj.write(tarfile.NUL * padding)
+    if root_key_context is not None:
+        fileobj.seek(header_position + len(header))
+        fileobj.write(secure_header.to_bytes())
+
+    tar_info.size = size
+    tar_info.pax_headers = {"size": f"{size:020d}"}
+    fileobj.seek(header_position)
+    fileobj.write(
+        tar_info.tobuf(outer_tar.format, outer_tar.encoding, outer_tar.errors)
+    )
+    fileobj.seek(end_position + padding)
+    outer_tar.offset += len(header) + size + padding
+    outer_tar.members.append(tar_info)  # type: ignore[attr-defined]
+
+
 def read_backup(backup_path: Path) -> AgentBackup:
     """Read a backup from disk."""
 
@@ -2,15 +2,13 @@
 
 from collections import defaultdict
 from dataclasses import dataclass
-from fnmatch import translate
-from functools import lru_cache
-import re
 from typing import TYPE_CHECKING, Final, TypedDict
 
 from lru import LRU
 
 from homeassistant.core import callback
 from homeassistant.loader import BluetoothMatcher, BluetoothMatcherOptional
+from homeassistant.util.fnmatch_index import memorized_fnmatch
 
 from .models import BluetoothCallback, BluetoothServiceInfoBleak
 
@@ -427,31 +425,10 @@ def ble_device_matches(
             ):
                 return False
 
-    if (local_name := matcher.get(LOCAL_NAME)) and not _memorized_fnmatch(
+    if (local_name := matcher.get(LOCAL_NAME)) and not memorized_fnmatch(
         service_info.name,
         local_name,
     ):
         return False
 
     return True
-
-
-@lru_cache(maxsize=4096, typed=True)
-def _compile_fnmatch(pattern: str) -> re.Pattern:
-    """Compile a fnmatch pattern."""
-    return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    Bluetooth has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently.
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
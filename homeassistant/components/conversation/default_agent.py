@@ -5,12 +5,24 @@ from collections import OrderedDict
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from enum import Enum, auto
+from importlib.metadata import version
 import logging
 from pathlib import Path
 import time
 from typing import IO, Any, cast, override
 
-from hassil.expression import Expression, Group, ListReference, TextChunk
+from hassil.expression import (
+    INLINE_RANGE_PATTERN,
+    Alternative,
+    Expression,
+    Group,
+    ListReference,
+    Permutation,
+    RuleReference,
+    Sentence,
+    Sequence,
+    TextChunk,
+)
 from hassil.intents import (
     Intents,
     SlotList,
@@ -40,7 +52,7 @@ from homeassistant.components.homeassistant.exposed_entities import (
     async_listen_entity_updates,
     async_should_expose,
 )
-from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
+from homeassistant.const import ATTR_FRIENDLY_NAME, EVENT_STATE_CHANGED, MATCH_ALL
 from homeassistant.core import (
     Event,
     EventStateChangedData,
@@ -62,6 +74,7 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_track_state_added_domain
+from homeassistant.helpers.storage import Store
 from homeassistant.util import language as language_util
 from homeassistant.util.json import JsonObjectType, json_loads_object
 
@@ -83,9 +96,18 @@ _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_ERROR_TEXT = "Sorry, I couldn't understand that"
 _ENTITY_REGISTRY_UPDATE_FIELDS = ["aliases", "name", "original_name"]
+_DEVICE_REGISTRY_UPDATE_FIELDS = ["name", "name_by_user"]
 
 _DEFAULT_EXPOSED_ATTRIBUTES = {"device_class"}
 
+# Parsed sentence templates are stored per language
+_INTENTS_CACHE_STORAGE_KEY = f"{DOMAIN}.intents_cache.{{}}"
+_INTENTS_CACHE_STORAGE_VERSION = 1
+_INTENTS_CACHE_SAVE_DELAY = 10
+
+# State attributes which the names of an entity depend on
+_ENTITY_NAME_ATTRIBUTES = (ATTR_FRIENDLY_NAME, *_DEFAULT_EXPOSED_ATTRIBUTES)
+
 
 ERROR_SENTINEL = object()
 
@@ -223,6 +245,9 @@ class DefaultAgent(ConversationEntity):
         self._lang_intents: dict[str, LanguageIntents | object] = {}
         self._load_intents_lock = asyncio.Lock()
 
+        # Parsed sentence templates by language, stored across restarts
+        self._intents_cache_stores: dict[str, Store[dict[str, Any]]] = {}
+
         # Intents from common conversation config
         self._config_intents_config: IntentSourceConfig = {}
 
@@ -237,6 +262,13 @@ class DefaultAgent(ConversationEntity):
         self._slot_lists: dict[str, SlotList] | None = None
         self._unsub_clear_slot_list: list[Callable[[], None]] | None = None
 
+        # Exposed flag and name tuples by entity id, updated per entity
+        # so slot lists can be rebuilt without recomputing every name
+        self._entity_names: (
+            dict[str, tuple[bool, list[tuple[str, str, dict[str, Any]]]]] | None
+        ) = None
+        self._unsub_entity_names: list[Callable[[], None]] | None = None
+
         # Used to filter slot lists before intent matching
         self._exposed_names_trie: Trie | None = None
         self._unexposed_names_trie: Trie | None = None
@@ -257,6 +289,11 @@ class DefaultAgent(ConversationEntity):
         if self._unsub_intents is not None:
             self._unsub_intents()
             self._unsub_intents = None
+        if self._unsub_entity_names is not None:
+            for unsub in self._unsub_entity_names:
+                unsub()
+            self._unsub_entity_names = None
+            self._entity_names = None
 
     @callback
     def _update_intents(
@@ -288,10 +325,28 @@ class DefaultAgent(ConversationEntity):
             field in event_data["changes"] for field in _ENTITY_REGISTRY_UPDATE_FIELDS
         )
 
+    @callback
+    def _filter_device_registry_changes(
+        self, event_data: dr.EventDeviceRegistryUpdatedData
+    ) -> bool:
+        """Filter device registry changed events."""
+        return event_data["action"] == "update" and any(
+            field in event_data["changes"] for field in _DEVICE_REGISTRY_UPDATE_FIELDS
+        )
+
     @callback
     def _filter_state_changes(self, event_data: EventStateChangedData) -> bool:
-        """Filter state changed events."""
-        return not event_data["old_state"] or not event_data["new_state"]
+        """Filter state changed events which add or remove an entity or its names."""
+        if (old_state := event_data["old_state"]) is None or (
+            new_state := event_data["new_state"]
+        ) is None:
+            return True
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        return old_attributes is not new_attributes and any(
+            old_attributes.get(attr) != new_attributes.get(attr)
+            for attr in _ENTITY_NAME_ATTRIBUTES
+        )
 
     @callback
     def _listen_clear_slot_list(self) -> None:
@@ -875,33 +930,101 @@ class DefaultAgent(ConversationEntity):
         self, exposed: bool
     ) -> Iterable[tuple[str, str, dict[str, Any]]]:
         """Yield (input name, output name, context) tuples for entities."""
-        entity_registry = er.async_get(self.hass)
+        for entity_exposed, name_tuples in self._async_get_entity_names().values():
+            if entity_exposed is exposed:
+                yield from name_tuples
 
-        for state in self.hass.states.async_all():
-            entity_exposed = async_should_expose(self.hass, DOMAIN, state.entity_id)
-            if exposed and (not entity_exposed):
-                # Required exposed, entity is not
-                continue
+    @callback
+    def _async_get_entity_names(
+        self,
+    ) -> dict[str, tuple[bool, list[tuple[str, str, dict[str, Any]]]]]:
+        """Return the exposed flag and name tuples of all entities."""
+        if self._entity_names is not None:
+            return self._entity_names
 
-            if (not exposed) and entity_exposed:
-                # Required not exposed, entity is
-                continue
+        entity_registry = er.async_get(self.hass)
+        self._entity_names = {
+            state.entity_id: self._make_entity_names(entity_registry, state)
+            for state in self.hass.states.async_all()
+        }
+        if self._unsub_entity_names is not None:
+            return self._entity_names
 
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in _DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
+        # Listeners are kept until the agent is removed
+        self._unsub_entity_names = [
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_update_entity_names,
+                event_filter=self._filter_entity_registry_changes,
+            ),
+            self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_update_entity_names,
+                event_filter=self._filter_state_changes,
+            ),
+            # Entity names can include the name of their device
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                self._async_clear_entity_names,
+                event_filter=self._filter_device_registry_changes,
+            ),
+            async_listen_entity_updates(
+                self.hass, DOMAIN, self._async_clear_entity_names
+            ),
+        ]
+        return self._entity_names
+
+    def _make_entity_names(
+        self, entity_registry: er.EntityRegistry, state: State
+    ) -> tuple[bool, list[tuple[str, str, dict[str, Any]]]]:
+        """Return the exposed flag and name tuples of an entity."""
+        entity_exposed = async_should_expose(self.hass, DOMAIN, state.entity_id)
+
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in _DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
 
-            entity_entry = entity_registry.async_get(state.entity_id)
-            for name in intent.async_get_entity_aliases(
-                self.hass, entity_entry, state=state
-            ):
+        entity_entry = entity_registry.async_get(state.entity_id)
+        return (
+            entity_exposed,
+            [
                 # Strip punctuation so aliases match the cleaned input text.
-                yield (remove_punctuation(name).strip(), name, context)
+                (remove_punctuation(name).strip(), name, context)
+                for name in intent.async_get_entity_aliases(
+                    self.hass, entity_entry, state=state
+                )
+            ],
+        )
+
+    @callback
+    def _async_update_entity_names(
+        self,
+        event: Event[EventStateChangedData] | Event[er.EventEntityRegistryUpdatedData],
+    ) -> None:
+        """Update the names of a single added, removed or renamed entity."""
+        if self._entity_names is None:
+            return
+        entity_id = event.data["entity_id"]
+        if (state := self.hass.states.get(entity_id)) is None:
+            self._entity_names.pop(entity_id, None)
+            return
+        self._entity_names[entity_id] = self._make_entity_names(
+            er.async_get(self.hass), state
+        )
+
+    @callback
+    def _async_clear_entity_names(self, event: Event[Any] | None = None) -> None:
+        """Clear the names of all entities.
+
+        Used when the exposed entities or device names change.
+        """
+        self._entity_names = None
+        self._async_clear_slot_list()
 
     def _recognize_strict(
         self,
@@ -1022,9 +1145,21 @@ class DefaultAgent(ConversationEntity):
 
             start = time.monotonic()
 
-            result = await self.hass.async_add_executor_job(
-                self._load_intents, language
+            if (store := self._intents_cache_stores.get(language)) is None:
+                store = self._intents_cache_stores[language] = Store(
+                    self.hass,
+                    _INTENTS_CACHE_STORAGE_VERSION,
+                    _INTENTS_CACHE_STORAGE_KEY.format(language),
+                )
+            intents_cache = await store.async_load()
+
+            result, new_intents_cache = await self.hass.async_add_executor_job(
+                self._load_intents_with_cache, language, intents_cache
             )
+            if new_intents_cache is not None:
+                store.async_delay_save(
+                    lambda: new_intents_cache, _INTENTS_CACHE_SAVE_DELAY
+                )
 
             if result is None:
                 self._lang_intents[language] = ERROR_SENTINEL
@@ -1039,6 +1174,54 @@ class DefaultAgent(ConversationEntity):
 
             return result
 
+    def _load_intents_with_cache(
+        self, language: str, intents_cache: dict[str, Any] | None
+    ) -> tuple[LanguageIntents | None, dict[str, Any] | None]:
+        """Load all intents for language with cached sentences (run inside executor).
+
+        The parsed sentence templates are restored from the cache if the
+        intent files have not changed. Otherwise all sentence templates are
+        parsed and the new cache is returned to be stored.
+        """
+        # The key is taken before loading, so changes while loading
+        # invalidate the cache next time
+        cache_key = self._get_intents_cache_key(language)
+        if (lang_intents := self._load_intents(language)) is None:
+            return None, None
+
+        if (
+            intents_cache is not None
+            and intents_cache["key"] == cache_key
+            and _restore_sentences(lang_intents.intents, intents_cache["sentences"])
+        ):
+            _LOGGER.debug("Restored parsed sentences for language=%s", language)
+            return lang_intents, None
+
+        return lang_intents, {
+            "key": cache_key,
+            "sentences": _dump_sentences(lang_intents.intents),
+        }
+
+    def _get_intents_cache_key(self, language: str) -> dict[str, Any]:
+        """Return what the intents of a language are loaded from."""
+        custom_sentences: dict[str, int] = {}
+        if lang_matches := language_util.matches(language, set(get_languages())):
+            custom_sentences_dir = Path(
+                self.hass.config.path("custom_sentences", lang_matches[0])
+            )
+            if custom_sentences_dir.is_dir():
+                custom_sentences = {
+                    str(custom_sentences_path): custom_sentences_path.stat().st_mtime_ns
+                    for custom_sentences_path in custom_sentences_dir.rglob("*.yaml")
+                }
+        return {
+            "language": language,
+            "hassil": version("hassil"),
+            "home_assistant_intents": version("home-assistant-intents"),
+            "custom_sentences": custom_sentences,
+            "config_intents": self._config_intents_config,
+        }
+
     def _load_intents(self, language: str) -> LanguageIntents | None:
         """Load all intents for language (run inside executor)."""
         intents_dict: dict[str, Any] = {}
@@ -1663,6 +1846,120 @@ def _get_match_error_response(
     return ErrorKey.NO_INTENT, {}
 
 
+def _dump_sentences(intents: Intents) -> dict[str, list[list[list[Any]]]]:
+    """Return the parsed sentence templates of intents in a JSON format."""
+    return {
+        intent_name: [
+            [
+                [sentence.text, _dump_expression(sentence.expression)]
+                for sentence in intent_data.sentences
+            ]
+            for intent_data in lang_intent.data
+        ]
+        for intent_name, lang_intent in intents.intents.items()
+    }
+
+
+def _restore_sentences(
+    intents: Intents, sentences: dict[str, list[list[list[Any]]]]
+) -> bool:
+    """Restore the parsed sentence templates of intents.
+
+    Returns False if the sentences do not match the intents.
+    """
+    if sentences.keys() != intents.intents.keys():
+        return False
+    for intent_name, lang_intent in intents.intents.items():
+        intent_sentences = sentences[intent_name]
+        if len(intent_sentences) != len(lang_intent.data) or any(
+            len(data_sentences) != len(intent_data.sentence_texts)
+            for intent_data, data_sentences in zip(
+                lang_intent.data, intent_sentences, strict=True
+            )
+        ):
+            return False
+
+    for intent_name, lang_intent in intents.intents.items():
+        for intent_data, data_sentences in zip(
+            lang_intent.data, sentences[intent_name], strict=True
+        ):
+            # Sentences are a cached property of the frozen intent data
+            intent_data.__dict__["sentences"] = [
+                Sentence(expression=_load_expression(expression), text=text)
+                for text, expression in data_sentences
+            ]
+    return True
+
+
+def _dump_expression(expression: Expression) -> Any:
+    """Return a sentence template expression in a JSON format."""
+    if isinstance(expression, TextChunk):
+        if expression.text == expression.original_text:
+            return expression.text
+        return ["t", expression.text, expression.original_text]
+    if isinstance(expression, Sequence):
+        return ["s", [_dump_expression(item) for item in expression.items]]
+    if isinstance(expression, Alternative):
+        return [
+            "a",
+            [_dump_expression(item) for item in expression.items],
+            expression.is_optional,
+        ]
+    if isinstance(expression, Permutation):
+        return ["p", [_dump_expression(item) for item in expression.items]]
+    if isinstance(expression, RuleReference):
+        # <rule>
+        return ["r", expression.rule_name]
+    if isinstance(expression, ListReference):
+        # {list}
+        if (
+            expression.is_inline_range
+            or INLINE_RANGE_PATTERN.match(expression.list_name) is None
+        ):
+            capture = "@" if expression.is_capture else ""
+            list_name = f"{expression.list_name}:{capture}{expression.slot_name}"
+        elif expression.is_capture:
+            list_name = f"@{expression.list_name}"
+        else:
+            # Without a slot name, the list name is not parsed as a range
+            list_name = expression.list_name
+        return [
+            "l",
+            list_name,
+            expression.prefix,
+            expression.suffix,
+            expression.is_end_of_word,
+        ]
+    raise TypeError(f"Unexpected expression: {expression}")
+
+
+def _load_expression(data: Any) -> Expression:
+    """Return a sentence template expression from a JSON format."""
+    if isinstance(data, str):
+        return TextChunk(text=data, original_text=data)
+    match data[0]:
+        case "t":
+            return TextChunk(text=data[1], original_text=data[2])
+        case "s":
+            return Sequence(items=[_load_expression(item) for item in data[1]])
+        case "a":
+            return Alternative(
+                items=[_load_expression(item) for item in data[1]],
+                is_optional=data[2],
+            )
+        case "p":
+            return Permutation(items=[_load_expression(item) for item in data[1]])
+        case "r":
+            return RuleReference(rule_name=data[1])
+        case _:
+            return ListReference(
+                list_name=data[1],
+                prefix=data[2],
+                suffix=data[3],
+                is_end_of_word=data[4],
+            )
+
+
 def _collect_list_references(expression: Expression, list_names: set[str]) -> None:
     """Collect list reference names recursively."""
     if isinstance(expression, Group):
@@ -3,12 +3,8 @@
 import asyncio
 from collections.abc import Callable
 from datetime import timedelta
-from fnmatch import translate
-from functools import lru_cache
 from ipaddress import IPv4Address
-import itertools
 import logging
-import re
 from typing import Any, Final, override
 
 import aiodhcpwatcher
@@ -58,6 +54,7 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo as _DhcpServiceInfo
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import DHCPMatcher, async_get_dhcp
+from homeassistant.util.fnmatch_index import FnmatchIndex, memorized_fnmatch
 
 from . import websocket_api
 from .const import DOMAIN, HOSTNAME, IP_ADDRESS, MAC_ADDRESS
@@ -85,11 +82,11 @@ def async_index_integration_matchers(
     We have three types of matchers:
 
     1. Registered devices
-    2. Devices with no OUI - index by first char of lower() hostname
+    2. Devices with no OUI - index by hostname pattern
     3. Devices with OUI - index by OUI
     """
     registered_devices_domains: set[str] = set()
-    no_oui_matchers: dict[str, list[DHCPMatcher]] = {}
+    no_oui_matchers: FnmatchIndex[DHCPMatcher] = FnmatchIndex()
     oui_matchers: dict[str, list[DHCPMatcher]] = {}
     for matcher in integration_matchers:
         domain = matcher["domain"]
@@ -102,8 +99,7 @@ def async_index_integration_matchers(
             continue
 
         if hostname := matcher.get(HOSTNAME):
-            first_char = hostname[0].lower()
-            no_oui_matchers.setdefault(first_char, []).append(matcher)
+            no_oui_matchers.add(hostname, matcher)
 
     return DhcpMatchers(
         registered_devices_domains=registered_devices_domains,
@@ -242,24 +238,20 @@ class WatcherBase:
                 ) and entry.domain in registered_devices_domains:
                     matched_domains.add(entry.domain)
 
-        oui = uppercase_mac[:6]
-        lowercase_hostname_first_char = (
-            lowercase_hostname[0] if len(lowercase_hostname) else ""
-        )
-        for matcher in itertools.chain(
-            matchers.no_oui_matchers.get(lowercase_hostname_first_char, ()),
-            matchers.oui_matchers.get(oui, ()),
-        ):
-            domain = matcher["domain"]
+        for matcher in matchers.no_oui_matchers.match(lowercase_hostname):
+            _LOGGER.debug("Matched %s against %s", data, matcher)
+            matched_domains.add(matcher["domain"])
+
+        for matcher in matchers.oui_matchers.get(uppercase_mac[:6], ()):
             if (
                 matcher_hostname := matcher.get(HOSTNAME)
-            ) is not None and not _memorized_fnmatch(
+            ) is not None and not memorized_fnmatch(
                 lowercase_hostname, matcher_hostname
             ):
                 continue
 
             _LOGGER.debug("Matched %s against %s", data, matcher)
-            matched_domains.add(domain)
+            matched_domains.add(matcher["domain"])
 
         if self._callbacks:
             address_data = {mac_address: data}
@@ -473,24 +465,3 @@ class RediscoveryWatcher(WatcherBase):
             config_entries.signal_discovered_config_entry_removed(DOMAIN),
             self._handle_config_entry_removed,
         )
-
-
-@lru_cache(maxsize=4096, typed=True)
-def _compile_fnmatch(pattern: str) -> re.Pattern:
-    """Compile a fnmatch pattern."""
-    return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    DHCP has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
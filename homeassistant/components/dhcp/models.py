@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import TypedDict
 
 from homeassistant.loader import DHCPMatcher
+from homeassistant.util.fnmatch_index import FnmatchIndex
 from homeassistant.util.hass_dict import HassKey
 
 from .const import DOMAIN
@@ -16,7 +17,7 @@ class DhcpMatchers:
     """Prepared info from dhcp entries."""
 
     registered_devices_domains: set[str]
-    no_oui_matchers: dict[str, list[DHCPMatcher]]
+    no_oui_matchers: FnmatchIndex[DHCPMatcher]
     oui_matchers: dict[str, list[DHCPMatcher]]
 
 
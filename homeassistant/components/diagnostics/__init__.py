@@ -20,10 +20,12 @@ from homeassistant.helpers import (
     issue_registry as ir,
 )
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.entity_platform import async_get_add_entities_times
 from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
     find_paths_unserializable_data,
 )
+from homeassistant.helpers.service import async_get_entity_service_call_stats
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import (
@@ -216,6 +218,8 @@ async def _async_get_json_file_response(
         "custom_components": custom_components,
         "integration_manifest": async_format_manifest(integration.manifest),
         "setup_times": async_get_domain_setup_times(hass, domain),
+        "add_entities_times": async_get_add_entities_times(hass, domain),
+        "entity_service_calls": async_get_entity_service_call_stats(hass, d_id),
         "data": data,
     }
     if data_issues is not None:
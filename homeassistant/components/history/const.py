@@ -5,3 +5,6 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The number of entities to fetch and send per history stream message
+MAX_HISTORY_STREAM_CHUNK_ENTITIES = 25
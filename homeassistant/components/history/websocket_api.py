@@ -37,8 +37,13 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.collection import chunked_or_all
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    MAX_HISTORY_STREAM_CHUNK_ENTITIES,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,6 +77,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
@@ -88,6 +94,7 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                max_points,
             ),
         )
     )
@@ -103,6 +110,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
@@ -179,6 +187,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -232,7 +241,6 @@ def _generate_historical_response(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
-    send_empty: bool,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
     states = cast(
@@ -260,15 +268,9 @@ def _generate_historical_response(
             last_time_ts = cast(float, state_last_time)
 
     if last_time_ts == 0:
-        # If we did not send any states ever, we need to send an empty response
-        # so the websocket client knows it should render/process/consume the
-        # data.
-        if not send_empty:
-            return last_time_ts, None, None
-        last_time_dt = end_time
-    else:
-        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
+        return last_time_ts, None, None
 
+    last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
     return (
         last_time_ts,
         last_time_dt,
@@ -289,24 +291,49 @@ async def _async_send_historical_states(
     no_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    The entities are fetched and sent in chunks so the states for all
+    entities never have to be held in memory at the same time.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
+    entity_id_chunks: Iterable[list[str] | None] = (
+        chunked_or_all(entity_ids, MAX_HISTORY_STREAM_CHUNK_ENTITIES)
+        if entity_ids
+        else (entity_ids,)
     )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    newest_time_ts = 0.0
+    newest_time_dt: dt | None = None
+    for entity_ids_chunk in entity_id_chunks:
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending historical states
+            return None
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids_chunk,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        if payload:
+            connection.send_message(payload)
+        if last_time_ts > newest_time_ts:
+            newest_time_ts = last_time_ts
+            newest_time_dt = last_time_dt
+
+    if newest_time_ts == 0 and send_empty:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        connection.send_message(
+            _generate_websocket_response(msg_id, start_time, end_time, {})
+        )
+    return newest_time_dt
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -1,19 +1,36 @@
 """Manage the history_stats data."""
 
+import asyncio
+from bisect import bisect_right
 from dataclasses import dataclass
 import datetime
 import logging
 import math
+from operator import attrgetter
 
 from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.template import Template
 from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
+from .const import DOMAIN
 from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+DATA_HISTORY_INDEXES: HassKey[dict[str, HistoryIndex]] = HassKey(
+    f"{DOMAIN}_history_indexes"
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -34,6 +51,168 @@ class HistoryState:
     last_changed: float
 
 
+_LAST_CHANGED = attrgetter("last_changed")
+
+
+class HistoryIndex:
+    """History of the state changes of an entity, shared by its history stats.
+
+    The history is loaded from the recorder once, extended from the recorder
+    when a period starts before it or when it was not kept up to date, and
+    kept up to date from state changed events while history stats are
+    subscribed to it.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the history index."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self._history: list[HistoryState] = []
+        # The history is complete from _start until _end, _start is None
+        # until the history is loaded and _end is infinite when the
+        # history is kept up to date from state changed events
+        self._start: float | None = None
+        self._end = 0.0
+        self._lock = asyncio.Lock()
+        self._live_since: float | None = None
+        self._unsubscribe_events: CALLBACK_TYPE | None = None
+        # The period start of each subscriber, history before the earliest
+        # one is pruned
+        self._subscribers: dict[HistoryStats, float | None] = {}
+
+    @callback
+    def async_subscribe(self, history_stats: HistoryStats) -> CALLBACK_TYPE:
+        """Subscribe to the history and keep it up to date."""
+
+        @callback
+        def unsubscribe() -> None:
+            """Unsubscribe from the history."""
+            del self._subscribers[history_stats]
+            if self._subscribers:
+                return
+            assert self._unsubscribe_events is not None
+            self._unsubscribe_events()
+            self._unsubscribe_events = None
+            indexes = self.hass.data[DATA_HISTORY_INDEXES]
+            if indexes.get(self.entity_id) is self:
+                del indexes[self.entity_id]
+
+        if not self._subscribers:
+            self._live_since = floored_timestamp(dt_util.utcnow())
+            self._unsubscribe_events = async_track_state_change_event(
+                self.hass, [self.entity_id], self._async_state_changed
+            )
+        self._subscribers[history_stats] = None
+        return unsubscribe
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change to the history."""
+        self.async_add_state(event.data["new_state"])
+
+    @callback
+    def async_add_state(self, new_state: State | None) -> None:
+        """Add a new state of the entity, unless the history already has it."""
+        if new_state is None:
+            return
+        last_changed = new_state.last_changed_timestamp
+        if self._history and last_changed <= self._history[-1].last_changed:
+            return
+        self._history.append(HistoryState(new_state.state, last_changed))
+
+    async def async_history(
+        self, start_timestamp: float, now_timestamp: float
+    ) -> list[HistoryState]:
+        """Return the history from the state at the start until now."""
+        if (
+            self._start is None
+            or start_timestamp < self._start
+            or now_timestamp > self._end
+        ):
+            async with self._lock:
+                await self._async_load_missing(start_timestamp, now_timestamp)
+        first = bisect_right(self._history, start_timestamp, key=_LAST_CHANGED) - 1
+        return self._history[max(first, 0) :]
+
+    async def _async_load_missing(
+        self, start_timestamp: float, now_timestamp: float
+    ) -> None:
+        """Load the part of the history which is missing from the database."""
+        if self._start is None:
+            await self._async_load(start_timestamp, now_timestamp)
+            self._start = start_timestamp
+            self._end = now_timestamp
+        else:
+            if start_timestamp < self._start:
+                await self._async_load(start_timestamp, self._start)
+                self._start = start_timestamp
+            if now_timestamp > self._end:
+                await self._async_load(self._end, now_timestamp)
+                self._end = now_timestamp
+        if self._live_since is not None and self._live_since < self._end:
+            self._end = math.inf
+
+    async def _async_load(self, start_timestamp: float, end_timestamp: float) -> None:
+        """Merge the history of a period from the database into the history."""
+        states = await get_instance(self.hass).async_add_executor_job(
+            self._state_changes_during_period, start_timestamp, end_timestamp
+        )
+        # States added from state changed events in the meantime win
+        merged = {
+            state.last_changed_timestamp: HistoryState(
+                state.state, state.last_changed_timestamp
+            )
+            for state in states
+        }
+        merged.update(
+            (history_state.last_changed, history_state)
+            for history_state in self._history
+        )
+        self._history = sorted(merged.values(), key=_LAST_CHANGED)
+
+    def _state_changes_during_period(
+        self, start_ts: float, end_ts: float
+    ) -> list[State]:
+        """Return state changes during a period."""
+        start = dt_util.utc_from_timestamp(start_ts)
+        end = dt_util.utc_from_timestamp(end_ts)
+        return history.state_changes_during_period(
+            self.hass,
+            start,
+            end,
+            self.entity_id,
+            include_start_time_state=True,
+            no_attributes=True,
+        ).get(self.entity_id, [])
+
+    @callback
+    def async_set_period_start(
+        self, history_stats: HistoryStats, start_timestamp: float
+    ) -> None:
+        """Set the period start of a subscriber and prune history no one needs."""
+        if history_stats not in self._subscribers:
+            return
+        self._subscribers[history_stats] = start_timestamp
+        horizon = min(
+            start for start in self._subscribers.values() if start is not None
+        )
+        if self._start is None or horizon <= self._start or self._lock.locked():
+            return
+        # Keep the state at the horizon
+        if (first := bisect_right(self._history, horizon, key=_LAST_CHANGED) - 1) > 0:
+            del self._history[:first]
+        self._start = horizon
+
+
+@callback
+def async_get_history_index(hass: HomeAssistant, entity_id: str) -> HistoryIndex:
+    """Get the shared history index of an entity."""
+    indexes = hass.data.setdefault(DATA_HISTORY_INDEXES, {})
+    if (index := indexes.get(entity_id)) is None:
+        index = indexes[entity_id] = HistoryIndex(hass, entity_id)
+    return index
+
+
 class HistoryStats:
     """Manage history stats."""
 
@@ -53,8 +232,6 @@ class HistoryStats:
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
-        self._has_recorder_data = False
         self._entity_states = set(entity_states)
         self._duration = duration
         self._min_state_duration = min_state_duration.total_seconds()
@@ -62,8 +239,10 @@ class HistoryStats:
         self._end = end
         self._preview = preview
 
-        self._pending_events: list[Event[EventStateChangedData]] = []
-        self._query_count = 0
+    @callback
+    def async_subscribe(self) -> CALLBACK_TYPE:
+        """Keep the shared history of the entity up to date."""
+        return async_get_history_index(self.hass, self.entity_id).async_subscribe(self)
 
     async def async_update(
         self, event: Event[EventStateChangedData] | None
@@ -92,87 +271,34 @@ class HistoryStats:
         utc_now = dt_util.utcnow()
         now_timestamp = floored_timestamp(utc_now)
 
-        # If we end up querying data from the recorder when we
-        # get triggered by a new state change event, it is possible
-        # this function could be reentered a second time before the
-        # first recorder query returns. In that case a second
-        # recorder query will be done and we need to hold the new
-        # event so that we can append it after the second query.
-        # Otherwise the event will be dropped.
-        if event:
-            self._pending_events.append(event)
-
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
-            self._has_recorder_data = False
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
-        #
-        # We avoid querying the database if the below did NOT happen:
-        #
-        # - No previous run occurred (uninitialized)
-        # - The start time moved back in time
-        # - The end time moved back in time
-        # - The previous period ended before now
-        #
+
         if (
-            self._has_recorder_data
-            and current_period_start_timestamp >= previous_period_start_timestamp
-            and (
-                current_period_end_timestamp == previous_period_end_timestamp
-                or (
-                    current_period_end_timestamp >= previous_period_end_timestamp
-                    and previous_period_end_timestamp <= now_timestamp
-                )
-            )
+            event is None
+            and self._state.seconds_matched is not None
+            and current_period_start_timestamp == previous_period_start_timestamp
+            and current_period_end_timestamp == previous_period_end_timestamp
+            and current_period_end_timestamp < now_timestamp
         ):
-            start_changed = (
-                current_period_start_timestamp != previous_period_start_timestamp
-            )
-            end_changed = current_period_end_timestamp != previous_period_end_timestamp
-            if start_changed:
-                self._prune_history_cache(current_period_start_timestamp)
-
-            new_data = False
-            if event and (new_state := event.data["new_state"]) is not None:
-                if current_period_start_timestamp <= floored_timestamp(
-                    new_state.last_changed
-                ):
-                    self._history_current_period.append(
-                        HistoryState(new_state.state, new_state.last_changed_timestamp)
-                    )
-                    new_data = True
-            if (
-                not new_data
-                and current_period_end_timestamp < now_timestamp
-                and not start_changed
-                and not end_changed
-            ):
-                # If period has not changed and current time after the period end...
-                # Don't compute anything as the value cannot have changed
-                return self._state
-        else:
-            await self._async_history_from_db(
-                current_period_start_timestamp, now_timestamp
-            )
-            for pending_event in self._pending_events:
-                if (new_state := pending_event.data["new_state"]) is not None:
-                    if current_period_start_timestamp <= floored_timestamp(
-                        new_state.last_changed
-                    ):
-                        self._history_current_period.append(
-                            HistoryState(
-                                new_state.state, new_state.last_changed_timestamp
-                            )
-                        )
-
-            self._has_recorder_data = True
-
-        if self._query_count == 0:
-            self._pending_events.clear()
+            # If period has not changed and current time after the period end...
+            # Don't compute anything as the value cannot have changed
+            return self._state
+
+        # The history is shared with the other history stats of the entity,
+        # the recorder is only queried for the parts of the period it misses
+        index = async_get_history_index(self.hass, self.entity_id)
+        if event:
+            index.async_add_state(event.data["new_state"])
+        history_states = await index.async_history(
+            current_period_start_timestamp, now_timestamp
+        )
+        index.async_set_period_start(self, current_period_start_timestamp)
 
         seconds_matched, match_count = self._async_compute_seconds_and_changes(
+            history_states,
             now_timestamp,
             current_period_start_timestamp,
             current_period_end_timestamp,
@@ -180,55 +306,22 @@ class HistoryStats:
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
-    async def _async_history_from_db(
-        self,
-        current_period_start_timestamp: float,
-        current_period_end_timestamp: float,
-    ) -> None:
-        """Update history data for the current period from the database."""
-        self._query_count += 1
-        try:
-            instance = get_instance(self.hass)
-            states = await instance.async_add_executor_job(
-                self._state_changes_during_period,
-                current_period_start_timestamp,
-                current_period_end_timestamp,
-            )
-        finally:
-            self._query_count -= 1
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed_timestamp) for state in states
-        ]
-
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
-
     def _async_compute_seconds_and_changes(
-        self, now_timestamp: float, start_timestamp: float, end_timestamp: float
+        self,
+        history_states: list[HistoryState],
+        now_timestamp: float,
+        start_timestamp: float,
+        end_timestamp: float,
     ) -> tuple[float, int]:
         """Compute seconds matched and changes from history list."""
-        # state_changes_during_period is called with include_start_time_state=True
-        # which is the default and always provides the state at the start
-        # of the period
+        # The history starts with the state at the start of the period
         previous_state_matches = False
         last_state_change_timestamp = 0.0
         elapsed = 0.0
         match_count = 0
 
         # Make calculations
-        for history_state in self._history_current_period:
+        for history_state in history_states:
             current_state_matches = history_state.state in self._entity_states
             state_change_timestamp = history_state.last_changed
 
@@ -280,19 +373,3 @@ class HistoryStats:
         # Save value in seconds
         seconds_matched = elapsed
         return seconds_matched, match_count
-
-    def _prune_history_cache(self, start_timestamp: float) -> None:
-        """Remove unnecessary old data from the history state cache from previous runs.
-
-        Update the timestamp of the last record from before the
-        start to the current start time.
-        """
-        trim_count = 0
-        for i, history_state in enumerate(self._history_current_period):
-            if history_state.last_changed >= start_timestamp:
-                break
-            history_state.last_changed = start_timestamp
-            if i > 0:
-                trim_count += 1
-        if trim_count:  # Don't slice if no data was removed
-            self._history_current_period = self._history_current_period[trim_count:]
@@ -27,6 +27,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.event_type import EventType
 
@@ -42,6 +43,7 @@ from .const import (  # noqa: F401
     LOGBOOK_ENTRY_NAME,
     LOGBOOK_ENTRY_SOURCE,
 )
+from .helpers import RecentLogbookEvents
 from .models import LazyEventPartialState, LogbookConfig
 
 CONFIG_SCHEMA = vol.Schema(
@@ -131,12 +133,16 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    recent_events = RecentLogbookEvents(hass)
+    hass.data[DOMAIN] = LogbookConfig(
+        external_events, filters, entities_filter, recent_events
+    )
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
     await async_process_integration_platforms(hass, DOMAIN, _process_logbook_platform)
+    async_at_started(hass, recent_events.async_start)
 
     return True
 
@@ -155,5 +161,7 @@ def _process_logbook_platform(hass: HomeAssistant, domain: str, platform: Any) -
     ) -> None:
         """Teach logbook how to describe a new event."""
         external_events[event_name] = (domain, describe_callback)
+        if recent_events := logbook_config.recent_events:
+            recent_events.async_add_event_type(event_name)
 
     platform.async_describe_events(hass, _async_describe_event)
@@ -1,5 +1,7 @@
 """Event parser and human readable log generator."""
 
+from datetime import timedelta
+
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.event import EventEntityStateAttribute
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -51,3 +53,8 @@ AUTOMATION_EVENTS = {EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED}
 
 # Events that are built-in to the logbook or core
 BUILT_IN_EVENTS = {EVENT_LOGBOOK_ENTRY, EVENT_CALL_SERVICE}
+
+# How far back live event streams can backfill from memory
+RECENT_EVENTS_WINDOW = timedelta(hours=6)
+# The maximum number of recent events kept in memory
+MAX_RECENT_EVENTS = 10000
@@ -1,6 +1,8 @@
 """Event parser and human readable log generator."""
 
-from collections.abc import Callable, Collection, Mapping
+from collections import deque
+from collections.abc import Callable, Collection, Iterable, Mapping
+from datetime import datetime as dt
 from typing import Any
 
 from homeassistant.components.sensor import ATTR_STATE_CLASS, NON_NUMERIC_DEVICE_CLASSES
@@ -27,6 +29,7 @@ from homeassistant.core import (
 )
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
 from homeassistant.util.event_type import EventType
 
 from .const import (
@@ -34,6 +37,8 @@ from .const import (
     AUTOMATION_EVENTS,
     BUILT_IN_EVENTS,
     DOMAIN,
+    MAX_RECENT_EVENTS,
+    RECENT_EVENTS_WINDOW,
     SENSOR_DOMAIN,
 )
 from .models import LogbookConfig
@@ -209,17 +214,9 @@ def async_subscribe_events(
         # changed events
         return
 
-    @callback
-    def _forward_state_events_filtered(event: Event[EventStateChangedData]) -> None:
-        if (old_state := event.data["old_state"]) is None or (
-            new_state := event.data["new_state"]
-        ) is None:
-            return
-        if _is_state_filtered(new_state, old_state) or (
-            entities_filter and not entities_filter(new_state.entity_id)
-        ):
-            return
-        target(event)
+    _forward_state_events_filtered = _state_event_forwarder_filtered(
+        target, entities_filter
+    )
 
     if entity_ids:
         subscriptions.append(
@@ -238,6 +235,146 @@ def async_subscribe_events(
     )
 
 
+@callback
+def async_replay_events(
+    events: Iterable[Event[Any]],
+    target: Callable[[Event[Any]], None],
+    event_types: Collection[EventType[Any] | str],
+    entities_filter: Callable[[str], bool] | None,
+    entity_ids: list[str] | None,
+    device_ids: list[str] | None,
+) -> None:
+    """Replay events to the target.
+
+    The events are filtered the same way async_subscribe_events
+    filters the events it forwards to the target.
+    """
+    event_forwarder = event_forwarder_filtered(
+        target, entities_filter, entity_ids, device_ids
+    )
+    state_event_forwarder: Callable[[Event[EventStateChangedData]], None] | None = (
+        None
+        if device_ids and not entity_ids
+        else _state_event_forwarder_filtered(target, entities_filter)
+    )
+    entity_ids_set = set(entity_ids) if entity_ids else None
+    for event in events:
+        if event.event_type == EVENT_STATE_CHANGED:
+            if state_event_forwarder and (
+                entity_ids_set is None or event.data["entity_id"] in entity_ids_set
+            ):
+                state_event_forwarder(event)
+        elif event.event_type in event_types:
+            event_forwarder(event)
+
+
+@callback
+def _state_event_forwarder_filtered(
+    target: Callable[[Event[Any]], None],
+    entities_filter: Callable[[str], bool] | None,
+) -> Callable[[Event[EventStateChangedData]], None]:
+    """Make a callable to filter state changed events."""
+
+    @callback
+    def _forward_state_events_filtered(event: Event[EventStateChangedData]) -> None:
+        if (old_state := event.data["old_state"]) is None or (
+            new_state := event.data["new_state"]
+        ) is None:
+            return
+        if _is_state_filtered(new_state, old_state) or (
+            entities_filter and not entities_filter(new_state.entity_id)
+        ):
+            return
+        target(event)
+
+    return _forward_state_events_filtered
+
+
+class RecentLogbookEvents:
+    """Keep a bounded window of recent events the logbook may describe.
+
+    Live event streams that start inside the window backfill from
+    memory instead of querying the database.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init the recent events."""
+        self.hass = hass
+        self._events: deque[Event[Any]] = deque()
+        self._event_types: set[EventType[Any] | str] = set()
+        self._covered_since_ts: float | None = None
+
+    @callback
+    def async_start(self, hass: HomeAssistant) -> None:
+        """Start keeping recent events."""
+        logbook_config: LogbookConfig = hass.data[DOMAIN]
+        for event_type in (
+            *BUILT_IN_EVENTS,
+            *AUTOMATION_EVENTS,
+            *logbook_config.external_events,
+        ):
+            self._async_listen(event_type)
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_add_state_event)
+        self._covered_since_ts = dt_util.utcnow().timestamp()
+
+    @callback
+    def async_add_event_type(self, event_type: EventType[Any] | str) -> None:
+        """Keep events of an event type that was described after we started."""
+        if self._covered_since_ts is None or event_type in self._event_types:
+            return
+        self._async_listen(event_type)
+        # Older events of this type are only available from the database
+        self._covered_since_ts = dt_util.utcnow().timestamp()
+
+    @callback
+    def async_covers(self, start_time: dt) -> bool:
+        """Return if all events since start_time are kept."""
+        return (
+            self._covered_since_ts is not None
+            and start_time.timestamp() > self._covered_since_ts
+        )
+
+    @callback
+    def async_get_events(self, start_time: dt, end_time: dt) -> list[Event[Any]]:
+        """Return the kept events between start_time and end_time."""
+        start_time_ts = start_time.timestamp()
+        end_time_ts = end_time.timestamp()
+        return [
+            event
+            for event in self._events
+            if start_time_ts <= event.time_fired_timestamp <= end_time_ts
+        ]
+
+    @callback
+    def _async_listen(self, event_type: EventType[Any] | str) -> None:
+        """Listen for an event type."""
+        self._event_types.add(event_type)
+        self.hass.bus.async_listen(event_type, self._async_add_event)
+
+    @callback
+    def _async_add_state_event(self, event: Event[EventStateChangedData]) -> None:
+        """Keep a state changed event if the logbook may describe it."""
+        if (old_state := event.data["old_state"]) is None or (
+            new_state := event.data["new_state"]
+        ) is None:
+            return
+        if not _is_state_filtered(new_state, old_state):
+            self._async_add_event(event)
+
+    @callback
+    def _async_add_event(self, event: Event[Any]) -> None:
+        """Keep an event and drop the ones that fell out of the window."""
+        events = self._events
+        events.append(event)
+        cutoff_ts = event.time_fired_timestamp - RECENT_EVENTS_WINDOW.total_seconds()
+        while len(events) > MAX_RECENT_EVENTS or (
+            events[0].time_fired_timestamp < cutoff_ts
+        ):
+            dropped_ts = events.popleft().time_fired_timestamp
+            if self._covered_since_ts is None or dropped_ts > self._covered_since_ts:
+                self._covered_since_ts = dropped_ts
+
+
 def _device_class_is_numeric(device_class: str | None) -> bool:
     return device_class is not None and device_class not in NON_NUMERIC_DEVICE_CLASSES
 
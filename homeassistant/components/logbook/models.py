@@ -20,6 +20,9 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+if TYPE_CHECKING:
+    from .helpers import RecentLogbookEvents
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -31,6 +34,7 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    recent_events: RecentLogbookEvents | None = None
 
 
 class LazyEventPartialState:
@@ -18,11 +18,13 @@ from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.event_type import EventType
 
 from .const import DOMAIN
 from .helpers import (
     async_determine_event_types,
     async_filter_entities,
+    async_replay_events,
     async_subscribe_events,
 )
 from .models import LogbookConfig, async_event_to_row
@@ -34,6 +36,8 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# how many hours to deliver in each of the older chunks when we split the query
+BIG_QUERY_CHUNK_HOURS = 24
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -86,10 +90,12 @@ async def _async_send_historical_events(
     """Select historical data from the database and deliver it to the websocket.
 
     If the query is considered a big query we will split the request into
-    two chunks so that they get the recent events first and the select
-    that is expected to take a long time comes in after to ensure
+    chunks so that they get the recent events first and the selects
+    that are expected to take a long time come in after to ensure
     they are not stuck at a loading screen and can start looking at
-    the data right away.
+    the data right away. The older events are fetched and sent one
+    chunk at a time, newest first, so the events for the whole window
+    never have to be held in memory at the same time.
 
     This function returns the time of the most recent event we sent to the
     websocket.
@@ -119,8 +125,8 @@ async def _async_send_historical_events(
         return last_event_time
 
     # This is a big query so we deliver
-    # the first three hours and then
-    # we fetch the old data
+    # the most recent hours first and then
+    # we fetch the old data in chunks
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
@@ -133,26 +139,91 @@ async def _async_send_historical_events(
     if recent_query_last_event_time:
         connection.send_message(recent_message)
 
-    older_message, older_query_last_event_time = await _async_get_ws_stream_events(
-        hass,
-        msg_id,
-        start_time,
-        recent_query_start,
-        event_processor,
-        partial,
-    )
-    # If there is no last_event_time, there are no historical
-    # results, but we still send an empty message
-    # if its the last one (not partial) so
-    # consumers of the api know their request was
-    # answered but there were no results
-    if older_query_last_event_time or not partial or force_send:
-        connection.send_message(older_message)
+    older_query_last_event_time: dt | None = None
+    older_query_sent = False
+    chunk_end = recent_query_start
+    while chunk_end > start_time:
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending historical events
+            break
+        chunk_start = max(
+            start_time, chunk_end - timedelta(hours=BIG_QUERY_CHUNK_HOURS)
+        )
+        is_last_chunk = chunk_start == start_time
+        older_message, chunk_last_event_time = await _async_get_ws_stream_events(
+            hass,
+            msg_id,
+            chunk_start,
+            chunk_end,
+            event_processor,
+            partial if is_last_chunk else True,
+        )
+        # If there is no last_event_time, there are no historical
+        # results, but we still send an empty message
+        # if its the last one (not partial) so
+        # consumers of the api know their request was
+        # answered but there were no results. When forced,
+        # the empty message is only sent if no older chunk was.
+        if chunk_last_event_time or (
+            is_last_chunk and (not partial or (force_send and not older_query_sent))
+        ):
+            connection.send_message(older_message)
+            older_query_sent = True
+        # Chunks are fetched newest first so the first
+        # chunk with events has the newest event
+        older_query_last_event_time = (
+            older_query_last_event_time or chunk_last_event_time
+        )
+        chunk_end = chunk_start
 
     # Returns the time of the newest event
     return recent_query_last_event_time or older_query_last_event_time
 
 
+@callback
+def _async_send_recent_events(
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    events: list[Event],
+    event_types: set[EventType[Any] | str],
+    entities_filter: Callable[[str], bool] | None,
+    entity_ids: list[str] | None,
+    device_ids: list[str] | None,
+) -> None:
+    """Deliver the recent events kept in memory to the websocket.
+
+    The messages are sent in the same sequence as when the events
+    are selected from the database so consumers of the api do not
+    need to know where the events came from.
+    """
+    matched_events: list[Event] = []
+    async_replay_events(
+        events,
+        matched_events.append,
+        event_types,
+        entities_filter,
+        entity_ids,
+        device_ids,
+    )
+    message = _generate_stream_message(
+        event_processor.humanify(async_event_to_row(e) for e in matched_events),
+        start_time,
+        end_time,
+    )
+    message["partial"] = True
+    connection.send_message(json_bytes(messages.event_message(msg_id, message)))
+    connection.send_message(
+        json_bytes(
+            messages.event_message(
+                msg_id, _generate_stream_message([], start_time, end_time)
+            )
+        )
+    )
+
+
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
     msg_id: int,
@@ -354,9 +425,9 @@ async def ws_event_stream(
             )
             _unsub()
 
+    logbook_config: LogbookConfig = hass.data[DOMAIN]
     entities_filter: Callable[[str], bool] | None = None
     if not event_processor.limited_select:
-        logbook_config: LogbookConfig = hass.data[DOMAIN]
         entities_filter = logbook_config.entity_filter
 
     # Live subscription needs call_service events so the live consumer can
@@ -375,6 +446,38 @@ async def ws_event_stream(
     subscriptions_setup_complete_time = dt_util.utcnow()
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
+
+    if (recent_events := logbook_config.recent_events) and recent_events.async_covers(
+        start_time
+    ):
+        # Everything since start_time is still in memory
+        # so we can skip the database entirely
+        _async_send_recent_events(
+            connection,
+            msg_id,
+            start_time,
+            subscriptions_setup_complete_time,
+            event_processor,
+            recent_events.async_get_events(
+                start_time, subscriptions_setup_complete_time
+            ),
+            {*event_types, EVENT_CALL_SERVICE},
+            entities_filter,
+            entity_ids,
+            device_ids,
+        )
+        event_processor.switch_to_live()
+        live_stream.task = create_eager_task(
+            _async_events_consumer(
+                subscriptions_setup_complete_time,
+                connection,
+                msg_id,
+                stream_queue,
+                event_processor,
+            )
+        )
+        return
+
     # Fetch everything from history
     last_event_time = await _async_send_historical_events(
         hass,
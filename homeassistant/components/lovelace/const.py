@@ -31,6 +31,7 @@ MODE_AUTO = "auto-gen"
 LOVELACE_CONFIG_FILE = "ui-lovelace.yaml"
 CONF_ALLOW_SINGLE_WORD = "allow_single_word"
 CONF_URL_PATH = "url_path"
+CONF_KNOWN_HASH = "known_hash"
 CONF_RESOURCE_TYPE_WS = "res_type"
 
 RESOURCE_TYPES = ["js", "css", "module", "html"]
@@ -1,6 +1,7 @@
 """Lovelace dashboard support."""
 
 from abc import ABC, abstractmethod
+from hashlib import md5
 import logging
 import os
 from pathlib import Path
@@ -80,9 +81,14 @@ class LovelaceConfig(ABC):
         """Delete config."""
         raise HomeAssistantError("Not supported")
 
-    @abstractmethod
     async def async_json(self, force: bool) -> json_fragment:
         """Return JSON representation of the config."""
+        json, _hash = await self.async_json_and_hash(force)
+        return json
+
+    @abstractmethod
+    async def async_json_and_hash(self, force: bool) -> tuple[json_fragment, str]:
+        """Return JSON representation of the config and a hash of it."""
 
     @callback
     def _config_updated(self) -> None:
@@ -108,7 +114,7 @@ class LovelaceStorage(LovelaceConfig):
             hass, CONFIG_STORAGE_VERSION, storage_key
         )
         self._data: dict[str, Any] | None = None
-        self._json_config: json_fragment | None = None
+        self._json_config: tuple[json_fragment, str] | None = None
 
     @property
     @override
@@ -137,8 +143,8 @@ class LovelaceStorage(LovelaceConfig):
         return config  # type: ignore[no-any-return]
 
     @override
-    async def async_json(self, force: bool) -> json_fragment:
-        """Return JSON representation of the config."""
+    async def async_json_and_hash(self, force: bool) -> tuple[json_fragment, str]:
+        """Return JSON representation of the config and a hash of it."""
         if self.hass.config.recovery_mode:
             raise ConfigNotFound
         if self._data is None:
@@ -178,11 +184,11 @@ class LovelaceStorage(LovelaceConfig):
         return self._data
 
     @callback
-    def _async_build_json(self) -> json_fragment:
-        """Build JSON representation of the config."""
+    def _async_build_json(self) -> tuple[json_fragment, str]:
+        """Build JSON representation of the config and a hash of it."""
         if self._data is None or self._data["config"] is None:
             raise ConfigNotFound
-        self._json_config = json_fragment(json_bytes(self._data["config"]))
+        self._json_config = _json_and_hash(self._data["config"])
         return self._json_config
 
 
@@ -198,7 +204,7 @@ class LovelaceYAML(LovelaceConfig):
         self.path = hass.config.path(
             config[CONF_FILENAME] if config else LOVELACE_CONFIG_FILE
         )
-        self._cache: tuple[dict[str, Any], float, json_fragment] | None = None
+        self._cache: tuple[dict[str, Any], float, json_fragment, str] | None = None
 
     @property
     @override
@@ -222,34 +228,36 @@ class LovelaceYAML(LovelaceConfig):
     @override
     async def async_load(self, force: bool) -> dict[str, Any]:
         """Load config."""
-        config, _json = await self._async_load_or_cached(force)
+        config, _json, _hash = await self._async_load_or_cached(force)
         return config
 
     @override
-    async def async_json(self, force: bool) -> json_fragment:
-        """Return JSON representation of the config."""
-        _config, json = await self._async_load_or_cached(force)
-        return json
+    async def async_json_and_hash(self, force: bool) -> tuple[json_fragment, str]:
+        """Return JSON representation of the config and a hash of it."""
+        _config, json, json_hash = await self._async_load_or_cached(force)
+        return json, json_hash
 
     async def _async_load_or_cached(
         self, force: bool
-    ) -> tuple[dict[str, Any], json_fragment]:
+    ) -> tuple[dict[str, Any], json_fragment, str]:
         """Load the config or return a cached version."""
-        is_updated, config, json = await self.hass.async_add_executor_job(
+        is_updated, config, json, json_hash = await self.hass.async_add_executor_job(
             self._load_config, force
         )
         if is_updated:
             self._config_updated()
-        return config, json
+        return config, json, json_hash
 
-    def _load_config(self, force: bool) -> tuple[bool, dict[str, Any], json_fragment]:
+    def _load_config(
+        self, force: bool
+    ) -> tuple[bool, dict[str, Any], json_fragment, str]:
         """Load the actual config."""
         # Check for a cached version of the config
         if not force and self._cache is not None:
-            config, last_update, json = self._cache
+            config, last_update, json, json_hash = self._cache
             modtime = os.path.getmtime(self.path)
             if config and last_update > modtime:
-                return False, config, json
+                return False, config, json, json_hash
 
         is_updated = self._cache is not None
 
@@ -260,9 +268,15 @@ class LovelaceYAML(LovelaceConfig):
         except FileNotFoundError:
             raise ConfigNotFound from None
 
-        json = json_fragment(json_bytes(config))
-        self._cache = (config, time.time(), json)
-        return is_updated, config, json
+        json, json_hash = _json_and_hash(config)
+        self._cache = (config, time.time(), json, json_hash)
+        return is_updated, config, json, json_hash
+
+
+def _json_and_hash(config: dict[str, Any]) -> tuple[json_fragment, str]:
+    """Return JSON representation of the config and a hash of it."""
+    json = json_bytes(config)
+    return json_fragment(json), md5(json).hexdigest()
 
 
 def _config_info(mode: str, config: dict[str, Any]) -> dict[str, Any]:
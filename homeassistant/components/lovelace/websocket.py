@@ -13,6 +13,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import json_fragment
 
 from .const import (
+    CONF_KNOWN_HASH,
     CONF_RESOURCE_MODE,
     CONF_URL_PATH,
     DOMAIN,
@@ -132,6 +133,7 @@ async def websocket_lovelace_info(
         "type": "lovelace/config",
         vol.Optional("force", default=False): bool,
         vol.Optional(CONF_URL_PATH): vol.Any(None, cv.string),
+        vol.Optional(CONF_KNOWN_HASH): vol.Any(None, cv.string),
     }
 )
 @websocket_api.async_response
@@ -141,9 +143,19 @@ async def websocket_lovelace_config(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
     config: LovelaceConfig,
-) -> json_fragment:
-    """Send Lovelace UI config over WebSocket connection."""
-    return await config.async_json(msg["force"])
+) -> json_fragment | dict[str, Any]:
+    """Send Lovelace UI config over WebSocket connection.
+
+    Clients passing the hash of the config they know, or None if they do
+    not know one, get the hash of the config together with the config. The
+    config is left out if it did not change.
+    """
+    if CONF_KNOWN_HASH not in msg:
+        return await config.async_json(msg["force"])
+    json, json_hash = await config.async_json_and_hash(msg["force"])
+    if json_hash == msg[CONF_KNOWN_HASH]:
+        return {"hash": json_hash, "unchanged": True}
+    return {"hash": json_hash, "unchanged": False, "config": json}
 
 
 @websocket_api.require_admin
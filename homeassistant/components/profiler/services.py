@@ -22,8 +22,11 @@ from homeassistant.const import CONF_ENABLED, CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.condition import async_get_condition_memo_stats
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.poll_scheduler import async_get_poll_scheduler
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util.async_ import run_callback_threadsafe
 
 from .const import DOMAIN
 
@@ -38,6 +41,7 @@ SERVICE_DUMP_SOCKETS = "dump_sockets"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_LOG_POLL_SCHEDULE = "log_poll_schedule"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
 
@@ -208,6 +212,13 @@ def async_setup_services(hass: HomeAssistant) -> None:  # noqa: C901
                         "Cache data for sqlalchemy LRUCache %s: %s: %s", lru, key, value
                     )
 
+        _LOGGER.critical(
+            "Cache stats for shared condition results: %s",
+            run_callback_threadsafe(
+                hass.loop, async_get_condition_memo_stats, hass
+            ).result(),
+        )
+
         persistent_notification.create(
             hass,
             (
@@ -256,6 +267,15 @@ def async_setup_services(hass: HomeAssistant) -> None:  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    async def _async_dump_poll_schedule(call: ServiceCall) -> None:
+        """Log the number of pollers scheduled per second."""
+        load = async_get_poll_scheduler(hass).async_load_per_second()
+        _LOGGER.critical(
+            "Pollers scheduled per second from now: %s",
+            ", ".join(f"{second}s: {count}" for second, count in load.items())
+            or "none",
+        )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -370,6 +390,13 @@ def async_setup_services(hass: HomeAssistant) -> None:  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_POLL_SCHEDULE,
+        _async_dump_poll_schedule,
+    )
+
     async_register_admin_service(
         hass,
         DOMAIN,
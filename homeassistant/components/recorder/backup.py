@@ -1,29 +1,59 @@
 """Backup platform for the Recorder integration."""
 
 from logging import getLogger
+from pathlib import Path
 
+from homeassistant.components.backup import current_backup_file_snapshots
 from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
-from .util import async_migration_in_progress, get_instance
+from .core import Recorder
+from .util import async_migration_in_progress, dburl_to_path, get_instance
 
 _LOGGER = getLogger(__name__)
 
 
+def _database_name(hass: HomeAssistant, instance: Recorder) -> str | None:
+    """Return the database path relative to the config directory."""
+    database_path = Path(dburl_to_path(instance.db_url))
+    if not database_path.is_relative_to(hass.config.config_dir):
+        return None
+    return database_path.relative_to(hass.config.config_dir).as_posix()
+
+
 async def async_pre_backup(hass: HomeAssistant) -> None:
     """Perform operations before a backup starts."""
-    _LOGGER.info("Backup start notification, locking database for writes")
     instance = get_instance(hass)
     if hass.state is not CoreState.running:
         raise HomeAssistantError("Home Assistant is not running")
     if async_migration_in_progress(hass):
         raise HomeAssistantError("Database migration in progress")
+    if (
+        (file_snapshots := current_backup_file_snapshots.get()) is not None
+        and file_snapshots.database_included
+        and (name := _database_name(hass, instance))
+    ):
+        _LOGGER.info("Backup start notification, copying database snapshot")
+        snapshot_path = file_snapshots.directory / Path(name).name
+        if await instance.async_snapshot_database(snapshot_path):
+            file_snapshots.files[name] = snapshot_path
+            file_snapshots.files[f"{name}-shm"] = None
+            file_snapshots.files[f"{name}-wal"] = None
+            return
+    _LOGGER.info("Backup start notification, locking database for writes")
     await instance.lock_database()
 
 
 async def async_post_backup(hass: HomeAssistant) -> None:
     """Perform operations after a backup finishes."""
     instance = get_instance(hass)
+    if (
+        (file_snapshots := current_backup_file_snapshots.get()) is not None
+        and (name := _database_name(hass, instance))
+        and name in file_snapshots.files
+    ):
+        _LOGGER.info("Backup end notification, database was not locked")
+        return
     _LOGGER.info("Backup end notification, releasing write lock")
     if not instance.unlock_database():
         raise HomeAssistantError("Could not release database write lock")
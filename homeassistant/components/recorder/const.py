@@ -26,6 +26,11 @@ DOMAIN = "recorder"
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
+
+# Pages copied per step when snapshotting the SQLite database for a backup,
+# and the time to sleep between steps to leave the disk to the recorder
+DB_SNAPSHOT_PAGES = 1024
+DB_SNAPSHOT_SLEEP = 0.005
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
 # As soon as we have more than 999 ids, split the query as the
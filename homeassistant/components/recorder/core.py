@@ -6,6 +6,7 @@ from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
 import logging
+from pathlib import Path
 import queue
 import sqlite3
 import threading
@@ -114,6 +115,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    snapshot_db_sqlite,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -1354,6 +1356,18 @@ class Recorder(threading.Thread):
         self._database_lock_task = task
         return True
 
+    async def async_snapshot_database(self, path: Path) -> bool:
+        """Copy a consistent snapshot of the database without locking it.
+
+        Returns False if the database can't be copied while the recorder
+        keeps writing, it has to be locked for the backup instead.
+        """
+        if self.dialect_name != SupportedDialect.SQLITE:
+            return False
+        return await self.hass.async_add_executor_job(
+            snapshot_db_sqlite, dburl_to_path(self.db_url), path
+        )
+
     @callback
     def unlock_database(self) -> bool:
         """Unlock database.
@@ -132,6 +132,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -147,6 +148,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -229,6 +231,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -240,6 +243,10 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    max_points is an optional limit on the number of numeric states
+    returned per entity. When set, numeric states are downsampled into
+    min/max buckets as the rows are read from the database.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
@@ -316,9 +323,26 @@ def get_significant_states_with_session(
         minimal_response,
         compressed_state_format,
         no_attributes=no_attributes,
+        downsample_bucket_width=_downsample_bucket_width(
+            start_time_ts, end_time_ts, max_points
+        ),
     )
 
 
+def _downsample_bucket_width(
+    start_time_ts: float, end_time_ts: float | None, max_points: int | None
+) -> float | None:
+    """Return the bucket width needed to return about max_points states."""
+    if not max_points:
+        return None
+    if end_time_ts is None:
+        end_time_ts = dt_util.utcnow().timestamp()
+    # Each bucket returns at most its lowest and highest state
+    if (bucket_width := (end_time_ts - start_time_ts) / max(max_points // 2, 1)) <= 0:
+        return None
+    return bucket_width
+
+
 def _generate_significant_states_with_session_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
@@ -796,6 +820,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    downsample_bucket_width: float | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -807,6 +832,9 @@ def _sorted_states_to_dict(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    If downsample_bucket_width is set, numeric states are downsampled
+    into buckets of that many seconds before they are converted.
     """
     field_map = _FIELD_MAP
     state_class: Callable[
@@ -847,6 +875,14 @@ def _sorted_states_to_dict(
     # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
+        if downsample_bucket_width is not None:
+            group = _downsample_numeric_rows(
+                group,
+                state_idx,
+                last_updated_ts_idx,
+                start_time_ts or 0.0,
+                downsample_bucket_width,
+            )
         attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
         if (
@@ -932,3 +968,63 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _downsample_numeric_rows(
+    rows: Iterable[Row],
+    state_idx: int,
+    last_updated_ts_idx: int,
+    start_time_ts: float,
+    bucket_width: float,
+) -> Iterator[Row]:
+    """Downsample numeric rows into min/max buckets.
+
+    Rows are grouped into fixed width time buckets and only the rows
+    with the lowest and highest numeric state of each bucket are kept,
+    in their original order. The first row is always kept so the start
+    time state and its attributes are preserved, and the last numeric row
+    before a non-numeric row, or at the end, is always kept so graphs end
+    on the right value.
+
+    Rows with a non-numeric state, such as unavailable, are always kept
+    which means entities that are not numeric pass through unchanged.
+    """
+    bucket: int | None = None
+    low: tuple[Row, float] | None = None
+    high: tuple[Row, float] | None = None
+    last: Row | None = None
+
+    def _flush(include_last: bool) -> list[Row]:
+        """Return the kept rows of the current bucket in order."""
+        if low is None or high is None or last is None:
+            return []
+        kept = {id(row): row for row in (low[0], high[0])}
+        if include_last:
+            kept[id(last)] = last
+        return sorted(kept.values(), key=itemgetter(last_updated_ts_idx))
+
+    rows_iter = iter(rows)
+    if (first := next(rows_iter, None)) is None:
+        return
+    yield first
+
+    for row in rows_iter:
+        try:
+            value = float(row[state_idx])
+        except TypeError, ValueError:
+            yield from _flush(True)
+            bucket = low = high = last = None
+            yield row
+            continue
+        row_bucket = int((row[last_updated_ts_idx] - start_time_ts) // bucket_width)
+        if row_bucket != bucket:
+            yield from _flush(False)
+            bucket = row_bucket
+            low = high = (row, value)
+        elif low is not None and value < low[1]:
+            low = (row, value)
+        elif high is not None and value > high[1]:
+            high = (row, value)
+        last = row
+
+    yield from _flush(True)
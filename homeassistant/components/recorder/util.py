@@ -7,6 +7,8 @@ from datetime import date, datetime, timedelta
 import functools
 import logging
 import os
+from pathlib import Path
+import sqlite3
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, NoReturn
 
@@ -35,7 +37,14 @@ from homeassistant.helpers.recorder import (  # noqa: F401
 )
 from homeassistant.util import dt as dt_util
 
-from .const import DEFAULT_MAX_BIND_VARS, DOMAIN, SQLITE_URL_PREFIX, SupportedDialect
+from .const import (
+    DB_SNAPSHOT_PAGES,
+    DB_SNAPSHOT_SLEEP,
+    DEFAULT_MAX_BIND_VARS,
+    DOMAIN,
+    SQLITE_URL_PREFIX,
+    SupportedDialect,
+)
 from .db_schema import (
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
@@ -737,6 +746,37 @@ def write_lock_db_sqlite(instance: Recorder) -> Generator[None]:
             connection.execute(text("END;"))
 
 
+def snapshot_db_sqlite(database_path: str, snapshot_path: Path) -> bool:
+    """Copy a consistent snapshot of a SQLite database without locking it.
+
+    The snapshot is taken with the online backup API from a dedicated
+    connection holding a read transaction. In WAL mode this pins the copy to
+    a single point in time while the recorder keeps committing, and the
+    pages are copied in small batches. Returns False if the database is not
+    in WAL mode, since readers would then block the recorder.
+    """
+    if not os.path.exists(database_path):
+        return False
+    source = sqlite3.connect(database_path, isolation_level=None)
+    try:
+        if source.execute("PRAGMA journal_mode").fetchone()[0] != "wal":
+            return False
+        source.execute("BEGIN")
+        # The read transaction starts with the first read
+        source.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with contextlib.closing(sqlite3.connect(snapshot_path)) as target:
+                source.backup(target, pages=DB_SNAPSHOT_PAGES, sleep=DB_SNAPSHOT_SLEEP)
+        except sqlite3.Error:
+            snapshot_path.unlink(missing_ok=True)
+            raise
+        source.execute("END")
+    finally:
+        source.close()
+    return True
+
+
 def async_migration_in_progress(hass: HomeAssistant) -> bool:
     """Determine if a migration is in progress.
 
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 import asyncio
 from dataclasses import dataclass
+from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, cast, override
 
@@ -61,6 +62,7 @@ from homeassistant.helpers.trace import trace_get, trace_path
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.dt import parse_datetime
+from homeassistant.util.hass_dict import HassKey
 
 from .config import ScriptConfig, ValidationStatus
 from .const import (
@@ -83,6 +85,11 @@ SCRIPT_TURN_ONOFF_SCHEMA = make_entity_service_schema(
 )
 RELOAD_SERVICE_SCHEMA = vol.Schema({})
 
+# Scripts referencing each id, by referenced_* property name
+DATA_REFERENCES: HassKey[dict[str, dict[str, list[str]]]] = HassKey(
+    f"{DOMAIN}_references"
+)
+
 
 def is_on(hass: HomeAssistant, entity_id: str) -> bool:
     """Return if the script is on based on the statemachine."""
@@ -96,13 +103,24 @@ def _scripts_with_x(
     if DOMAIN not in hass.data:
         return []
 
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
+    all_references = hass.data.setdefault(DATA_REFERENCES, {})
+    if (references := all_references.get(property_name)) is None:
+        component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
+        references = all_references[property_name] = {}
+        for script_entity in component.entities:
+            for x_id in getattr(script_entity, property_name):
+                references.setdefault(x_id, []).append(script_entity.entity_id)
 
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if referenced_id in getattr(script_entity, property_name)
-    ]
+    return list(references.get(referenced_id, ()))
+
+
+@callback
+def _async_clear_references(hass: HomeAssistant) -> None:
+    """Clear the scripts referencing each id.
+
+    Called when a script is added or removed.
+    """
+    hass.data.pop(DATA_REFERENCES, None)
 
 
 def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> list[str]:
@@ -423,6 +441,13 @@ class BaseScriptEntity(ToggleEntity, ABC):
 
     raw_config: ConfigType | None
 
+    @override
+    async def async_internal_added_to_hass(self) -> None:
+        """Clear the referenced ids when added to and removed from hass."""
+        await super().async_internal_added_to_hass()
+        _async_clear_references(self.hass)
+        self.async_on_remove(partial(_async_clear_references, self.hass))
+
     @cached_property
     @abstractmethod
     def referenced_labels(self) -> set[str]:
@@ -0,0 +1,374 @@
+"""Statistics of a window of samples which are updated incrementally."""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import deque
+import math
+
+# Every finite float is an integer multiple of 2**-1074, so sums of samples
+# scaled by 2**1074 are integers and can be kept exactly
+_SCALE_BITS = 1074
+
+
+def _scaled(value: float) -> int:
+    """Return the value multiplied by 2**1074."""
+    numerator, denominator = value.as_integer_ratio()
+    return numerator << (_SCALE_BITS + 1 - denominator.bit_length())
+
+
+def _divide(numerator: int, denominator: int) -> float:
+    """Return the correctly rounded quotient, infinite if it is too large."""
+    try:
+        return numerator / denominator
+    except OverflowError:
+        return math.copysign(math.inf, numerator)
+
+
+def _sqrt_of_ratio(numerator: int, denominator: int) -> float:
+    """Return the correctly rounded square root of a non-negative ratio."""
+    # Keep enough bits for the mantissa plus rounding bits and round to odd,
+    # as statistics.stdev does
+    shift = (numerator.bit_length() - denominator.bit_length() - 109) // 2
+    if shift >= 0:
+        denominator <<= 2 * shift
+    else:
+        numerator <<= -2 * shift
+    root = math.isqrt(numerator // denominator)
+    root |= root * root * denominator != numerator
+    if shift >= 0:
+        return _divide(root << shift, 1)
+    return root / (1 << -shift)
+
+
+class IncrementalStatistic(ABC):
+    """Statistic of a window of samples which is updated incrementally.
+
+    Samples leave the window in the order they entered it.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def add(self, value: float) -> None:
+        """Add a sample which entered the window."""
+
+    @abstractmethod
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample which left the window."""
+
+    @abstractmethod
+    def value(self, percentile: int) -> float | None:
+        """Return the statistic of the samples in the window."""
+
+
+class RunningSums(IncrementalStatistic):
+    """Keep the exact sum and sum of squares of the samples.
+
+    Infinite and NaN samples are counted separately as they can not be
+    summed exactly.
+    """
+
+    __slots__ = ("_count", "_nan", "_negative_inf", "_positive_inf", "_sum", "_sum_sq")
+
+    def __init__(self) -> None:
+        """Initialize the running sums."""
+        self._count = 0
+        self._sum = 0
+        self._sum_sq = 0
+        self._nan = 0
+        self._positive_inf = 0
+        self._negative_inf = 0
+
+    def add(self, value: float) -> None:
+        """Add a sample which entered the window."""
+        self._count += 1
+        if math.isfinite(value):
+            scaled = _scaled(value)
+            self._sum += scaled
+            self._sum_sq += scaled * scaled
+        elif math.isnan(value):
+            self._nan += 1
+        elif value > 0:
+            self._positive_inf += 1
+        else:
+            self._negative_inf += 1
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample which left the window."""
+        self._count -= 1
+        if math.isfinite(value):
+            scaled = _scaled(value)
+            self._sum -= scaled
+            self._sum_sq -= scaled * scaled
+        elif math.isnan(value):
+            self._nan -= 1
+        elif value > 0:
+            self._positive_inf -= 1
+        else:
+            self._negative_inf -= 1
+
+    def _non_finite_sum(self) -> float | None:
+        """Return the sum of the infinite and NaN samples, None if there are none."""
+        if self._nan or (self._positive_inf and self._negative_inf):
+            return math.nan
+        if self._positive_inf:
+            return math.inf
+        if self._negative_inf:
+            return -math.inf
+        return None
+
+    def _variance_ratio(self) -> tuple[int, int] | None:
+        """Return the sample variance of at least two samples as a ratio.
+
+        Returns None if there are infinite or NaN samples.
+        """
+        if self._non_finite_sum() is not None:
+            return None
+        count = self._count
+        return (
+            count * self._sum_sq - self._sum * self._sum,
+            (count * (count - 1)) << (2 * _SCALE_BITS),
+        )
+
+
+class Mean(RunningSums):
+    """Arithmetic mean of the samples."""
+
+    __slots__ = ()
+
+    def value(self, percentile: int) -> float | None:
+        """Return the mean of the samples."""
+        if not self._count:
+            return None
+        if (non_finite_sum := self._non_finite_sum()) is not None:
+            return non_finite_sum
+        return _divide(self._sum, self._count << _SCALE_BITS)
+
+
+class Sum(RunningSums):
+    """Sum of the samples."""
+
+    __slots__ = ()
+
+    def value(self, percentile: int) -> float | None:
+        """Return the sum of the samples."""
+        if not self._count:
+            return None
+        if (non_finite_sum := self._non_finite_sum()) is not None:
+            return non_finite_sum
+        return _divide(self._sum, 1 << _SCALE_BITS)
+
+
+class Variance(RunningSums):
+    """Sample variance of the samples."""
+
+    __slots__ = ()
+
+    def value(self, percentile: int) -> float | None:
+        """Return the sample variance of the samples."""
+        if not self._count:
+            return None
+        if self._count == 1:
+            return 0.0
+        if (ratio := self._variance_ratio()) is None:
+            return math.nan
+        return _divide(*ratio)
+
+
+class StandardDeviation(RunningSums):
+    """Sample standard deviation of the samples, times a factor."""
+
+    __slots__ = ("_factor",)
+
+    def __init__(self, factor: float = 1.0) -> None:
+        """Initialize the standard deviation."""
+        super().__init__()
+        self._factor = factor
+
+    def value(self, percentile: int) -> float | None:
+        """Return the sample standard deviation of the samples, times the factor."""
+        if not self._count:
+            return None
+        if self._count == 1:
+            return 0.0
+        if (ratio := self._variance_ratio()) is None:
+            return math.nan
+        return self._factor * _sqrt_of_ratio(*ratio)
+
+
+class SortedSamples(IncrementalStatistic):
+    """Keep the samples sorted by value.
+
+    NaN samples are counted separately as they can not be ordered.
+    """
+
+    __slots__ = ("_nan", "_sorted")
+
+    def __init__(self) -> None:
+        """Initialize the sorted samples."""
+        self._sorted: list[float] = []
+        self._nan = 0
+
+    def add(self, value: float) -> None:
+        """Add a sample which entered the window."""
+        if math.isnan(value):
+            self._nan += 1
+        else:
+            insort(self._sorted, value)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample which left the window."""
+        if math.isnan(value):
+            self._nan -= 1
+        else:
+            del self._sorted[bisect_left(self._sorted, value)]
+
+
+class Median(SortedSamples):
+    """Median of the samples."""
+
+    __slots__ = ()
+
+    def value(self, percentile: int) -> float | None:
+        """Return the median of the samples."""
+        if self._nan:
+            return math.nan
+        if not (count := len(data := self._sorted)):
+            return None
+        if count % 2:
+            return data[count // 2]
+        return (data[count // 2 - 1] + data[count // 2]) / 2
+
+
+class Percentile(SortedSamples):
+    """Percentile of the samples.
+
+    Matches statistics.quantiles with 100 intervals and the exclusive method.
+    """
+
+    __slots__ = ()
+
+    def value(self, percentile: int) -> float | None:
+        """Return the percentile of the samples."""
+        if self._nan:
+            return math.nan
+        if not (count := len(data := self._sorted)):
+            return None
+        if count == 1:
+            return data[0]
+        position = percentile * (count + 1)
+        index = min(max(position // 100, 1), count - 1)
+        delta = position - index * 100
+        return (data[index - 1] * (100 - delta) + data[index] * delta) / 100
+
+
+class _MonotonicQueue:
+    """Queue of the samples which can still become the extreme of the window."""
+
+    __slots__ = ("_maximum", "_nan", "_queue")
+
+    def __init__(self, maximum: bool) -> None:
+        """Initialize the queue."""
+        self._maximum = maximum
+        self._queue: deque[float] = deque()
+        self._nan = 0
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the samples it supersedes."""
+        if math.isnan(value):
+            self._nan += 1
+            return
+        queue = self._queue
+        if self._maximum:
+            while queue and queue[-1] < value:
+                queue.pop()
+        else:
+            while queue and queue[-1] > value:
+                queue.pop()
+        queue.append(value)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+        if math.isnan(value):
+            self._nan -= 1
+        elif self._queue and self._queue[0] == value:
+            self._queue.popleft()
+
+    def extreme(self) -> float | None:
+        """Return the extreme of the window."""
+        if self._nan:
+            return math.nan
+        return self._queue[0] if self._queue else None
+
+
+class ValueMax(IncrementalStatistic):
+    """Maximum of the samples."""
+
+    __slots__ = ("_max",)
+
+    def __init__(self) -> None:
+        """Initialize the maximum."""
+        self._max = _MonotonicQueue(maximum=True)
+
+    def add(self, value: float) -> None:
+        """Add a sample which entered the window."""
+        self._max.add(value)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample which left the window."""
+        self._max.remove(value)
+
+    def value(self, percentile: int) -> float | None:
+        """Return the maximum of the samples."""
+        return self._max.extreme()
+
+
+class ValueMin(IncrementalStatistic):
+    """Minimum of the samples."""
+
+    __slots__ = ("_min",)
+
+    def __init__(self) -> None:
+        """Initialize the minimum."""
+        self._min = _MonotonicQueue(maximum=False)
+
+    def add(self, value: float) -> None:
+        """Add a sample which entered the window."""
+        self._min.add(value)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample which left the window."""
+        self._min.remove(value)
+
+    def value(self, percentile: int) -> float | None:
+        """Return the minimum of the samples."""
+        return self._min.extreme()
+
+
+class DistanceAbsolute(IncrementalStatistic):
+    """Difference between the maximum and minimum of the samples."""
+
+    __slots__ = ("_max", "_min")
+
+    def __init__(self) -> None:
+        """Initialize the distance."""
+        self._max = _MonotonicQueue(maximum=True)
+        self._min = _MonotonicQueue(maximum=False)
+
+    def add(self, value: float) -> None:
+        """Add a sample which entered the window."""
+        self._max.add(value)
+        self._min.add(value)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample which left the window."""
+        self._max.remove(value)
+        self._min.remove(value)
+
+    def value(self, percentile: int) -> float | None:
+        """Return the difference between the maximum and minimum."""
+        if (maximum := self._max.extreme()) is None or (
+            minimum := self._min.extreme()
+        ) is None:
+            return None
+        return maximum - minimum
@@ -59,6 +59,18 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .incremental import (
+    DistanceAbsolute,
+    IncrementalStatistic,
+    Mean,
+    Median,
+    Percentile,
+    StandardDeviation,
+    Sum,
+    ValueMax,
+    ValueMin,
+    Variance,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -455,6 +467,24 @@ STATS_NUMERIC_SUPPORT = {
     STAT_VARIANCE: _stat_variance,
 }
 
+# Statistics of a numeric source which are updated incrementally as samples
+# enter and leave the buffer, rather than recalculated from all samples
+STATS_NUMERIC_INCREMENTAL: dict[str, Callable[[], IncrementalStatistic]] = {
+    STAT_AVERAGE_TIMELESS: Mean,
+    STAT_DISTANCE_95P: lambda: StandardDeviation(2 * 1.96),
+    STAT_DISTANCE_99P: lambda: StandardDeviation(2 * 2.58),
+    STAT_DISTANCE_ABSOLUTE: DistanceAbsolute,
+    STAT_MEAN: Mean,
+    STAT_MEDIAN: Median,
+    STAT_PERCENTILE: Percentile,
+    STAT_STANDARD_DEVIATION: StandardDeviation,
+    STAT_SUM: Sum,
+    STAT_TOTAL: Sum,
+    STAT_VALUE_MAX: ValueMax,
+    STAT_VALUE_MIN: ValueMin,
+    STAT_VARIANCE: Variance,
+}
+
 # Statistics supported by a binary_sensor source
 STATS_BINARY_SUPPORT = {
     STAT_AVERAGE_STEP: _stat_binary_average_step,
@@ -698,6 +728,11 @@ class StatisticsSensor(SensorEntity):
             [deque[bool | float], deque[float], int],
             float | int | datetime | None,
         ] = _callable_characteristic_fn(state_characteristic, self.is_binary)
+        self._incremental_statistic: IncrementalStatistic | None = None
+        if not self.is_binary and (
+            incremental_factory := STATS_NUMERIC_INCREMENTAL.get(state_characteristic)
+        ):
+            self._incremental_statistic = incremental_factory()
 
         self._update_listener: CALLBACK_TYPE | None = None
         self._preview_callback: Callable[[str, Mapping[str, Any]], None] | None = None
@@ -806,9 +841,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._append_sample(new_state.state == "on")
             else:
-                self.states.append(float(new_state.state))
+                self._append_sample(float(new_state.state))
             self.ages.append(last_reported_timestamp)
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
@@ -822,6 +857,14 @@ class StatisticsSensor(SensorEntity):
 
         self._calculate_state_attributes(new_state)
 
+    def _append_sample(self, value: float | bool) -> None:
+        """Append a sample, dropping the oldest one if the buffer is full."""
+        if (incremental := self._incremental_statistic) is not None:
+            if len(self.states) == self.states.maxlen:
+                incremental.remove(self.states[0])
+            incremental.add(value)
+        self.states.append(value)
+
     def _calculate_state_attributes(self, new_state: State) -> None:
         """Set the entity state attributes."""
 
@@ -957,7 +1000,9 @@ class StatisticsSensor(SensorEntity):
                     dt_util.utc_from_timestamp(now_timestamp - self.ages[0]),
                 )
             self.ages.popleft()
-            self.states.popleft()
+            removed = self.states.popleft()
+            if self._incremental_statistic is not None:
+                self._incremental_statistic.remove(removed)
 
     @callback
     def _async_next_to_purge_timestamp(self) -> float | None:
@@ -1101,10 +1146,17 @@ class StatisticsSensor(SensorEntity):
         """Front to call the right statistical characteristics functions.
 
         One of the _stat_*() functions is represented by
-        self._state_characteristic_fn().
+        self._state_characteristic_fn(), the incremental statistic is used
+        instead when the characteristic has one.
         """
 
-        value = self._state_characteristic_fn(self.states, self.ages, self._percentile)
+        value: float | int | datetime | None
+        if self._incremental_statistic is not None:
+            value = self._incremental_statistic.value(self._percentile)
+        else:
+            value = self._state_characteristic_fn(
+                self.states, self.ages, self._percentile
+            )
         _LOGGER.debug(
             "Updating value: states: %s, ages: %s => %s", self.states, self.ages, value
         )
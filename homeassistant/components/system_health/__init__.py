@@ -16,6 +16,7 @@ from homeassistant.helpers import aiohttp_client, config_validation as cv
 from homeassistant.helpers.frame import ReportBehavior, report_usage
 from homeassistant.helpers.integration_platform import LazyIntegrationPlatforms
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.setup import async_setup_deferred_component
 from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
@@ -134,6 +135,8 @@ async def _registered_domain_data(
 
 async def get_info(hass: HomeAssistant) -> dict[str, dict[str, str]]:
     """Get the full set of system health information."""
+    # Set up system health if it is not used yet and was deferred at startup
+    await async_setup_deferred_component(hass, DOMAIN)
     domains: dict[str, dict[str, Any]] = {}
 
     async def _get_info_value(value: Any) -> Any:
@@ -1,13 +1,13 @@
 """The USB Discovery integration."""
 
 from collections.abc import Sequence
-import fnmatch
 import os
 
 from serialx import SerialPortInfo, list_serial_ports
 
 from homeassistant.helpers.service_info.usb import UsbServiceInfo
 from homeassistant.loader import USBMatcher
+from homeassistant.util.fnmatch_index import memorized_fnmatch
 
 from .models import SerialDevice, USBDevice
 
@@ -74,7 +74,7 @@ def _fnmatch_lower(name: str | None, pattern: str) -> bool:
     """Match a lowercase version of the name."""
     if name is None:
         return False
-    return fnmatch.fnmatch(name.lower(), pattern)
+    return memorized_fnmatch(name.lower(), pattern)
 
 
 def usb_device_matches_matcher(device: USBDevice, matcher: USBMatcher) -> bool:
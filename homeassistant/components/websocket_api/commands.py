@@ -119,6 +119,7 @@ def async_register_commands(
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_services_for_target)
+    async_reg(hass, handle_get_state_changes)
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_get_triggers_for_target)
     async_reg(hass, handle_manifest_get)
@@ -364,20 +365,14 @@ def _async_get_allowed_states(
 
 
 @callback
-@decorators.websocket_command({vol.Required("type"): "get_states"})
-def handle_get_states(
-    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
-) -> None:
-    """Handle get states command."""
-    states = _async_get_allowed_states(hass, connection)
-
+def _async_serialize_states(
+    connection: ActiveConnection, states: list[State]
+) -> list[bytes]:
+    """Serialize states, leaving out the states which can't be serialized."""
     try:
-        serialized_states = [state.as_dict_json for state in states]
+        return [state.as_dict_json for state in states]
     except ValueError, TypeError:
         pass
-    else:
-        _send_handle_get_states_response(connection, msg["id"], serialized_states)
-        return
 
     # If we can't serialize, we'll filter out unserializable states
     serialized_states = []
@@ -391,17 +386,70 @@ def handle_get_states(
                     find_paths_unserializable_data(state, dump=JSON_DUMP)
                 ),
             )
+    return serialized_states
 
-    _send_handle_get_states_response(connection, msg["id"], serialized_states)
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "get_states"})
+def handle_get_states(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle get states command."""
+    serialized_states = _async_serialize_states(
+        connection, _async_get_allowed_states(hass, connection)
+    )
+    connection.send_message(
+        construct_result_message(
+            msg["id"], b"".join((b"[", b",".join(serialized_states), b"]"))
+        )
+    )
 
-def _send_handle_get_states_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
+
+@callback
+@decorators.websocket_command(
+    {vol.Required("type"): "get_state_changes", vol.Required("since"): int}
+)
+def handle_get_state_changes(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Send handle get states response."""
+    """Handle get state changes command.
+
+    Returns the states changed and the entity ids removed after the
+    version returned by an earlier call. If those changes are no longer
+    known all states are returned and reset is set.
+    """
+    version = hass.states.async_version()
+    states: list[State]
+    removed: list[str]
+    if (changes := hass.states.async_changes_since(msg["since"])) is None:
+        states, removed = _async_get_allowed_states(hass, connection), []
+    else:
+        states, removed = changes
+        user = connection.user
+        if not (user.is_admin or user.permissions.access_all_entities(POLICY_READ)):
+            entity_perm = user.permissions.check_entity
+            states = [
+                state for state in states if entity_perm(state.entity_id, POLICY_READ)
+            ]
+            removed = [
+                entity_id
+                for entity_id in removed
+                if entity_perm(entity_id, POLICY_READ)
+            ]
+    serialized_states = _async_serialize_states(connection, states)
     connection.send_message(
         construct_result_message(
-            msg_id, b"".join((b"[", b",".join(serialized_states), b"]"))
+            msg["id"],
+            json_bytes(
+                {
+                    "version": version,
+                    "reset": changes is None,
+                    "changed": json_fragment(
+                        b"".join((b"[", b",".join(serialized_states), b"]"))
+                    ),
+                    "removed": removed,
+                }
+            ),
         )
     )
 
@@ -12,6 +12,7 @@ from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers.http import current_request
 from homeassistant.helpers.redact import async_redact_data
+from homeassistant.setup import async_is_setup_deferred, async_setup_deferred_component
 from homeassistant.util.json import JsonValueType
 
 from . import const, messages
@@ -231,14 +232,47 @@ class ActiveConnection:
             return
 
         if not (handler_schema := self.handlers.get(type_)):
-            self.logger.info("Received unknown command: %s", type_)
-            self.send_message(
-                messages.error_message(
-                    cur_id, const.ERR_UNKNOWN_COMMAND, "Unknown command."
+            if async_is_setup_deferred(self.hass, domain := type_.partition("/")[0]):
+                # Commands of integrations deferred at startup are handled
+                # once the integration is set up and has registered them
+                self.hass.async_create_task(
+                    self._async_handle_deferred(domain, msg),
+                    f"websocket setup deferred {domain}",
+                    eager_start=True,
                 )
+            else:
+                self._async_unknown_command(cur_id, type_)
+                return
+        else:
+            self._async_call_handler(msg, handler_schema)
+
+        self.last_id = cur_id
+
+    async def _async_handle_deferred(self, domain: str, msg: dict[str, Any]) -> None:
+        """Set up a deferred integration, then handle a message for it."""
+        await async_setup_deferred_component(self.hass, domain)
+        if handler_schema := self.handlers.get(msg["type"]):
+            self._async_call_handler(msg, handler_schema)
+        else:
+            self._async_unknown_command(msg["id"], msg["type"])
+
+    @callback
+    def _async_unknown_command(self, cur_id: int, type_: str) -> None:
+        """Send an error for a command without handler."""
+        self.logger.info("Received unknown command: %s", type_)
+        self.send_message(
+            messages.error_message(
+                cur_id, const.ERR_UNKNOWN_COMMAND, "Unknown command."
             )
-            return
+        )
 
+    @callback
+    def _async_call_handler(
+        self,
+        msg: dict[str, Any],
+        handler_schema: tuple[MessageHandler, vol.Schema | Literal[False]],
+    ) -> None:
+        """Call the handler of a message with the validated message."""
         handler, schema = handler_schema
 
         try:
@@ -251,8 +285,6 @@ class ActiveConnection:
         except Exception as err:  # noqa: BLE001
             self.async_handle_exception(msg, err)
 
-        self.last_id = cur_id
-
     @callback
     def async_handle_close(self) -> None:
         """Handle closing down connection."""
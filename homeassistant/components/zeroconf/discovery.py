@@ -2,11 +2,9 @@
 
 from collections.abc import Callable
 import contextlib
-from fnmatch import translate
-from functools import lru_cache, partial
+from functools import partial
 from ipaddress import IPv4Address, IPv6Address
 import logging
-import re
 from typing import TYPE_CHECKING, Any, Final, cast
 
 from zeroconf import BadTypeInNameException, IPVersion, ServiceStateChange
@@ -23,6 +21,11 @@ from homeassistant.helpers.service_info.zeroconf import (
     ZeroconfServiceInfo as _ZeroconfServiceInfo,
 )
 from homeassistant.loader import HomeKitDiscoveredIntegration, ZeroconfMatcher
+from homeassistant.util.fnmatch_index import (
+    FnmatchIndex,
+    is_fnmatch_pattern,
+    memorized_fnmatch,
+)
 
 from .const import DOMAIN, REQUEST_TIMEOUT
 from .models import HaZeroconf
@@ -51,47 +54,26 @@ def build_homekit_model_lookups(
     homekit_models: dict[str, HomeKitDiscoveredIntegration],
 ) -> tuple[
     dict[str, HomeKitDiscoveredIntegration],
-    dict[re.Pattern, HomeKitDiscoveredIntegration],
+    FnmatchIndex[HomeKitDiscoveredIntegration],
 ]:
     """Build lookups for homekit models."""
     homekit_model_lookup: dict[str, HomeKitDiscoveredIntegration] = {}
-    homekit_model_matchers: dict[re.Pattern, HomeKitDiscoveredIntegration] = {}
+    homekit_model_matchers: FnmatchIndex[HomeKitDiscoveredIntegration] = FnmatchIndex()
 
     for model, discovery in homekit_models.items():
-        if "*" in model or "?" in model or "[" in model:
-            homekit_model_matchers[_compile_fnmatch(model)] = discovery
+        if is_fnmatch_pattern(model):
+            homekit_model_matchers.add(model, discovery)
         else:
             homekit_model_lookup[model] = discovery
 
     return homekit_model_lookup, homekit_model_matchers
 
 
-@lru_cache(maxsize=4096, typed=True)
-def _compile_fnmatch(pattern: str) -> re.Pattern:
-    """Compile a fnmatch pattern."""
-    return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    Zeroconf has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
-
-
 def _match_against_props(matcher: dict[str, str], props: dict[str, str | None]) -> bool:
     """Check a matcher to ensure all values in props."""
     for key, value in matcher.items():
         prop_val = props.get(key)
-        if prop_val is None or not _memorized_fnmatch(prop_val.lower(), value):
+        if prop_val is None or not memorized_fnmatch(prop_val.lower(), value):
             return False
     return True
 
@@ -109,7 +91,7 @@ def is_homekit_paired(props: dict[str, Any]) -> bool:
 
 def async_get_homekit_discovery(
     homekit_model_lookups: dict[str, HomeKitDiscoveredIntegration],
-    homekit_model_matchers: dict[re.Pattern, HomeKitDiscoveredIntegration],
+    homekit_model_matchers: FnmatchIndex[HomeKitDiscoveredIntegration],
     props: dict[str, Any],
 ) -> HomeKitDiscoveredIntegration | None:
     """Handle a HomeKit discovery.
@@ -126,9 +108,8 @@ def async_get_homekit_discovery(
         if discovery := homekit_model_lookups.get(key):
             return discovery
 
-    for pattern, discovery in homekit_model_matchers.items():
-        if pattern.match(model):
-            return discovery
+    if matched := homekit_model_matchers.match(model):
+        return matched[0]
 
     return None
 
@@ -176,7 +157,7 @@ class ZeroconfDiscovery:
         zeroconf: HaZeroconf,
         zeroconf_types: dict[str, list[ZeroconfMatcher]],
         homekit_model_lookups: dict[str, HomeKitDiscoveredIntegration],
-        homekit_model_matchers: dict[re.Pattern, HomeKitDiscoveredIntegration],
+        homekit_model_matchers: FnmatchIndex[HomeKitDiscoveredIntegration],
         local_service_info: AsyncServiceInfo,
     ) -> None:
         """Init discovery."""
@@ -400,7 +381,7 @@ class ZeroconfDiscovery:
         # so not all service type exist in zeroconf_types
         for matcher in matchers:
             if len(matcher) > 1:
-                if ATTR_NAME in matcher and not _memorized_fnmatch(
+                if ATTR_NAME in matcher and not memorized_fnmatch(
                     info.name.lower(), matcher[ATTR_NAME]
                 ):
                     continue
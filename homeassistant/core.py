@@ -159,6 +159,10 @@ TIMEOUT_EVENT_START = 15
 # How long to wait until startup jobs have to finish.
 TIMEOUT_STARTUP_JOBS = 15
 
+# Number of removed entities the state machine remembers so changes
+# since a version can include them.
+MAX_REMOVED_STATE_VERSIONS = 4096
+
 
 EVENTS_EXCLUDED_FROM_MATCH_ALL = {
     EVENT_HOMEASSISTANT_CLOSE,
@@ -2200,7 +2204,17 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_bus",
+        "_changed_versions",
+        "_loop",
+        "_removed_versions",
+        "_removed_versions_since",
+        "_reservations",
+        "_states",
+        "_states_data",
+        "_version",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2211,6 +2225,16 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # The version is bumped for every changed or removed state. It starts
+        # at the current time in microseconds so versions handed out before
+        # a restart are older than any version of this run.
+        self._version = time.time_ns() // 1000
+        # Entity ids mapped to the version they last changed or were removed
+        # at, ordered by version.
+        self._changed_versions: dict[str, int] = {}
+        self._removed_versions: dict[str, int] = {}
+        # Removals before this version have been forgotten
+        self._removed_versions_since = self._version
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2281,6 +2305,35 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_version(self) -> int:
+        """Return the version of the last state change or removal."""
+        return self._version
+
+    @callback
+    def async_changes_since(self, version: int) -> tuple[list[State], list[str]] | None:
+        """Return the states changed and entity ids removed after a version.
+
+        Returns None if the version is not from this run or removals that
+        old have been forgotten, the caller needs all states in that case.
+
+        This method must be run in the event loop.
+        """
+        if not self._removed_versions_since <= version <= self._version:
+            return None
+        states_data = self._states_data
+        changed: list[State] = []
+        for entity_id, changed_version in reversed(self._changed_versions.items()):
+            if changed_version <= version:
+                break
+            changed.append(states_data[entity_id])
+        removed: list[str] = []
+        for entity_id, removed_version in reversed(self._removed_versions.items()):
+            if removed_version <= version:
+                break
+            removed.append(entity_id)
+        return changed, removed
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2323,6 +2376,14 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._version += 1
+        del self._changed_versions[entity_id]
+        removed_versions = self._removed_versions
+        if len(removed_versions) >= MAX_REMOVED_STATE_VERSIONS:
+            self._removed_versions_since = removed_versions.pop(
+                next(iter(removed_versions))
+            )
+        removed_versions[entity_id] = self._version
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2523,6 +2584,13 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        self._version += 1
+        # Reinsert to keep the versions ordered
+        if old_state is None:
+            self._removed_versions.pop(entity_id, None)
+        else:
+            del self._changed_versions[entity_id]
+        self._changed_versions[entity_id] = self._version
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
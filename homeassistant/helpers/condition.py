@@ -3,7 +3,7 @@
 import abc
 import asyncio
 from collections import deque
-from collections.abc import Callable, Container, Coroutine, Iterable, Mapping
+from collections.abc import Callable, Container, Coroutine, Hashable, Iterable, Mapping
 from dataclasses import dataclass
 from datetime import datetime, time as dt_time, timedelta
 import functools as ft
@@ -111,6 +111,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -535,8 +536,200 @@ class _HistoryPrimingManager:
                 self._flush_condition.notify_all()
 
 
+class _ConditionResultMemo:
+    """Last result of structurally identical entity conditions."""
+
+    __slots__ = ("inputs", "result", "users")
+
+    def __init__(self) -> None:
+        """Initialize the memo."""
+        self.inputs: tuple[State | None, ...] | None = None
+        self.result = False
+        self.users = 0
+
+
+class _LegacyConditionResultMemo(_ConditionResultMemo):
+    """Last result of structurally identical legacy state conditions."""
+
+    __slots__ = ("entity_traces", "version")
+
+    def __init__(self) -> None:
+        """Initialize the memo."""
+        super().__init__()
+        self.entity_traces: list[
+            tuple[str, dict[str, Any] | None, BaseException | None]
+        ] = []
+        self.version: int | None = None
+
+
+class _ConditionResultMemos:
+    """Shared condition results with hit rate statistics."""
+
+    __slots__ = ("hits", "memos", "misses")
+
+    def __init__(self) -> None:
+        """Initialize the memos."""
+        self.memos: dict[Hashable, _ConditionResultMemo] = {}
+        self.hits = 0
+        self.misses = 0
+
+
+_CONDITION_RESULT_MEMOS: HassKey[_ConditionResultMemos] = HassKey(
+    "condition_result_memos"
+)
+
+
+def _freeze_config(value: Any) -> Hashable:
+    """Return a hashable representation of a condition config."""
+    if isinstance(value, Mapping):
+        return frozenset((key, _freeze_config(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze_config(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_config(item) for item in value)
+    return value
+
+
+@callback
+def _async_acquire_condition_memo[_MemoT: _ConditionResultMemo](
+    hass: HomeAssistant, memo_key: Hashable, memo_cls: type[_MemoT]
+) -> _MemoT:
+    """Return the shared memo of a condition, creating it if needed."""
+    memos = hass.data.setdefault(_CONDITION_RESULT_MEMOS, _ConditionResultMemos())
+    if (memo := memos.memos.get(memo_key)) is None:
+        memo = memos.memos[memo_key] = memo_cls()
+    memo.users += 1
+    return cast(_MemoT, memo)
+
+
+@callback
+def _async_release_condition_memo(
+    hass: HomeAssistant, memo_key: Hashable, memo: _ConditionResultMemo
+) -> None:
+    """Release the shared memo of a condition, removing it if unused."""
+    memo.users -= 1
+    if not memo.users:
+        del hass.data[_CONDITION_RESULT_MEMOS].memos[memo_key]
+
+
+@callback
+def async_get_condition_memo_stats(hass: HomeAssistant) -> dict[str, int]:
+    """Return hit rate statistics of the shared condition results."""
+    if (memos := hass.data.get(_CONDITION_RESULT_MEMOS)) is None:
+        return {"conditions": 0, "hits": 0, "misses": 0}
+    return {
+        "conditions": len(memos.memos),
+        "hits": memos.hits,
+        "misses": memos.misses,
+    }
+
+
+# Config keys the result of legacy conditions without templates or a duration
+# depends on, besides the states
+_LEGACY_CONDITION_MEMO_CONFIG_KEYS: Final[dict[str, tuple[str, ...]]] = {
+    "numeric_state": (CONF_ENTITY_ID, CONF_ATTRIBUTE, CONF_ABOVE, CONF_BELOW),
+    "state": (CONF_ENTITY_ID, CONF_STATE, CONF_ATTRIBUTE, CONF_MATCH),
+}
+
+
+def _legacy_condition_memo_key(config: ConfigType) -> Hashable | None:
+    """Return the memo key of a legacy condition, if its result can be shared."""
+    if CONF_FOR in config or CONF_VALUE_TEMPLATE in config:
+        return None
+    condition_key: str = config[CONF_CONDITION]
+    if (config_keys := _LEGACY_CONDITION_MEMO_CONFIG_KEYS.get(condition_key)) is None:
+        return None
+    memo_key = (
+        condition_key,
+        *(_freeze_config(config.get(config_key)) for config_key in config_keys),
+    )
+    try:
+        hash(memo_key)
+    except TypeError:
+        return None
+    return memo_key
+
+
+class _MemoizedLegacyConditionChecker(LegacyConditionChecker):
+    """Legacy condition checker sharing the result of identical conditions.
+
+    State and numeric state conditions without templates or a duration only
+    depend on states, so their last result is reused until the version of the
+    state machine changes. The traces of the checked entities are replayed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        checker: ConditionCheckerType,
+        memo_key: Hashable,
+        entity_count: int,
+    ) -> None:
+        """Initialize condition checker."""
+        super().__init__(hass, checker)
+        self._memo_key = memo_key
+        self._entity_count = entity_count
+        self._memo: _LegacyConditionResultMemo | None = None
+
+    @override
+    async def _async_setup(self) -> None:
+        """Register the shared memo."""
+        self._memo = _async_acquire_condition_memo(
+            self._hass, self._memo_key, _LegacyConditionResultMemo
+        )
+
+    @override
+    def _async_unload(self) -> None:
+        """Release the shared memo."""
+        if (memo := self._memo) is not None:
+            self._memo = None
+            _async_release_condition_memo(self._hass, self._memo_key, memo)
+
+    @override
+    def _async_check(self, variables: TemplateVarsType = None, **kwargs: Any) -> bool:
+        if (memo := self._memo) is None:
+            return self._checker(self._hass, variables)
+        memos = self._hass.data[_CONDITION_RESULT_MEMOS]
+        version = self._hass.states.async_version()
+        if memo.version == version:
+            memos.hits += 1
+            for path, result, error in memo.entity_traces:
+                trace_element = condition_trace_append(variables, path)
+                if error is not None:
+                    trace_element.set_error(error)
+                if result is not None:
+                    trace_element.set_result(**result)
+            return memo.result
+
+        memos.misses += 1
+        # Forget the last result in case the check raises
+        memo.version = None
+        paths: list[str] = []
+        for index in range(self._entity_count):
+            with trace_path(["entity_id", str(index)]):
+                paths.append(trace_path_get())
+        trace = trace_cv.get() or {}
+        last_elements = {path: trace[path][-1] for path in paths if trace.get(path)}
+        result = self._checker(self._hass, variables)
+        trace = trace_cv.get() or {}
+        memo.entity_traces = [
+            (path, trace_element.result, trace_element.error)
+            for path in paths
+            if (trace_elements := trace.get(path))
+            and (trace_element := trace_elements[-1]) is not last_elements.get(path)
+        ]
+        memo.result = result
+        memo.version = version
+        return result
+
+
 class EntityConditionBase(Condition):
-    """Base class for entity conditions."""
+    """Base class for entity conditions.
+
+    Conditions without a duration only depend on the states of their
+    entities, so structurally identical conditions share a memo of their
+    last result which is reused as long as the same states are checked.
+    """
 
     _domain_specs: Mapping[str, DomainSpec]
     _excluded_states: Final[frozenset[str]] = frozenset(
@@ -576,6 +769,20 @@ class EntityConditionBase(Condition):
         # the priming, except that an invalidation removes it (the run broke, so
         # the in-flight history is stale and live tracking takes over).
         self._priming: set[str] = set()
+        self._memo: _ConditionResultMemo | None = None
+        self._memo_key: Hashable | None = None
+        if not self._duration:
+            try:
+                memo_key = (
+                    type(self),
+                    _freeze_config(config.target),
+                    _freeze_config(config.options),
+                )
+                hash(memo_key)
+            except TypeError:
+                pass
+            else:
+                self._memo_key = memo_key
 
     def entity_filter(self, entities: set[str]) -> set[str]:
         """Filter entities matching any of the domain specs."""
@@ -631,9 +838,17 @@ class EntityConditionBase(Condition):
             self._priming.discard(entity_id)
             self._valid_since.pop(entity_id, None)
 
+    def _memo_inputs(self) -> tuple[State | None, ...]:
+        """Return states besides the targeted entities the result depends on."""
+        return ()
+
     @override
     async def _async_setup(self) -> None:
         """Set up state tracking for duration-based conditions."""
+        if self._memo_key is not None:
+            self._memo = _async_acquire_condition_memo(
+                self._hass, self._memo_key, _ConditionResultMemo
+            )
         if not self._duration or not self._needs_duration_tracking:
             return
 
@@ -807,6 +1022,9 @@ class EntityConditionBase(Condition):
         for cb in self._on_unload:
             cb()
         self._on_unload.clear()
+        if (memo := self._memo) is not None:
+            self._memo = None
+            _async_release_condition_memo(self._hass, self._memo_key, memo)
 
     def _should_include(self, _state: State) -> bool:
         """Check if an entity should participate in any/all checks.
@@ -877,7 +1095,21 @@ class EntityConditionBase(Condition):
             if (_state := self._hass.states.get(entity_id))
             and self._should_include(_state)
         ]
-        return self._matcher(entity_states)
+        if (memo := self._memo) is None:
+            return self._matcher(entity_states)
+        memos = self._hass.data[_CONDITION_RESULT_MEMOS]
+        inputs = (*entity_states, *self._memo_inputs())
+        if (
+            (memo_inputs := memo.inputs) is not None
+            and len(memo_inputs) == len(inputs)
+            and all(a is b for a, b in zip(memo_inputs, inputs, strict=True))
+        ):
+            memos.hits += 1
+            return memo.result
+        memos.misses += 1
+        memo.result = self._matcher(entity_states)
+        memo.inputs = inputs
+        return memo.result
 
 
 class EntityStateConditionBase(EntityConditionBase):
@@ -976,6 +1208,21 @@ class EntityNumericalConditionBase(EntityConditionBase):
             threshold_options.get("value_max")
         )
         self._threshold_type = threshold_options["type"]
+        self._threshold_entity_ids: tuple[str, ...] = tuple(
+            threshold.entity
+            for threshold in (
+                self.threshold,
+                self.lower_threshold,
+                self.upper_threshold,
+            )
+            if threshold is not None and threshold.entity is not None
+        )
+
+    @override
+    def _memo_inputs(self) -> tuple[State | None, ...]:
+        """Return the states of the threshold entities."""
+        get_state = self._hass.states.get
+        return tuple(get_state(entity_id) for entity_id in self._threshold_entity_ids)
 
     def _is_valid_unit(self, unit: str | None) -> bool:
         """Check if the given unit is valid for this condition."""
@@ -1387,7 +1634,12 @@ async def async_from_config(
     else:
         checker = factory(config)
     if not isinstance(checker, ConditionChecker):
-        checker = LegacyConditionChecker(hass, checker)
+        if (memo_key := _legacy_condition_memo_key(config)) is None:
+            checker = LegacyConditionChecker(hass, checker)
+        else:
+            checker = _MemoizedLegacyConditionChecker(
+                hass, checker, memo_key, len(config.get(CONF_ENTITY_ID, []))
+            )
     await checker.async_setup()
     return checker
 
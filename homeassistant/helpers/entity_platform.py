@@ -5,6 +5,7 @@ from collections.abc import Awaitable, Callable, Coroutine, Iterable, Mapping
 from contextvars import ContextVar
 from datetime import timedelta
 from logging import Logger, getLogger
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Protocol, overload, override
 
 from homeassistant import config_entries
@@ -42,6 +43,7 @@ from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntr
 from .event import async_call_later
 from .frame import report_usage
 from .issue_registry import IssueSeverity, async_create_issue
+from .poll_scheduler import async_get_poll_scheduler
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
@@ -67,11 +69,70 @@ DATA_DOMAIN_ENTITIES: HassKey[dict[str, dict[str, Entity]]] = HassKey("domain_en
 DATA_DOMAIN_PLATFORM_ENTITIES: HassKey[dict[tuple[str, str], dict[str, Entity]]] = (
     HassKey("domain_platform_entities")
 )
+DATA_ADD_ENTITIES_TIMES: HassKey[dict[str, dict[str, dict[str, float]]]] = HassKey(
+    "add_entities_times"
+)
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = getLogger(__name__)
 
 
+@callback
+def async_get_add_entities_times(
+    hass: HomeAssistant, integration: str
+) -> Mapping[str, dict[str, float]]:
+    """Return the number of entities added and the time it took per platform."""
+    return hass.data.get(DATA_ADD_ENTITIES_TIMES, {}).get(integration, {})
+
+
+class _AddEntitiesBatch:
+    """Entities added by one async_add_entities call.
+
+    Entities of a platform tend to share the device info of a handful of
+    devices. A device info equal to the one last resolved for the same
+    device is not resolved by the device registry again.
+    """
+
+    __slots__ = ("_device_registry", "_devices", "seconds")
+
+    def __init__(self, device_registry: dr.DeviceRegistry) -> None:
+        """Initialize the batch."""
+        self._device_registry = device_registry
+        self._devices: dict[frozenset[tuple[str, str]], tuple[dr.DeviceInfo, str]] = {}
+        # Time spent adding the entities, not counting update_before_add
+        self.seconds = 0.0
+
+    @callback
+    def async_get_or_create_device(
+        self,
+        config_entry_id: str,
+        config_subentry_id: str | None,
+        device_info: dr.DeviceInfo,
+    ) -> dr.DeviceEntry:
+        """Get or create the device of a device info."""
+        key = frozenset(device_info.get("identifiers") or ()).union(
+            device_info.get("connections") or ()
+        )
+        if (
+            (resolved := self._devices.get(key))
+            and resolved[0] == device_info
+            and (device := self._device_registry.async_get(resolved[1]))
+        ):
+            return device
+        device = self._device_registry.async_get_or_create(
+            config_entry_id=config_entry_id,
+            config_subentry_id=config_subentry_id,
+            **device_info,
+        )
+        # A via device which is not registered yet may be added later in the
+        # batch, so the device info is resolved again until it is linked
+        if device_info.get("via_device") is None or device.via_device_id is not None:
+            self._devices[key] = (device_info.copy(), device.id)
+        else:
+            self._devices.pop(key, None)
+        return device
+
+
 @callback
 def async_create_platform_config_not_supported_issue(
     hass: HomeAssistant,
@@ -300,6 +361,9 @@ class EntityPlatform:
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
 
+        self.parallel_service_calls: asyncio.Semaphore | None = None
+        self.parallel_service_calls_created = platform is None
+
         # Storage for entities indexed by domain
         # with the child dict indexed by entity_id
         #
@@ -367,6 +431,41 @@ class EntityPlatform:
 
         return self.parallel_updates
 
+    @callback
+    def async_get_parallel_service_calls_semaphore(self) -> asyncio.Semaphore | None:
+        """Get or create a semaphore for parallel entity service calls.
+
+        Platforms that talk to a hub with a limited request capacity can set
+        PARALLEL_SERVICE_CALLS to the number of entity service calls that may
+        run at the same time. The semaphore is shared by all platforms set up
+        from the same config entry, so a call targeting the lights, switches
+        and covers of one bridge is limited as a whole. It is applied on top
+        of PARALLEL_UPDATES.
+        """
+        if self.parallel_service_calls_created:
+            return self.parallel_service_calls
+
+        self.parallel_service_calls_created = True
+
+        if not (
+            parallel_service_calls := getattr(
+                self.platform, "PARALLEL_SERVICE_CALLS", None
+            )
+        ):
+            return None
+
+        if self.config_entry is not None:
+            for platform in async_get_platforms(self.hass, self.platform_name):
+                if (
+                    platform.config_entry is self.config_entry
+                    and platform.parallel_service_calls is not None
+                ):
+                    self.parallel_service_calls = platform.parallel_service_calls
+                    return self.parallel_service_calls
+
+        self.parallel_service_calls = asyncio.Semaphore(parallel_service_calls)
+        return self.parallel_service_calls
+
     async def async_setup(
         self,
         platform_config: ConfigType,
@@ -655,6 +754,7 @@ class EntityPlatform:
         self,
         entities: list[Entity],
         timeout: float,
+        batch: _AddEntitiesBatch,
         config_subentry_id: str | None,
     ) -> None:
         """Add entities for a single platform and update them.
@@ -672,7 +772,7 @@ class EntityPlatform:
                     *(
                         create_eager_task(
                             self._async_add_entity(
-                                entity, True, entity_registry, config_subentry_id
+                                entity, True, entity_registry, batch, config_subentry_id
                             ),
                             loop=self.hass.loop,
                         )
@@ -708,6 +808,7 @@ class EntityPlatform:
         self,
         entities: list[Entity],
         timeout: float,
+        batch: _AddEntitiesBatch,
         config_subentry_id: str | None,
     ) -> None:
         """Add entities for a single platform without updating.
@@ -723,7 +824,7 @@ class EntityPlatform:
                 for entity in entities:
                     try:
                         await self._async_add_entity(
-                            entity, False, entity_registry, config_subentry_id
+                            entity, False, entity_registry, batch, config_subentry_id
                         )
                     except Exception as ex:
                         self.logger.exception(
@@ -768,12 +869,14 @@ class EntityPlatform:
             new_entities if type(new_entities) is list else list(new_entities)
         )
         timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(entities), SLOW_ADD_MIN_TIMEOUT)
+        batch = _AddEntitiesBatch(dr.async_get(self.hass))
         if update_before_add:
             await self._async_add_and_update_entities(
-                entities, timeout, config_subentry_id
+                entities, timeout, batch, config_subentry_id
             )
         else:
-            await self._async_add_entities(entities, timeout, config_subentry_id)
+            await self._async_add_entities(entities, timeout, batch, config_subentry_id)
+        self._async_record_add_entities_time(len(entities), batch.seconds)
 
         if (
             (self.config_entry and self.config_entry.pref_disable_polling)
@@ -791,18 +894,40 @@ class EntityPlatform:
         ):
             return
 
+        scan_interval = self.scan_interval_seconds
+        if self.hass.state is not CoreState.running:
+            # Platforms set up during startup would otherwise keep
+            # polling in the same second, spread them over the interval.
+            scan_interval = async_get_poll_scheduler(self.hass).async_spread_delay(
+                scan_interval
+            )
+        self._async_schedule_polling(scan_interval)
+
+    @callback
+    def _async_record_add_entities_time(self, count: int, seconds: float) -> None:
+        """Record the number of entities added and the time it took."""
+        times = (
+            self.hass.data.setdefault(DATA_ADD_ENTITIES_TIMES, {})
+            .setdefault(self.platform_name, {})
+            .setdefault(self.domain, {"entities": 0, "seconds": 0.0})
+        )
+        times["entities"] += count
+        times["seconds"] += seconds
+
+    @callback
+    def _async_schedule_polling(self, delay: float) -> None:
+        """Schedule the next poll of the entities."""
         self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
+            delay, self._async_handle_interval_callback
+        )
+        async_get_poll_scheduler(self.hass).async_scheduled(
+            self, self._async_polling_timer.when()
         )
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
+        self._async_schedule_polling(self.scan_interval_seconds)
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
@@ -833,14 +958,32 @@ class EntityPlatform:
                 already_exists = True
         return (already_exists, restored)
 
-    async def _async_add_entity(  # noqa: C901
+    async def _async_add_entity(
         self,
         entity: Entity,
         update_before_add: bool,
         entity_registry: EntityRegistry,
+        batch: _AddEntitiesBatch,
         config_subentry_id: str | None,
     ) -> None:
         """Add an entity to the platform."""
+        start = monotonic()
+        try:
+            await self._async_add_entity_to_platform(
+                entity, update_before_add, entity_registry, batch, config_subentry_id
+            )
+        finally:
+            batch.seconds += monotonic() - start
+
+    async def _async_add_entity_to_platform(  # noqa: C901
+        self,
+        entity: Entity,
+        update_before_add: bool,
+        entity_registry: EntityRegistry,
+        batch: _AddEntitiesBatch,
+        config_subentry_id: str | None,
+    ) -> None:
+        """Add an entity to the platform, updating it first if requested."""
         if entity is None:
             raise ValueError("Entity cannot be None")
 
@@ -853,12 +996,16 @@ class EntityPlatform:
         # Update properties before we generate the entity_id. This will happen
         # also for disabled entities.
         if update_before_add:
+            update_start = monotonic()
             try:
                 await entity.async_device_update(warning=False)
             except Exception:
                 self.logger.exception("%s: Error on device update!", self.platform_name)
                 entity.add_to_platform_abort()
                 return
+            finally:
+                # The update is I/O of the integration, not part of adding
+                batch.seconds -= monotonic() - update_start
 
         entity_name = entity.name
         if entity_name is UNDEFINED:
@@ -937,10 +1084,8 @@ class EntityPlatform:
             if self.config_entry:
                 if device_info := entity.device_info:
                     try:
-                        device = dr.async_get(self.hass).async_get_or_create(
-                            config_entry_id=self.config_entry.entry_id,
-                            config_subentry_id=config_subentry_id,
-                            **device_info,
+                        device = batch.async_get_or_create_device(
+                            self.config_entry.entry_id, config_subentry_id, device_info
                         )
                     except dr.DeviceInfoError as exc:
                         self.logger.error(
@@ -1115,6 +1260,7 @@ class EntityPlatform:
         if self._async_polling_timer is not None:
             self._async_polling_timer.cancel()
             self._async_polling_timer = None
+            async_get_poll_scheduler(self.hass).async_unscheduled(self)
 
     @callback
     def async_prepare(self) -> None:
@@ -73,6 +73,9 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_SHARED_TEMPLATE_RENDERS: HassKey[_SharedTemplateRenders] = HassKey(
+    "shared_template_renders"
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -951,6 +954,52 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _SharedTemplateRenders:
+    """Share renders of identical templates between template trackers.
+
+    Trackers which re-render an identical template without variables for
+    the same state change get the render of the first tracker. A render is
+    only shared until the next state change, renders depending on the time
+    are not shared.
+    """
+
+    __slots__ = ("_event", "_infos", "_states", "_version")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared renders."""
+        self._states = hass.states
+        self._event: Event[EventStateChangedData] | None = None
+        self._version = 0
+        self._infos: dict[Template, RenderInfo] = {}
+
+    @callback
+    def async_render_to_info(
+        self, template: Template, event: Event[EventStateChangedData]
+    ) -> RenderInfo:
+        """Render the template or return the render shared for the event."""
+        version = self._states.async_version()
+        if event is not self._event or version != self._version:
+            self._infos.clear()
+            self._event = event
+            self._version = version
+        elif (info := self._infos.get(template)) is not None:
+            return info
+        info = template.async_render_to_info()
+        if not info.has_time:
+            self._infos[template] = info
+        return info
+
+
+@callback
+def _async_get_shared_template_renders(hass: HomeAssistant) -> _SharedTemplateRenders:
+    """Return the template renders shared between trackers."""
+    if (shared_renders := hass.data.get(_SHARED_TEMPLATE_RENDERS)) is None:
+        shared_renders = hass.data[_SHARED_TEMPLATE_RENDERS] = _SharedTemplateRenders(
+            hass
+        )
+    return shared_renders
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -972,6 +1021,7 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        self._shared_renders = _async_get_shared_template_renders(hass)
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
@@ -1139,9 +1189,11 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        if event is None or track_template_.variables:
+            info = template.async_render_to_info(track_template_.variables)
+        else:
+            info = self._shared_renders.async_render_to_info(template, event)
+        self._info[template] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -0,0 +1,79 @@
+"""Helper to spread polling of coordinators and entity platforms."""
+
+import asyncio
+from collections import Counter
+import math
+from random import random
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+DATA_POLL_SCHEDULER: HassKey[PollScheduler] = HassKey("poll_scheduler")
+
+
+class PollScheduler:
+    """Keep track of when pollers run next and find quiet seconds for them.
+
+    Coordinators and entity platforms set up at the same time during startup
+    would otherwise keep polling in phase and all hit the event loop and the
+    network in the same second every interval.
+    """
+
+    __slots__ = ("_loop", "_scheduled")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the poll scheduler."""
+        self._loop = loop
+        self._scheduled: dict[object, float] = {}
+
+    @callback
+    def async_scheduled(self, poller: object, when: float) -> None:
+        """Record the loop time a poller runs next."""
+        self._scheduled[poller] = when
+
+    @callback
+    def async_unscheduled(self, poller: object) -> None:
+        """Forget a poller which is no longer scheduled."""
+        self._scheduled.pop(poller, None)
+
+    @callback
+    def async_spread_delay(self, interval: float) -> float:
+        """Return a delay which spreads the first poll over the interval.
+
+        The quietest whole second in the second half of the interval is
+        picked, ties are broken randomly. The delay is never shorter than
+        half the interval so pollers never run more than twice as often as
+        requested.
+        """
+        earliest = max(math.ceil(interval / 2), 1)
+        latest = math.floor(interval)
+        if latest <= earliest:
+            return interval
+        load = self.async_load_per_second()
+        return float(
+            min(
+                range(earliest, latest + 1),
+                key=lambda second: (load.get(second, 0), random()),
+            )
+        )
+
+    @callback
+    def async_load_per_second(self) -> dict[int, int]:
+        """Return the number of pollers scheduled per second from now."""
+        now = self._loop.time()
+        return dict(
+            sorted(
+                Counter(
+                    int(when - now) for when in self._scheduled.values() if when >= now
+                ).items()
+            )
+        )
+
+
+@callback
+@singleton(DATA_POLL_SCHEDULER)
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Get the poll scheduler."""
+    return PollScheduler(hass.loop)
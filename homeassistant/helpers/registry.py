@@ -21,6 +21,13 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
 
     data: dict[str, _DataT]
 
+    def __init__(self) -> None:
+        """Initialize the container."""
+        # Incremented on every change so derived lookups can detect
+        # that they are stale without listening to registry events.
+        self.generation = 0
+        super().__init__()
+
     @override
     def values(self) -> ValuesView[_DataT]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -38,6 +45,7 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     def __setitem__(self, key: str, entry: _DataT) -> None:
         """Add an item."""
         data = self.data
+        self.generation += 1
         if key in data:
             self._unindex_entry(key, entry)
         data[key] = entry
@@ -60,6 +68,7 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     @override
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
+        self.generation += 1
         self._unindex_entry(key)
         super().__delitem__(key)
 
@@ -540,7 +540,7 @@ class _ScriptRun:
 
         with trace_path(str(self._step)):
             async with trace_action(
-                self._hass, self, self._stop, self._variables.non_parallel_scope
+                self._hass, self, self._stop, self._variables.non_parallel_snapshot()
             ) as trace_element:
                 if self._stop.done():
                     return
@@ -579,7 +579,9 @@ class _ScriptRun:
                         self._log_exceptions or log_exceptions,
                     )
                 finally:
-                    trace_element.update_variables(self._variables.non_parallel_scope)
+                    trace_element.update_variables(
+                        self._variables.non_parallel_snapshot()
+                    )
 
     def _finish(self) -> None:
         self._script._runs.remove(self)  # noqa: SLF001
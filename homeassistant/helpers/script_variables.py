@@ -3,6 +3,7 @@
 from collections import ChainMap, UserDict
 from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, cast, override
 
 from homeassistant.core import HomeAssistant, callback
@@ -107,6 +108,22 @@ class _ParallelData:
     outer_scope_writes: dict[str, Any] = field(default_factory=dict)
 
 
+class _ScopeSnapshots:
+    """Flat copies of scopes, shared by all scopes of a script run.
+
+    The copies are dropped whenever a variable is assigned anywhere in the
+    run, so they can be reused by each step until then.
+    """
+
+    __slots__ = ("snapshots",)
+
+    def __init__(self) -> None:
+        """Initialize the snapshots."""
+        self.snapshots: dict[
+            int, tuple[ChainMap[str, Any], MappingProxyType[str, Any]]
+        ] = {}
+
+
 @dataclass(kw_only=True)
 class ScriptRunVariables(UserDict[str, Any]):
     """Class to hold script run variables.
@@ -137,6 +154,9 @@ class ScriptRunVariables(UserDict[str, Any]):
     # _full_scope includes all scopes (all the way to the top-level)
     _full_scope: ChainMap[str, Any]
 
+    # _snapshots is shared by all scopes in the chain
+    _snapshots: _ScopeSnapshots = field(default_factory=_ScopeSnapshots)
+
     @classmethod
     def create_top_level(
         cls,
@@ -184,6 +204,7 @@ class ScriptRunVariables(UserDict[str, Any]):
             _parallel_data=parallel_data,
             _non_parallel_scope=non_parallel_scope,
             _full_scope=full_scope,
+            _snapshots=self._snapshots,
         )
 
     def exit_scope(self) -> ScriptRunVariables:
@@ -203,10 +224,12 @@ class ScriptRunVariables(UserDict[str, Any]):
     @override
     def __setitem__(self, key: str, value: Any) -> None:
         """Assign value to a variable."""
+        self._snapshots.snapshots.clear()
         self._assign(key, value, parallel_protected=False)
 
     def assign_parallel_protected(self, key: str, value: Any) -> None:
         """Assign value to a variable which is to be protected in parallel sequences."""
+        self._snapshots.snapshots.clear()
         self._assign(key, value, parallel_protected=True)
 
     def _assign(self, key: str, value: Any, *, parallel_protected: bool) -> None:
@@ -239,6 +262,7 @@ class ScriptRunVariables(UserDict[str, Any]):
 
     def define_local(self, key: str, value: Any) -> None:
         """Define a local variable and assign value to it."""
+        self._snapshots.snapshots.clear()
         if self._local_data is None:
             self._local_data = {}
             self._non_parallel_scope = self._non_parallel_scope.new_child(
@@ -261,6 +285,20 @@ class ScriptRunVariables(UserDict[str, Any]):
         """Return variables in non-parallel scope."""
         return self._non_parallel_scope
 
+    def non_parallel_snapshot(self) -> Mapping[str, Any]:
+        """Return a read-only flat copy of the variables in non-parallel scope.
+
+        The copy is shared with other scopes of the run which see the same
+        variables, until a variable is assigned.
+        """
+        scope = self._non_parallel_scope
+        snapshots = self._snapshots.snapshots
+        if (cached := snapshots.get(id(scope))) is not None and cached[0] is scope:
+            return cached[1]
+        snapshot = MappingProxyType(dict(scope))
+        snapshots[id(scope)] = (scope, snapshot)
+        return snapshot
+
     @property
     def local_scope(self) -> Mapping[str, Any]:
         """Return variables in local scope."""
@@ -6,6 +6,7 @@ from enum import Enum
 from functools import cache, partial
 import inspect
 import logging
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, cast
 
@@ -76,6 +77,9 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+DATA_ENTITY_SERVICE_CALL_STATS: HassKey[dict[str, dict[str, float]]] = HassKey(
+    "entity_service_call_stats"
+)
 
 
 @cache
@@ -766,6 +770,51 @@ async def _resolve_entity_service_call_entities(
     return entities
 
 
+@callback
+def async_get_entity_service_call_stats(
+    hass: HomeAssistant, entry_id: str
+) -> dict[str, float]:
+    """Return the entity service calls handled for a config entry and their times.
+
+    The queue time is the time calls waited for the PARALLEL_SERVICE_CALLS
+    limit of the config entry, the call time is the time after that.
+    """
+    if (
+        stats := hass.data.get(DATA_ENTITY_SERVICE_CALL_STATS, {}).get(entry_id)
+    ) is None:
+        return {}
+    calls = stats["calls"]
+    return {
+        "calls": calls,
+        "mean_seconds": stats["seconds"] / calls,
+        "max_seconds": stats["max_seconds"],
+        "mean_queue_seconds": stats["queue_seconds"] / calls,
+        "max_queue_seconds": stats["max_queue_seconds"],
+    }
+
+
+@callback
+def _async_record_entity_service_call(
+    hass: HomeAssistant, entry_id: str, queue_seconds: float, seconds: float
+) -> None:
+    """Record the times of an entity service call for a config entry."""
+    stats = hass.data.setdefault(DATA_ENTITY_SERVICE_CALL_STATS, {}).setdefault(
+        entry_id,
+        {
+            "calls": 0,
+            "seconds": 0.0,
+            "max_seconds": 0.0,
+            "queue_seconds": 0.0,
+            "max_queue_seconds": 0.0,
+        },
+    )
+    stats["calls"] += 1
+    stats["seconds"] += seconds
+    stats["max_seconds"] = max(stats["max_seconds"], seconds)
+    stats["queue_seconds"] += queue_seconds
+    stats["max_queue_seconds"] = max(stats["max_queue_seconds"], queue_seconds)
+
+
 async def _async_handle_entity_calls(
     entity_calls: list[tuple[Entity, Coroutine[Any, Any, ServiceResponse]]],
     *,
@@ -779,25 +828,84 @@ async def _async_handle_entity_calls(
         entity.async_set_context(context)
         return await coro
 
+    async def _timed_request_call(
+        entity: Entity,
+        coro: Coroutine[Any, Any, ServiceResponse],
+        entry_id: str,
+        start: float,
+    ) -> ServiceResponse:
+        queued = time.monotonic()
+        try:
+            return await entity.async_request_call(_with_context(entity, coro))
+        finally:
+            _async_record_entity_service_call(
+                entity.hass, entry_id, queued - start, time.monotonic() - queued
+            )
+
+    async def _request_call(
+        entity: Entity, coro: Coroutine[Any, Any, ServiceResponse]
+    ) -> ServiceResponse:
+        if (platform := entity.platform) is None:
+            return await entity.async_request_call(_with_context(entity, coro))
+        semaphore = platform.async_get_parallel_service_calls_semaphore()
+        if (config_entry := platform.config_entry) is None:
+            if semaphore is None:
+                return await entity.async_request_call(_with_context(entity, coro))
+            async with semaphore:
+                return await entity.async_request_call(_with_context(entity, coro))
+        start = time.monotonic()
+        if semaphore is None:
+            return await _timed_request_call(entity, coro, config_entry.entry_id, start)
+        async with semaphore:
+            return await _timed_request_call(entity, coro, config_entry.entry_id, start)
+
     if len(entity_calls) == 1:
         # Single entity case avoids creating task
         entity, coro = entity_calls[0]
-        single_result = await entity.async_request_call(_with_context(entity, coro))
+        single_result = await _request_call(entity, coro)
         if entity.should_poll:
             # Context can expire, so set it again before we update
             entity.async_set_context(context)
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_result}
 
-    entities = [entity for entity, _ in entity_calls]
-    results: list[ServiceResponse | BaseException] = await asyncio.gather(
-        *[
-            entity.async_request_call(_with_context(entity, coro))
-            for entity, coro in entity_calls
-        ],
-        return_exceptions=True,
-    )
+    # Calls are grouped by the config entry (the hub) they are sent to
+    # so the time each hub takes to handle its calls can be logged
+    hub_calls: dict[str | None, list[int]] = {}
+    for idx, (entity, _) in enumerate(entity_calls):
+        config_entry = entity.platform.config_entry if entity.platform else None
+        hub_calls.setdefault(
+            config_entry.entry_id if config_entry else None, []
+        ).append(idx)
+
+    results: list[ServiceResponse | BaseException] = [None] * len(entity_calls)
+
+    async def _hub_request_calls(entry_id: str | None, indexes: list[int]) -> None:
+        start = time.monotonic()
+        hub_results: list[ServiceResponse | BaseException] = await asyncio.gather(
+            *[_request_call(*entity_calls[idx]) for idx in indexes],
+            return_exceptions=True,
+        )
+        for idx, result in zip(indexes, hub_results, strict=True):
+            results[idx] = result
+        _LOGGER.debug(
+            "Entity service call to %s entities of config entry %s took %.3f seconds",
+            len(indexes),
+            entry_id,
+            time.monotonic() - start,
+        )
+
+    if len(hub_calls) == 1:
+        await _hub_request_calls(*next(iter(hub_calls.items())))
+    else:
+        await asyncio.gather(
+            *[
+                _hub_request_calls(entry_id, indexes)
+                for entry_id, indexes in hub_calls.items()
+            ]
+        )
 
+    entities = [entity for entity, _ in entity_calls]
     response_data: EntityServiceResponse = {}
     for entity, result in zip(entities, results, strict=True):
         if isinstance(result, BaseException):
@@ -8,6 +8,8 @@ import logging
 from logging import Logger
 from typing import Any, TypeGuard, override
 
+from lru import LRU
+
 from homeassistant.const import (
     ATTR_AREA_ID,
     ATTR_DEVICE_ID,
@@ -25,6 +27,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.hass_dict import HassKey
 
 from . import (
     area_registry as ar,
@@ -37,10 +40,24 @@ from . import (
 )
 from .deprecation import deprecated_class
 from .event import async_track_state_change_event
+from .registry import BaseRegistryItems
 from .typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
+MAX_CACHED_REGISTRY_TARGETS = 256
+
+type _RegistryTargetKey = tuple[
+    frozenset[str], frozenset[str], frozenset[str], frozenset[str], bool
+]
+type _RegistryTargetCacheEntry = tuple[
+    tuple[BaseRegistryItems[Any], ...], tuple[int, ...], SelectedEntities
+]
+
+_REGISTRY_TARGET_CACHE: HassKey[LRU[_RegistryTargetKey, _RegistryTargetCacheEntry]] = (
+    HassKey("registry_target_cache")
+)
+
 
 @dataclasses.dataclass(slots=True, frozen=True)
 class TargetStateChangedData:
@@ -191,6 +208,83 @@ def async_extract_referenced_entity_ids(
     ):
         return selected
 
+    registry_selected = _async_get_registry_targets(
+        hass, target_selection, primary_entities_only
+    )
+    selected.indirectly_referenced.update(registry_selected.indirectly_referenced)
+    selected.missing_devices.update(registry_selected.missing_devices)
+    selected.missing_areas.update(registry_selected.missing_areas)
+    selected.missing_floors.update(registry_selected.missing_floors)
+    selected.missing_labels.update(registry_selected.missing_labels)
+    selected.referenced_devices.update(registry_selected.referenced_devices)
+    selected.referenced_areas.update(registry_selected.referenced_areas)
+
+    return selected
+
+
+@callback
+def _async_get_registry_targets(
+    hass: HomeAssistant,
+    target_selection: TargetSelection,
+    primary_entities_only: bool,
+) -> SelectedEntities:
+    """Return the cached registry resolution of a target selection.
+
+    Resolving floors, areas, labels and devices to entities walks several
+    registry indexes. The result only depends on the registries, so it is
+    kept until one of the registries it was resolved from changes.
+
+    The returned object is shared and must not be modified.
+    """
+    device_ids = target_selection.device_ids
+    area_ids = target_selection.area_ids
+    floor_ids = target_selection.floor_ids
+    label_ids = target_selection.label_ids
+
+    registry_items: list[BaseRegistryItems[Any]] = [
+        er.async_get(hass).entities,
+        dr.async_get(hass).devices,
+    ]
+    if area_ids or floor_ids or label_ids:
+        registry_items.append(ar.async_get(hass).areas)
+    if floor_ids:
+        registry_items.append(fr.async_get(hass).floors)
+    if label_ids:
+        registry_items.append(lr.async_get(hass).labels)
+    generations = tuple(items.generation for items in registry_items)
+
+    if (cache := hass.data.get(_REGISTRY_TARGET_CACHE)) is None:
+        cache = hass.data[_REGISTRY_TARGET_CACHE] = LRU(MAX_CACHED_REGISTRY_TARGETS)
+    key: _RegistryTargetKey = (
+        frozenset(device_ids),
+        frozenset(area_ids),
+        frozenset(floor_ids),
+        frozenset(label_ids),
+        primary_entities_only,
+    )
+    if (cache_entry := cache.get(key)) is not None:
+        cached_items, cached_generations, selected = cache_entry
+        if cached_generations == generations and all(
+            items is cached
+            for items, cached in zip(registry_items, cached_items, strict=True)
+        ):
+            return selected
+
+    selected = _async_resolve_registry_targets(
+        hass, target_selection, primary_entities_only
+    )
+    cache[key] = (tuple(registry_items), generations, selected)
+    return selected
+
+
+@callback
+def _async_resolve_registry_targets(
+    hass: HomeAssistant,
+    target_selection: TargetSelection,
+    primary_entities_only: bool,
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label targets of a selection."""
+    selected = SelectedEntities()
     entities = er.async_get(hass).entities
     dev_reg = dr.async_get(hass)
     area_reg = ar.async_get(hass)
@@ -5,6 +5,7 @@ from collections.abc import Callable, Coroutine, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from functools import wraps
+from types import MappingProxyType
 from typing import Any, Literal, overload, override
 
 from homeassistant.core import ServiceResponse
@@ -53,6 +54,11 @@ class TraceElement:
         self._child_key = child_key
         self._child_run_id = child_run_id
 
+    @property
+    def error(self) -> BaseException | None:
+        """Return the error."""
+        return self._error
+
     def set_error(self, ex: BaseException | None) -> None:
         """Set error."""
         self._error = ex
@@ -74,6 +80,11 @@ class TraceElement:
         """Return the recorded template error messages."""
         return self._template_errors or []
 
+    @property
+    def result(self) -> dict[str, Any] | None:
+        """Return the result."""
+        return self._result
+
     def set_result(self, **kwargs: Any) -> None:
         """Set result."""
         self._result = {**kwargs}
@@ -90,8 +101,16 @@ class TraceElement:
         last_variables = self._last_variables
         # variables is often a ChainMap which is costly to iterate, so flatten
         # it once and reuse the snapshot for both the baseline and the diff.
-        snapshot = dict(variables)
+        # Read-only snapshots, such as those of script run variables, are
+        # shared as is and nothing changed if the baseline is the same one.
+        if isinstance(variables, MappingProxyType):
+            snapshot = variables
+        else:
+            snapshot = dict(variables)
         variables_cv.set(snapshot)
+        if snapshot is last_variables:
+            self._variables = {}
+            return
         self._variables = {
             key: value
             for key, value in snapshot.items()
@@ -5,6 +5,7 @@ from collections.abc import Iterable, Mapping
 from contextlib import suppress
 from dataclasses import dataclass
 import logging
+import os
 import pathlib
 import string
 from typing import Any
@@ -23,12 +24,20 @@ from homeassistant.loader import (
 from homeassistant.util.json import load_json
 
 from . import singleton
+from .storage import Store
 
 _LOGGER = logging.getLogger(__name__)
 
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
 LOCALE_EN = "en"
 
+TRANSLATION_BUNDLE_STORAGE_VERSION = 1
+TRANSLATION_BUNDLE_SAVE_DELAY = 30
+
+# Bundled translation files by domain, the value is the path, modification
+# time and size of the file followed by its parsed content
+type _TranslationBundleFiles = dict[str, list[Any]]
+
 
 def recursive_flatten(
     prefix: str, data: dict[str, dict[str, Any] | str]
@@ -68,6 +77,63 @@ def _load_translations_files_by_language(
     return loaded
 
 
+def _load_bundled_translations_files_by_language(
+    translation_files: dict[str, dict[str, pathlib.Path]],
+    bundles: Mapping[str, _TranslationBundleFiles],
+) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, list[Any] | None]]]:
+    """Load translation.json files, taking unchanged files from the bundles.
+
+    Only files which moved or changed since they were added to the bundle of
+    their language are read and parsed. Returns the translations and the
+    bundle entries to update by language, entries to remove are None.
+    """
+    loaded: dict[str, dict[str, Any]] = {}
+    files_to_load: dict[str, dict[str, pathlib.Path]] = {}
+    file_stats: dict[str, dict[str, list[Any]]] = {}
+    bundle_updates: dict[str, dict[str, list[Any] | None]] = {}
+    for language, component_translation_file in translation_files.items():
+        loaded_for_language: dict[str, Any] = {}
+        loaded[language] = loaded_for_language
+        files_to_load[language] = {}
+        file_stats[language] = {}
+        bundle = bundles.get(language, {})
+        updates = bundle_updates[language] = {}
+
+        for component, translation_file in component_translation_file.items():
+            try:
+                stat_result = os.stat(translation_file)
+            except OSError:
+                if component in bundle:
+                    updates[component] = None
+            else:
+                file_stat = [
+                    str(translation_file),
+                    stat_result.st_mtime_ns,
+                    stat_result.st_size,
+                ]
+                if (entry := bundle.get(component)) is not None and entry[
+                    :3
+                ] == file_stat:
+                    # Copy as the title of the integration may be added
+                    loaded_for_language[component] = dict(entry[3])
+                    continue
+                file_stats[language][component] = file_stat
+            files_to_load[language][component] = translation_file
+
+    if not any(files_to_load.values()):
+        return loaded, bundle_updates
+
+    for language, loaded_for_language in _load_translations_files_by_language(
+        files_to_load
+    ).items():
+        for component, translations in loaded_for_language.items():
+            if file_stat := file_stats[language].get(component):
+                bundle_updates[language][component] = [*file_stat, translations]
+            loaded[language][component] = dict(translations)
+
+    return loaded, bundle_updates
+
+
 def build_resources(
     translation_strings: dict[str, dict[str, dict[str, Any] | str]],
     components: set[str],
@@ -88,8 +154,13 @@ async def _async_get_component_strings(
     languages: Iterable[str],
     components: set[str],
     integrations: dict[str, Integration],
+    bundles: Mapping[str, _TranslationBundle] | None = None,
 ) -> dict[str, dict[str, Any]]:
-    """Load translations."""
+    """Load translations.
+
+    If bundles are passed, translation files are taken from and added to the
+    bundle of their language.
+    """
     translations_by_language: dict[str, dict[str, Any]] = {}
     # Determine paths of missing components/platforms
     files_to_load_by_language: dict[str, dict[str, pathlib.Path]] = {}
@@ -108,7 +179,18 @@ async def _async_get_component_strings(
         files_to_load_by_language[language] = files_to_load
         has_files_to_load |= bool(files_to_load)
 
-    if has_files_to_load:
+    if has_files_to_load and bundles is not None:
+        (
+            loaded_translations_by_language,
+            bundle_updates,
+        ) = await hass.async_add_executor_job(
+            _load_bundled_translations_files_by_language,
+            files_to_load_by_language,
+            {language: bundle.files for language, bundle in bundles.items()},
+        )
+        for language, updates in bundle_updates.items():
+            bundles[language].async_update(files_to_load_by_language[language], updates)
+    elif has_files_to_load:
         loaded_translations_by_language = await hass.async_add_executor_job(
             _load_translations_files_by_language, files_to_load_by_language
         )
@@ -128,6 +210,58 @@ async def _async_get_component_strings(
     return translations_by_language
 
 
+class _TranslationBundle:
+    """Bundle of the parsed translation files of a language.
+
+    The bundle is persisted so translation files which did not change since
+    the last start can be loaded with a single read instead of reading and
+    parsing the file of each integration. Only the files of domains which
+    were requested since the start are saved, so files of removed
+    integrations do not stay in the bundle.
+    """
+
+    __slots__ = ("files", "requested", "store")
+
+    def __init__(self, hass: HomeAssistant, language: str) -> None:
+        """Initialize the bundle."""
+        self.store = Store[dict[str, _TranslationBundleFiles]](
+            hass, TRANSLATION_BUNDLE_STORAGE_VERSION, f"core.translations.{language}"
+        )
+        self.files: _TranslationBundleFiles = {}
+        self.requested: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load the bundle."""
+        if data := await self.store.async_load():
+            self.files = data["files"]
+
+    @callback
+    def async_update(
+        self, requested: Iterable[str], updates: dict[str, list[Any] | None]
+    ) -> None:
+        """Update files in the bundle and schedule saving it."""
+        self.requested.update(requested)
+        if not updates:
+            return
+        for domain, entry in updates.items():
+            if entry is None:
+                self.files.pop(domain, None)
+            else:
+                self.files[domain] = entry
+        self.store.async_delay_save(self._data_to_save, TRANSLATION_BUNDLE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, _TranslationBundleFiles]:
+        """Return the files of the requested domains to save."""
+        return {
+            "files": {
+                domain: entry
+                for domain, entry in self.files.items()
+                if domain in self.requested
+            }
+        }
+
+
 @dataclass(slots=True)
 class _TranslationsCacheData:
     """Data for the translation cache.
@@ -144,13 +278,14 @@ class _TranslationsCacheData:
 class _TranslationCache:
     """Cache for flattened translations."""
 
-    __slots__ = ("cache_data", "hass", "lock")
+    __slots__ = ("bundles", "cache_data", "hass", "lock")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the cache."""
         self.hass = hass
         self.cache_data = _TranslationsCacheData({}, {})
         self.lock = asyncio.Lock()
+        self.bundles: dict[str, _TranslationBundle] = {}
 
     @callback
     def async_is_loaded(self, language: str, components: set[str]) -> bool:
@@ -227,7 +362,11 @@ class _TranslationCache:
             integrations[domain] = int_or_exc
 
         translation_by_language_strings = await _async_get_component_strings(
-            self.hass, languages, components, integrations
+            self.hass,
+            languages,
+            components,
+            integrations,
+            await self._async_get_bundles(languages),
         )
 
         # English is always the fallback language so we load them first
@@ -252,6 +391,19 @@ class _TranslationCache:
 
         loaded[language].update(components)
 
+    async def _async_get_bundles(
+        self, languages: Iterable[str]
+    ) -> dict[str, _TranslationBundle]:
+        """Return the bundles of the languages, loading them on first use."""
+        bundles: dict[str, _TranslationBundle] = {}
+        for language in languages:
+            if (bundle := self.bundles.get(language)) is None:
+                bundle = _TranslationBundle(self.hass, language)
+                await bundle.async_load()
+                self.bundles[language] = bundle
+            bundles[language] = bundle
+        return bundles
+
     def _validate_placeholders(
         self,
         language: str,
@@ -2,7 +2,15 @@
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generator,
+    Hashable,
+    Iterable,
+    Mapping,
+)
 from datetime import datetime, timedelta
 from functools import partial
 import logging
@@ -17,7 +25,7 @@ import requests
 
 from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -30,6 +38,7 @@ from homeassistant.util.dt import utcnow
 
 from . import entity, event
 from .debounce import Debouncer
+from .poll_scheduler import async_get_poll_scheduler
 from .typing import UNDEFINED, UndefinedType
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
@@ -68,6 +77,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Passing both ``min_update_interval`` and ``max_update_interval`` makes the
+    interval adaptive: it is halved after a scheduled refresh which changed
+    the data and grows by half when the data did not change, within the bounds.
+    The adapted interval is reflected by :attr:`update_interval`. This also
+    requires that the data implements ``__eq__``.
     """
 
     def __init__(
@@ -82,6 +97,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        min_update_interval: timedelta | None = None,
+        max_update_interval: timedelta | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -91,6 +108,27 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.setup_method = setup_method
         self._update_interval_seconds: float | None = None
         self.update_interval = update_interval
+        self._update_interval_bounds: tuple[float, float] | None = None
+        if (min_update_interval is None) != (max_update_interval is None):
+            raise ValueError(
+                "min_update_interval and max_update_interval must be passed together"
+            )
+        if min_update_interval is not None and max_update_interval is not None:
+            if min_update_interval > max_update_interval:
+                raise ValueError(
+                    "min_update_interval must not be greater than max_update_interval"
+                )
+            if update_interval is not None and not (
+                min_update_interval <= update_interval <= max_update_interval
+            ):
+                raise ValueError(
+                    "update_interval must be between min_update_interval and"
+                    " max_update_interval"
+                )
+            self._update_interval_bounds = (
+                min_update_interval.total_seconds(),
+                max_update_interval.total_seconds(),
+            )
         self._shutdown_requested = False
         if config_entry is UNDEFINED:
             # late import to avoid circular imports
@@ -197,7 +235,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
+        self._async_call_listeners(list(self._listeners.values()))
+
+    @callback
+    def _async_call_listeners(
+        self, listeners: Iterable[tuple[CALLBACK_TYPE, object | None]]
+    ) -> None:
+        """Call the update callbacks of listeners."""
+        for update_callback, _ in listeners:
             try:
                 update_callback()
             except Exception:
@@ -231,6 +276,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._unsub_refresh:
             self._unsub_refresh()
             self._unsub_refresh = None
+            async_get_poll_scheduler(self.hass).async_unscheduled(self)
 
     def _async_unsub_shutdown(self) -> None:
         """Cancel any scheduled call."""
@@ -268,15 +314,21 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         hass = self.hass
         loop = hass.loop
 
+        poll_scheduler = async_get_poll_scheduler(hass)
         update_interval = self._update_interval_seconds
         if self._retry_after is not None:
             update_interval = self._retry_after
             self._retry_after = None
+        elif hass.state is not CoreState.running:
+            # Coordinators set up during startup would otherwise keep
+            # refreshing in the same second, spread them over the interval.
+            update_interval = poll_scheduler.async_spread_delay(update_interval)
 
         next_refresh = int(loop.time()) + self._microsecond + update_interval
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
+        poll_scheduler.async_scheduled(self, next_refresh)
 
     @callback
     def __wrap_handle_refresh_interval(self) -> None:
@@ -298,6 +350,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
+        async_get_poll_scheduler(self.hass).async_unscheduled(self)
         async with self._debounced_refresh.async_lock():
             await self._async_refresh(log_failures=True, scheduled=True)
 
@@ -568,6 +621,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                     monotonic() - start,
                     self.last_update_success,
                 )
+            if (
+                scheduled
+                and self._update_interval_bounds is not None
+                and self.last_update_success
+                and previous_update_success
+            ):
+                self._async_adapt_update_interval(previous_data != self.data)
             if not auth_failed and self._listeners and not self.hass.is_stopping:
                 self._schedule_refresh()
 
@@ -583,6 +643,21 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         ):
             self.async_update_listeners()
 
+    @callback
+    def _async_adapt_update_interval(self, data_changed: bool) -> None:
+        """Adapt the interval to how often the data changes."""
+        if (update_interval := self._update_interval_seconds) is None:
+            return
+        assert self._update_interval_bounds is not None
+        min_interval, max_interval = self._update_interval_bounds
+        if data_changed:
+            update_interval /= 2
+        else:
+            update_interval *= 1.5
+        self.update_interval = timedelta(
+            seconds=min(max(update_interval, min_interval), max_interval)
+        )
+
     @callback
     def _async_refresh_finished(self) -> None:
         """Handle when a refresh has finished.
@@ -633,6 +708,62 @@ class TimestampDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
             self.last_update_success_time = utcnow()
 
 
+class KeyedDataUpdateCoordinator[_KeyT: Hashable, _ValueT](
+    DataUpdateCoordinator[Mapping[_KeyT, _ValueT]]
+):
+    """DataUpdateCoordinator which only updates the listeners of changed keys.
+
+    The data is a mapping and each listener passes the key of the value it
+    uses as its context. When listeners are updated, only those whose value
+    was added, removed or changed since the previous update are called, along
+    with the listeners without a context. All listeners are called when
+    the availability of the data changes.
+
+    The mapping is copied when listeners are updated, so it can be changed
+    in place. Values are compared with ``__eq__``, so values must be replaced
+    rather than changed in place.
+    """
+
+    _notified_data: Mapping[_KeyT, _ValueT] | None = None
+    _notified_update_success: bool = True
+
+    @callback
+    @override
+    def async_update_listeners(self) -> None:
+        """Update the listeners of keys which changed since the last update."""
+        previous_data = self._notified_data
+        previous_update_success = self._notified_update_success
+        data = self.data
+        # Keep a copy, the mapping may be changed in place before the next update
+        self._notified_data = None if data is None else dict(data)
+        self._notified_update_success = self.last_update_success
+        if (
+            previous_data is None
+            or data is None
+            or previous_update_success != self.last_update_success
+        ):
+            super().async_update_listeners()
+            return
+
+        changed = {
+            key
+            for key in data.keys() | previous_data.keys()
+            if key not in data
+            or key not in previous_data
+            or (
+                (value := data[key]) is not (previous_value := previous_data[key])
+                and value != previous_value
+            )
+        }
+        self._async_call_listeners(
+            [
+                listener
+                for listener in self._listeners.values()
+                if listener[1] is None or listener[1] in changed
+            ]
+        )
+
+
 class BaseCoordinatorEntity[
     _BaseDataUpdateCoordinatorT: BaseDataUpdateCoordinatorProtocol
 ](entity.Entity):
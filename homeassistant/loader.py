@@ -280,6 +280,7 @@ class Manifest(TypedDict, total=False):
     import_executor: bool
     single_config_entry: bool
     preview_features: dict[str, dict[str, str]]
+    deferrable: bool
 
 
 def async_setup(hass: HomeAssistant) -> None:
@@ -967,6 +968,16 @@ class Integration:
         """Return if the integration supports a single config entry only."""
         return self.manifest.get("single_config_entry", False)
 
+    @cached_property
+    def deferrable(self) -> bool:
+        """Return if setting up the integration can be deferred until first use.
+
+        Deferrable integrations which no other integration depends on are not
+        set up during startup but when one of their websocket commands is
+        first called.
+        """
+        return self.manifest.get("deferrable", False)
+
     @property
     def all_dependencies(self) -> set[str]:
         """Return all dependencies including sub-dependencies."""
@@ -4,49 +4,171 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+import json
 import logging
+from pathlib import Path
+import sys
+import tempfile
 from timeit import default_timer as timer
-
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+import tracemalloc
+from types import MappingProxyType
+
+from homeassistant import bootstrap, core, loader
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, EVENT_STATE_CHANGED
+from homeassistant.generated.dhcp import DHCP
+from homeassistant.generated.zeroconf import HOMEKIT
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_registry as er,
+    trigger,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    TrackTemplate,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_template_result,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.recorder import async_initialize_recorder, get_instance
+from homeassistant.helpers.script import Script
+from homeassistant.helpers.template import Template
+from homeassistant.helpers.trace import trace_clear
+from homeassistant.setup import async_setup_component
+from homeassistant.util.fnmatch_index import FnmatchIndex
+
+from .results import BenchmarkResult, compare_with_baseline, results_as_dict
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
 
 BENCHMARKS: dict[str, Callable] = {}
 
+ALL_BENCHMARKS = "all"
+DEFAULT_RUNS = 5
+DEFAULT_TOLERANCE = 10.0
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _positive_int(value: str) -> int:
+    """Parse a positive integer command line argument."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a positive integer")
+    return number
+
 
 def run(args):
     """Handle benchmark commandline script."""
     # Disable logging
     logging.getLogger("homeassistant.core").setLevel(logging.CRITICAL)
+    logging.getLogger("homeassistant.loader").setLevel(logging.CRITICAL)
 
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
-    parser.add_argument("name", choices=BENCHMARKS)
+    parser.add_argument("name", choices=[*BENCHMARKS, ALL_BENCHMARKS])
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--runs",
+        type=_positive_int,
+        help=(
+            "Number of runs of each benchmark; a single benchmark runs until"
+            f" interrupted by default, otherwise {DEFAULT_RUNS} runs are made"
+        ),
+    )
+    parser.add_argument(
+        "--json", metavar="FILE", help="Write the results as JSON to FILE"
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="FILE",
+        help="Compare the results with a JSON file written by an earlier run",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=(
+            "Percentage the median runtime or peak memory of a benchmark may"
+            " grow compared to the baseline"
+        ),
+    )
 
     args = parser.parse_args()
 
-    bench = BENCHMARKS[args.name]
     print("Using event loop:", asyncio.get_event_loop_policy().loop_name)  # type: ignore[deprecated]
 
-    with suppress(KeyboardInterrupt):
-        while True:
-            asyncio.run(run_benchmark(bench))
+    if args.name == ALL_BENCHMARKS:
+        names = list(BENCHMARKS)
+    else:
+        names = [args.name]
+
+    runs = args.runs
+    if runs is None and (len(names) > 1 or args.json or args.baseline):
+        runs = DEFAULT_RUNS
+
+    if runs is None:
+        bench = BENCHMARKS[args.name]
+        with suppress(KeyboardInterrupt):
+            while True:
+                run_benchmark_in_config_dir(bench)
+        return 0
+
+    results = results_as_dict(
+        {name: measure_benchmark(BENCHMARKS[name], runs) for name in names}
+    )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if not args.baseline:
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    if not (regressions := compare_with_baseline(results, baseline, args.tolerance)):
+        print("No regressions compared to", args.baseline)
+        return 0
+
+    print("Regressions compared to", args.baseline, file=sys.stderr)
+    for regression in regressions:
+        print(f"  {regression}", file=sys.stderr)
+    return 1
+
+
+def measure_benchmark(bench: Callable, runs: int) -> BenchmarkResult:
+    """Run a benchmark a number of times and collect the results.
+
+    Peak memory is measured in an extra run, so tracing the memory
+    allocations does not slow down the timed runs.
+    """
+    runtimes = tuple(run_benchmark_in_config_dir(bench) for _ in range(runs))
+    tracemalloc.start()
+    try:
+        run_benchmark_in_config_dir(bench)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    print(f"Benchmark {bench.__name__} peak memory {peak_memory} bytes")
+    return BenchmarkResult(runtimes=runtimes, peak_memory=peak_memory)
 
 
-async def run_benchmark(bench):
+def run_benchmark_in_config_dir(bench: Callable) -> float:
+    """Run a benchmark once with an empty config directory."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        return asyncio.run(run_benchmark(bench, config_dir))
+
+
+async def run_benchmark(bench, config_dir=""):
     """Run a benchmark."""
-    hass = core.HomeAssistant("")
+    hass = core.HomeAssistant(config_dir)
     runtime = await bench(hass)
     print(f"Benchmark {bench.__name__} done in {runtime}s")
     await hass.async_stop()
+    return runtime
 
 
 def benchmark[_CallableT: Callable](func: _CallableT) -> _CallableT:
@@ -55,6 +177,14 @@ def benchmark[_CallableT: Callable](func: _CallableT) -> _CallableT:
     return func
 
 
+async def _async_setup_core(hass: core.HomeAssistant) -> None:
+    """Load the registries and helpers which integrations rely on."""
+    loader.async_setup(hass)
+    hass.config.skip_pip = True
+    hass.config_entries = ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+
+
 @benchmark
 async def fire_events(hass: core.HomeAssistant) -> float:
     """Fire a million events."""
@@ -306,3 +436,498 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def discovery_matching(hass: core.HomeAssistant) -> float:
+    """Match a million discovered names against the generated matchers.
+
+    Replays DHCP hostnames and HomeKit models derived from the
+    generated manifest matchers, mixed with names that match nothing.
+    """
+    hostname_index: FnmatchIndex[str] = FnmatchIndex(
+        (str(matcher["hostname"]), str(matcher["domain"]))
+        for matcher in DHCP
+        if "hostname" in matcher and "macaddress" not in matcher
+    )
+    model_index: FnmatchIndex[str] = FnmatchIndex(
+        (model, discovery["domain"]) for model, discovery in HOMEKIT.items()
+    )
+
+    def _sample(pattern: str) -> str:
+        """Turn a pattern into a name it matches."""
+        return (
+            pattern.replace("*", "abc123")
+            .replace("?", "x")
+            .replace("[", "")
+            .replace("]", "")
+        )
+
+    names = [
+        *(
+            _sample(str(matcher["hostname"]))
+            for matcher in DHCP
+            if "hostname" in matcher
+        ),
+        *(_sample(model) for model in HOMEKIT),
+        "android-7f3c9a1b2d",
+        "iphone",
+        "desktop-q8l2kf",
+        "unknown",
+    ]
+    size = len(names)
+
+    start = timer()
+
+    for i in range(10**6):
+        name = names[i % size]
+        hostname_index.match(name)
+        model_index.match(name)
+
+    return timer() - start
+
+
+async def _run_script(hass: core.HomeAssistant, sequence: list[dict]) -> float:
+    """Run a script sequence with tracing enabled and return the runtime."""
+    script = Script(hass, cv.SCRIPT_SCHEMA(sequence), "Benchmark", "benchmark")
+
+    start = timer()
+    trace_clear()
+    await script.async_run(context=core.Context())
+    return timer() - start
+
+
+@benchmark
+async def script_repeat(hass: core.HomeAssistant) -> float:
+    """Run a script repeating a sequence of steps 10000 times.
+
+    Most steps do not change the variables, which is the common case
+    for scripts traced step by step.
+    """
+    return await _run_script(
+        hass,
+        [
+            {"variables": {f"var_{i}": i for i in range(50)}},
+            {
+                "repeat": {
+                    "for_each": list(range(10**4)),
+                    "sequence": [
+                        {"event": "benchmark_event"},
+                        {"event": "benchmark_event"},
+                        {"variables": {"item": "{{ repeat.item }}"}},
+                        {"event": "benchmark_event"},
+                    ],
+                }
+            },
+        ],
+    )
+
+
+@benchmark
+async def script_parallel(hass: core.HomeAssistant) -> float:
+    """Run a script with 1000 parallel branches of a few steps each."""
+    return await _run_script(
+        hass,
+        [
+            {"variables": {f"var_{i}": i for i in range(50)}},
+            {
+                "parallel": [
+                    [
+                        {"event": "benchmark_event"},
+                        {"variables": {"branch": branch}},
+                        {"event": "benchmark_event"},
+                    ]
+                    for branch in range(10**3)
+                ]
+            },
+        ],
+    )
+
+
+@benchmark
+async def recorder_commit(hass: core.HomeAssistant) -> float:
+    """Record 10000 state changes in an in-memory SQLite database."""
+    await _async_setup_core(hass)
+    async_initialize_recorder(hass)
+    assert await async_setup_component(
+        hass, "recorder", {"recorder": {"db_url": "sqlite://"}}
+    )
+    await hass.async_start()
+    instance = get_instance(hass)
+    await instance.async_block_till_done()
+
+    start = timer()
+
+    for idx in range(10**4):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx % 100}",
+            str(idx),
+            {"unit_of_measurement": "W", "friendly_name": f"Power {idx % 100}"},
+        )
+    await hass.async_block_till_done()
+    await instance.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def template_render(hass: core.HomeAssistant) -> float:
+    """Render a template over 1000 entities 1000 times."""
+    await _async_setup_core(hass)
+    for idx in range(1000):
+        hass.states.async_set(f"sensor.benchmark_{idx}", str(idx % 10))
+    template = Template(
+        "{{ states.sensor | selectattr('state', 'eq', '1') | list | count }}", hass
+    )
+
+    start = timer()
+
+    for _ in range(1000):
+        template.async_render()
+
+    return timer() - start
+
+
+@benchmark
+async def template_tracking(hass: core.HomeAssistant) -> float:
+    """Track 500 templates through 100k state changes of 1000 entities."""
+    await _async_setup_core(hass)
+    for idx in range(1000):
+        hass.states.async_set(f"sensor.benchmark_{idx}", "0")
+    renders = 0
+
+    @core.callback
+    def _refresh(event, updates):
+        """Handle a template result change."""
+        nonlocal renders
+        renders += 1
+
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template(
+                    f"{{{{ states('sensor.benchmark_{idx}') | int"
+                    f" + states('sensor.benchmark_{idx + 500}') | int }}}}",
+                    hass,
+                ),
+                None,
+            )
+            for idx in range(500)
+        ],
+        _refresh,
+    )
+
+    start = timer()
+
+    for idx in range(10**5):
+        hass.states.async_set(f"sensor.benchmark_{idx % 1000}", str(idx))
+    await hass.async_block_till_done()
+
+    assert renders == 10**5
+
+    return timer() - start
+
+
+@benchmark
+async def subscribe_entities(hass: core.HomeAssistant) -> float:
+    """Fan out 10000 state changes to 100 subscribe_entities connections."""
+    from homeassistant.auth.models import User  # noqa: PLC0415
+    from homeassistant.auth.permissions import PermissionLookup  # noqa: PLC0415
+    from homeassistant.components import websocket_api  # noqa: PLC0415
+    from homeassistant.components.websocket_api.http import (  # noqa: PLC0415
+        WebSocketAdapter,
+    )
+    from homeassistant.helpers import device_registry as dr  # noqa: PLC0415
+
+    await _async_setup_core(hass)
+    for idx in range(1000):
+        hass.states.async_set(f"light.benchmark_{idx}", "off", {"brightness": 0})
+    websocket_api.async_register_command(
+        hass, websocket_api.commands.handle_subscribe_entities
+    )
+    user = User(
+        name="Benchmark",
+        perm_lookup=PermissionLookup(er.async_get(hass), dr.async_get(hass)),
+        is_owner=True,
+        is_active=True,
+    )
+    sent = 0
+
+    def _send_message(message):
+        """Count a message sent to the client."""
+        nonlocal sent
+        sent += 1
+
+    for connid in range(100):
+        connection = websocket_api.ActiveConnection(
+            WebSocketAdapter(_LOGGER, {"connid": connid}),
+            hass,
+            _send_message,
+            user,
+            None,
+            None,
+        )
+        connection.async_handle({"id": 1, "type": "subscribe_entities"})
+    # Ignore the result and initial states sent to each connection
+    sent = 0
+
+    start = timer()
+
+    for idx in range(10**4):
+        hass.states.async_set(
+            f"light.benchmark_{idx % 1000}", "on", {"brightness": idx % 255}
+        )
+    await hass.async_block_till_done()
+
+    assert sent == 10**6
+
+    return timer() - start
+
+
+@benchmark
+async def entity_registry_load_save(hass: core.HomeAssistant) -> float:
+    """Save and load an entity registry with 10000 entities."""
+    await _async_setup_core(hass)
+    registry = er.async_get(hass)
+    for idx in range(10**4):
+        registry.async_get_or_create(
+            "sensor",
+            "benchmark",
+            f"unique_{idx}",
+            original_name=f"Sensor {idx}",
+            unit_of_measurement="W",
+        )
+
+    start = timer()
+
+    # Flush the delayed save of the registry
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    loaded = er.EntityRegistry(hass)
+    await loaded.async_load()
+
+    assert len(loaded.entities) == 10**4
+
+    return timer() - start
+
+
+def _write_integrations(custom_components: Path, domains: list[str]) -> None:
+    """Write integrations which depend on each other as a binary tree."""
+    custom_components.mkdir()
+    (custom_components / "__init__.py").write_text("", encoding="utf-8")
+    for idx, domain in enumerate(domains):
+        integration = custom_components / domain
+        integration.mkdir()
+        manifest = {
+            "domain": domain,
+            "name": domain,
+            "version": "1.0.0",
+            "dependencies": [domains[(idx - 1) // 2]] if idx else [],
+        }
+        (integration / "manifest.json").write_text(
+            json.dumps(manifest), encoding="utf-8"
+        )
+        (integration / "__init__.py").write_text(
+            '"""Benchmark integration."""\n\n\n'
+            "async def async_setup(hass, config):\n"
+            '    """Set up the integration."""\n'
+            "    return True\n",
+            encoding="utf-8",
+        )
+
+
+@benchmark
+async def bootstrap_integrations(hass: core.HomeAssistant) -> float:
+    """Set up 500 integrations which depend on each other."""
+    domains = [f"benchmark_{idx}" for idx in range(500)]
+    await hass.async_add_executor_job(
+        _write_integrations, Path(hass.config.path("custom_components")), domains
+    )
+    try:
+        await _async_setup_core(hass)
+
+        start = timer()
+
+        results = await asyncio.gather(
+            *(async_setup_component(hass, domain, {}) for domain in domains)
+        )
+        runtime = timer() - start
+    finally:
+        # The modules would otherwise be imported from the config
+        # directory of this run by the next run
+        for module in list(sys.modules):
+            if module.partition(".")[0] == "custom_components":
+                del sys.modules[module]
+
+    assert all(results)
+
+    return runtime
+
+
+@benchmark
+async def automation_latency(hass: core.HomeAssistant) -> float:
+    """Measure 1000 state changes through to the action of an automation.
+
+    Like an automation, a state trigger runs a script. Each state change
+    waits for the action, so the runtime is the sum of the latencies.
+    """
+    await _async_setup_core(hass)
+    hass.states.async_set("sensor.benchmark", "0")
+    script = Script(
+        hass,
+        cv.SCRIPT_SCHEMA(
+            [{"event": "benchmark_action", "event_data": {"value": "{{ value }}"}}]
+        ),
+        "Benchmark",
+        "benchmark",
+        script_mode="parallel",
+    )
+    action_done = asyncio.Event()
+
+    @core.callback
+    def _action_done(event):
+        """Handle the event fired by the action."""
+        action_done.set()
+
+    hass.bus.async_listen("benchmark_action", _action_done)
+
+    async def _action(run_variables, context=None):
+        """Run the action of the automation."""
+        await script.async_run(
+            {**run_variables, "value": run_variables["trigger"]["to_state"].state},
+            context,
+        )
+
+    def _log(level, msg, **kwargs):
+        """Log a message from the triggers."""
+        _LOGGER.log(level, msg, **kwargs)
+
+    trigger_config = await trigger.async_validate_trigger_config(
+        hass, [{"trigger": "state", "entity_id": "sensor.benchmark"}]
+    )
+    remove = await trigger.async_initialize_triggers(
+        hass, trigger_config, _action, "benchmark", "Benchmark", _log
+    )
+    assert remove is not None
+
+    runtime = 0.0
+    for idx in range(1, 1001):
+        action_done.clear()
+        start = timer()
+        hass.states.async_set("sensor.benchmark", str(idx))
+        await action_done.wait()
+        runtime += timer() - start
+
+    remove()
+
+    return runtime
+
+
+@benchmark
+async def mqtt_dispatch(hass: core.HomeAssistant) -> float:
+    """Dispatch 100000 MQTT messages to 1000 subscriptions.
+
+    The messages are handed to the client the way the client loop does
+    when they arrive from the broker, so no broker is needed.
+    """
+    import paho.mqtt.client as mqtt  # noqa: PLC0415
+
+    from homeassistant.components.mqtt.client import MQTT  # noqa: PLC0415
+    from homeassistant.components.mqtt.models import MqttData  # noqa: PLC0415
+
+    await _async_setup_core(hass)
+    entry = ConfigEntry(
+        data={"broker": "localhost"},
+        discovery_keys=MappingProxyType({}),
+        domain="mqtt",
+        minor_version=1,
+        options={},
+        source="user",
+        subentries_data=None,
+        title="Benchmark",
+        unique_id=None,
+        version=1,
+    )
+    client = MQTT(hass, entry, dict(entry.data))
+    await client.async_start(MqttData(client=client, config=[]))
+    received = 0
+
+    @core.callback
+    def _message_received(msg):
+        """Handle a received message."""
+        nonlocal received
+        received += 1
+
+    for idx in range(1000):
+        client.async_subscribe(f"benchmark/{idx}/state", _message_received, 0)
+    for idx in range(10):
+        client.async_subscribe(f"benchmark/+/attribute_{idx}", _message_received, 0)
+    client.async_subscribe("benchmark/discovery/#", _message_received, 0)
+
+    messages: list[mqtt.MQTTMessage] = []
+    for idx in range(1000):
+        msg = mqtt.MQTTMessage(topic=f"benchmark/{idx}/state".encode())
+        msg.payload = b"on"
+        messages.append(msg)
+
+    start = timer()
+
+    for _ in range(100):
+        for msg in messages:
+            client._async_mqtt_on_message(client._mqttc, None, msg)  # noqa: SLF001
+    await hass.async_block_till_done()
+
+    assert received == 10**5
+
+    client.cleanup()
+
+    return timer() - start
+
+
+@benchmark
+async def statistics_sliding_window(hass: core.HomeAssistant) -> float:
+    """Update statistics over a window of 10000 samples with 20000 samples.
+
+    The samples are handed to the sensors the way the state change listener
+    does, so no recorder is needed.
+    """
+    from homeassistant.components.statistics.sensor import (  # noqa: PLC0415
+        StatisticsSensor,
+    )
+
+    await _async_setup_core(hass)
+    sensors = [
+        StatisticsSensor(
+            hass,
+            source_entity_id="sensor.benchmark",
+            name=f"Benchmark {characteristic}",
+            unique_id=None,
+            state_characteristic=characteristic,
+            samples_max_buffer_size=10000,
+            samples_max_age=None,
+            samples_keep_last=False,
+            precision=2,
+            percentile=95,
+        )
+        for characteristic in (
+            "mean",
+            "median",
+            "percentile",
+            "standard_deviation",
+            "value_max",
+        )
+    ]
+    states = [
+        core.State("sensor.benchmark", str((idx * 7919) % 1000 / 10))
+        for idx in range(20000)
+    ]
+
+    start = timer()
+
+    for state in states:
+        for sensor in sensors:
+            sensor._add_state_to_queue(state, state.last_reported_timestamp)  # noqa: SLF001
+            sensor._update_value()  # noqa: SLF001
+
+    return timer() - start
@@ -0,0 +1,86 @@
+"""Summarize benchmark runs and compare them with a baseline."""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+import math
+import platform
+import statistics
+from typing import Any
+
+from homeassistant.const import __version__
+
+RESULTS_VERSION = 1
+
+PERCENTILES = (90, 95, 99)
+
+# Result keys compared with the baseline, lower is better for all of them
+COMPARED_KEYS = ("median", "peak_memory")
+
+
+def percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """Return a percentile of sorted values, interpolating between them."""
+    rank = (len(sorted_values) - 1) * percent / 100
+    lower = math.floor(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+        rank - lower
+    )
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class BenchmarkResult:
+    """Runtimes and peak memory of the runs of a benchmark."""
+
+    runtimes: tuple[float, ...]
+    peak_memory: int
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return the summary of the runs."""
+        runtimes = sorted(self.runtimes)
+        return {
+            "runs": len(runtimes),
+            "min": runtimes[0],
+            "max": runtimes[-1],
+            "mean": statistics.fmean(runtimes),
+            "median": statistics.median(runtimes),
+            **{f"p{percent}": percentile(runtimes, percent) for percent in PERCENTILES},
+            "peak_memory": self.peak_memory,
+        }
+
+
+def results_as_dict(results: Mapping[str, BenchmarkResult]) -> dict[str, Any]:
+    """Return the results in the format written to and read from JSON files."""
+    return {
+        "version": RESULTS_VERSION,
+        "homeassistant": __version__,
+        "python": platform.python_version(),
+        "benchmarks": {name: result.as_dict() for name, result in results.items()},
+    }
+
+
+def compare_with_baseline(
+    results: Mapping[str, Any], baseline: Mapping[str, Any], tolerance: float
+) -> list[str]:
+    """Return a description of each regression compared to the baseline.
+
+    A benchmark regressed when its median runtime or peak memory grew by
+    more than tolerance percent. Benchmarks missing from the baseline are
+    not compared.
+    """
+    if baseline.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported baseline version {baseline.get('version')}")
+    regressions: list[str] = []
+    baseline_benchmarks: Mapping[str, Any] = baseline["benchmarks"]
+    for name, result in results["benchmarks"].items():
+        if (baseline_result := baseline_benchmarks.get(name)) is None:
+            continue
+        for key in COMPARED_KEYS:
+            if not (baseline_value := baseline_result.get(key)):
+                continue
+            change = (result[key] - baseline_value) / baseline_value * 100
+            if change > tolerance:
+                regressions.append(
+                    f"{name}: {key} {baseline_value:g} -> {result[key]:g}"
+                    f" (+{change:.1f}%)"
+                )
+    return regressions
@@ -76,6 +76,12 @@ _DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
     "bootstrap_persistent_errors"
 )
 
+# _DATA_DEFERRED_SETUP is a dict of domains which were not set up during
+# bootstrap and are set up on first use, the value is the config to set them
+# up with. Until then they are in hass.config.components as a stub so they
+# count as loaded.
+_DATA_DEFERRED_SETUP: HassKey[dict[str, ConfigType]] = HassKey("deferred_setup")
+
 NOTIFY_FOR_TRANSLATION_KEYS = [
     "config_validation_err",
     "platform_config_validation_err",
@@ -152,7 +158,7 @@ async def async_setup_component(
 
     This method is a coroutine.
     """
-    if domain in hass.config.components:
+    if domain in hass.config.components and not async_is_setup_deferred(hass, domain):
         return True
 
     setup_futures = hass.data.setdefault(_DATA_SETUP, {})
@@ -164,6 +170,10 @@ async def async_setup_component(
     setup_future = hass.loop.create_future()
     setup_futures[domain] = setup_future
 
+    if deferred := async_is_setup_deferred(hass, domain):
+        # Replace the stub of a component deferred at startup
+        hass.config.components.discard(domain)
+
     try:
         result = await _async_setup_component(hass, domain, config)
         setup_future.set_result(result)
@@ -187,6 +197,9 @@ async def async_setup_component(
                 # if there are no concurrent setup attempts
                 await future
         raise
+    finally:
+        if deferred:
+            hass.data[_DATA_DEFERRED_SETUP].pop(domain, None)
     return result
 
 
@@ -204,7 +217,7 @@ async def _async_process_dependencies(
     for dep in integration.dependencies:
         fut = setup_futures.get(dep)
         if fut is None:
-            if dep in hass.config.components:
+            if dep in hass.config.components and not async_is_setup_deferred(hass, dep):
                 continue
             fut = create_eager_task(
                 async_setup_component(hass, dep, config),
@@ -520,7 +533,10 @@ async def async_prepare_setup_platform(
     # We do this before we import the platform so the platform already knows
     # where the top level component is.
     #
-    if load_top_level_component := integration.domain not in hass.config.components:
+    if load_top_level_component := (
+        integration.domain not in hass.config.components
+        or async_is_setup_deferred(hass, integration.domain)
+    ):
         # Process deps and reqs as soon as possible, so that requirements are
         # available when we import the platform. We only do this if the integration
         # is not in hass.config.components yet, as we already processed them in
@@ -833,6 +849,39 @@ def async_get_domain_setup_times(
     return _setup_times(hass).get(domain, {})
 
 
+@callback
+def async_defer_setup_component(
+    hass: HomeAssistant, domain: str, config: ConfigType
+) -> None:
+    """Defer setting up a component until it is first used.
+
+    The component counts as loaded until then, so it is listed in
+    hass.config.components and the frontend offers its features.
+    """
+    hass.data.setdefault(_DATA_DEFERRED_SETUP, {})[domain] = config
+    hass.config.components.add(domain)
+
+
+@callback
+def async_is_setup_deferred(hass: HomeAssistant, domain: str) -> bool:
+    """Return if setting up a component is deferred until it is first used."""
+    return (
+        deferred := hass.data.get(_DATA_DEFERRED_SETUP)
+    ) is not None and domain in deferred
+
+
+async def async_setup_deferred_component(hass: HomeAssistant, domain: str) -> bool:
+    """Set up a component which was deferred, then return if it is set up.
+
+    Components which were not deferred are not set up.
+    """
+    if (deferred := hass.data.get(_DATA_DEFERRED_SETUP)) is None or (
+        config := deferred.get(domain)
+    ) is None:
+        return domain in hass.config.components
+    return await async_setup_component(hass, domain, config)
+
+
 async def async_wait_component(hass: HomeAssistant, domain: str) -> bool:
     """Wait until a component is set up if pending, then return if it is set up."""
     setup_done = hass.data.get(_DATA_SETUP_DONE, {})
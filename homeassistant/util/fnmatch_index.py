@@ -0,0 +1,104 @@
+"""Compiled fnmatch indexes used to match discovery data against matchers."""
+
+from collections.abc import Iterable
+from fnmatch import translate
+from functools import lru_cache
+import re
+
+_WILDCARD_CHARS = ("*", "?", "[")
+
+
+def is_fnmatch_pattern(pattern: str) -> bool:
+    """Return if the pattern contains fnmatch wildcards."""
+    return any(char in pattern for char in _WILDCARD_CHARS)
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the part of the pattern before the first wildcard."""
+    end = len(pattern)
+    for char in _WILDCARD_CHARS:
+        if (idx := pattern.find(char)) != -1 and idx < end:
+            end = idx
+    return pattern[:end]
+
+
+@lru_cache(maxsize=4096, typed=True)
+def compile_fnmatch(pattern: str) -> re.Pattern:
+    """Compile a fnmatch pattern."""
+    return re.compile(translate(pattern))
+
+
+@lru_cache(maxsize=4096, typed=True)
+def memorized_fnmatch(name: str, pattern: str) -> bool:
+    """Memorized version of fnmatch that has a larger lru_cache.
+
+    The default version of fnmatch only has a lru_cache of 256 entries.
+    With many devices we quickly reach that limit and end up compiling
+    the same pattern over and over again.
+
+    This cache is shared by all discovery integrations since the data
+    is going to be relatively the same since the devices will not
+    change frequently.
+    """
+    return bool(compile_fnmatch(pattern).match(name))
+
+
+class FnmatchIndex[_T]:
+    """Index of fnmatch patterns compiled once when matchers are loaded.
+
+    Patterns without wildcards are stored in a dict so they can be
+    resolved with a single lookup. Patterns with wildcards are bucketed
+    by their literal prefix so only patterns that share a prefix with
+    the name are tried.
+    """
+
+    __slots__ = ("_exact", "_prefix_lengths", "_prefixed", "_sequence")
+
+    def __init__(self, patterns: Iterable[tuple[str, _T]] = ()) -> None:
+        """Initialize the index."""
+        self._exact: dict[str, list[tuple[int, _T]]] = {}
+        self._prefixed: dict[str, list[tuple[int, re.Pattern, _T]]] = {}
+        self._prefix_lengths: tuple[int, ...] = ()
+        self._sequence = 0
+        for pattern, value in patterns:
+            self.add(pattern, value)
+
+    def add(self, pattern: str, value: _T) -> None:
+        """Add a pattern to the index."""
+        sequence = self._sequence
+        self._sequence += 1
+        if not is_fnmatch_pattern(pattern):
+            self._exact.setdefault(pattern, []).append((sequence, value))
+            return
+        prefix = _literal_prefix(pattern)
+        self._prefixed.setdefault(prefix, []).append(
+            (sequence, compile_fnmatch(pattern), value)
+        )
+        self._prefix_lengths = tuple(sorted({len(key) for key in self._prefixed}))
+
+    def __len__(self) -> int:
+        """Return the number of patterns in the index."""
+        return self._sequence
+
+    def match(self, name: str) -> list[_T]:
+        """Return the values of all patterns matching name.
+
+        Values are returned in the order their patterns were added.
+        """
+        matched: list[tuple[int, _T]] = []
+        if exact := self._exact.get(name):
+            matched.extend(exact)
+        name_length = len(name)
+        prefixed = self._prefixed
+        for length in self._prefix_lengths:
+            if length > name_length:
+                break
+            if candidates := prefixed.get(name[:length]):
+                matched.extend(
+                    (sequence, value)
+                    for sequence, pattern, value in candidates
+                    if pattern.match(name)
+                )
+        if len(matched) > 1:
+            matched.sort(key=lambda item: item[0])
+        return [value for _, value in matched]
@@ -16,6 +16,7 @@ from homeassistant.auth import (
     InvalidAuthError,
     auth_store,
     const as auth_const,
+    jwt_wrapper,
     models as auth_models,
 )
 from homeassistant.auth.const import GROUP_ID_ADMIN, MFA_SESSION_EXPIRATION
@@ -611,6 +612,42 @@ async def test_remove_refresh_token(hass: HomeAssistant) -> None:
     assert manager.async_validate_access_token(access_token) is None
 
 
+async def test_verified_access_tokens_are_cached(hass: HomeAssistant) -> None:
+    """Test that verified access tokens skip verification until invalidated."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=jwt_wrapper.verify_and_decode,
+    ) as mock_verify:
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        assert mock_verify.call_count == 1
+
+        # Tokens are verified again once expired
+        with freeze_time(
+            dt_util.utcnow()
+            + auth_const.ACCESS_TOKEN_EXPIRATION
+            + timedelta(seconds=11)
+        ):
+            assert manager.async_validate_access_token(access_token) is None
+        assert mock_verify.call_count == 2
+
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        user.is_active = False
+        assert manager.async_validate_access_token(access_token) is None
+        user.is_active = True
+
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        call_count = mock_verify.call_count
+        manager.async_remove_refresh_token(refresh_token)
+        assert manager.async_validate_access_token(access_token) is None
+        assert mock_verify.call_count == call_count + 1
+
+
 async def test_remove_expired_refresh_token(hass: HomeAssistant) -> None:
     """Test that expired refresh tokens are deleted."""
     manager = await auth.auth_manager_from_config(hass, [], [])
@@ -1019,6 +1019,10 @@ class MockEntityPlatform(entity_platform.EntityPlatform):
         # Otherwise the constructor will blow up.
         if isinstance(platform, Mock) and isinstance(platform.PARALLEL_UPDATES, Mock):
             platform.PARALLEL_UPDATES = 0
+        if isinstance(platform, Mock) and isinstance(
+            platform.PARALLEL_SERVICE_CALLS, Mock
+        ):
+            platform.PARALLEL_SERVICE_CALLS = None
 
         super().__init__(
             hass=hass,
@@ -51,6 +51,47 @@ async def test_api_list_state_entities(
     assert remote_data == local_data
 
 
+async def test_api_states_since(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test getting the states changed and removed since a version."""
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.removed", "hello")
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    version = int(resp.headers["ETag"].strip('"'))
+    assert version == hass.states.async_version()
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": f'"{version}"'}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    hass.states.async_set("test.entity", "world")
+    hass.states.async_remove("test.removed")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES,
+        params={"since": version},
+        headers={"If-None-Match": f'"{version}"'},
+    )
+    assert resp.status == HTTPStatus.OK
+    data = await resp.json()
+    assert data["version"] == hass.states.async_version()
+    assert data["reset"] is False
+    assert [item["entity_id"] for item in data["changed"]] == ["test.entity"]
+    assert data["changed"][0]["state"] == "world"
+    assert data["removed"] == ["test.removed"]
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": 0})
+    data = await resp.json()
+    assert data["reset"] is True
+    assert [item["entity_id"] for item in data["changed"]] == ["test.entity"]
+    assert data["removed"] == []
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": "abc"})
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+
 @pytest.mark.parametrize(
     ("entity_count", "expect_compression"),
     [
@@ -1129,6 +1129,48 @@ async def test_reload_single_remove_automation(
     assert len(calls) == 1
 
 
+async def test_reload_updates_references(hass: HomeAssistant) -> None:
+    """Test the referenced ids follow reloaded automations."""
+
+    def automation_config(entity_id: str) -> dict[str, Any]:
+        """Return an automation turning on an entity."""
+        return {
+            "id": "sun",
+            "alias": "hello",
+            "trigger": {"platform": "event", "event_type": "test_event"},
+            "action": [{"action": "test.automation", "entity_id": entity_id}],
+        }
+
+    assert await async_setup_component(
+        hass, automation.DOMAIN, {automation.DOMAIN: automation_config("light.one")}
+    )
+    assert automation.automations_with_entity(hass, "light.one") == ["automation.hello"]
+    assert automation.automations_with_entity(hass, "light.two") == []
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={automation.DOMAIN: automation_config("light.two")},
+    ):
+        await hass.services.async_call(
+            automation.DOMAIN, SERVICE_RELOAD, {CONF_ID: "sun"}, blocking=True
+        )
+
+    assert automation.automations_with_entity(hass, "light.one") == []
+    assert automation.automations_with_entity(hass, "light.two") == ["automation.hello"]
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={automation.DOMAIN: {}},
+    ):
+        await hass.services.async_call(
+            automation.DOMAIN, SERVICE_RELOAD, {CONF_ID: "sun"}, blocking=True
+        )
+
+    assert automation.automations_with_entity(hass, "light.two") == []
+
+
 async def test_reload_moved_automation_without_alias(
     hass: HomeAssistant, calls: list[ServiceCall]
 ) -> None:
@@ -1,17 +1,23 @@
 """Test the builtin backup platform."""
 
-from collections.abc import Generator
-from io import StringIO
+from collections.abc import AsyncIterator, Generator
+from io import BytesIO, StringIO
 import json
 from pathlib import Path
+import tarfile
 from tarfile import TarError
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from homeassistant.components.backup import DOMAIN, backup
+from homeassistant.components.backup import DOMAIN, BackupNotFound, backup
+from homeassistant.components.backup.const import (
+    CONF_DEDUPLICATED_BACKUPS,
+    DATA_MANAGER,
+)
 from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.setup import async_setup_component
 
 from .common import (
@@ -19,8 +25,10 @@ from .common import (
     TEST_BACKUP_DEF456,
     TEST_BACKUP_PATH_ABC123,
     TEST_BACKUP_PATH_DEF456,
+    aiter_from_iter,
 )
 
+from tests.common import get_fixture_path
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 real_read_backup = backup.read_backup
@@ -144,3 +152,61 @@ async def test_delete_backup(
     assert unlink.call_count == unlink_calls
     for call in unlink.mock_calls:
         assert Path(call.args[0].name) == unlink_path
+
+
+async def test_deduplicated_backup_agent(hass: HomeAssistant) -> None:
+    """Test the deduplicated backup agent is added by an option and stores backups."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    manager = hass.data[DATA_MANAGER]
+    assert "backup.deduplicated" not in manager.backup_agents
+
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_DEDUPLICATED_BACKUPS: True}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    await hass.async_block_till_done()
+    agent = manager.backup_agents["backup.deduplicated"]
+    assert "backup.deduplicated" not in manager.local_backup_agents
+
+    backup_path = get_fixture_path("test_backups/backup_compressed.tar", DOMAIN)
+    raw_backup = await hass.async_add_executor_job(backup_path.read_bytes)
+
+    async def open_stream() -> AsyncIterator[bytes]:
+        return aiter_from_iter((raw_backup,))
+
+    on_progress = MagicMock()
+    await agent.async_upload_backup(
+        open_stream=open_stream, backup=TEST_BACKUP_ABC123, on_progress=on_progress
+    )
+    on_progress.assert_called_with(bytes_uploaded=len(raw_backup))
+
+    stored_backup = await agent.async_get_backup(TEST_BACKUP_ABC123.backup_id)
+    assert await agent.async_list_backups() == [stored_backup]
+    downloaded = b"".join(
+        [
+            chunk
+            async for chunk in await agent.async_download_backup(
+                stored_backup.backup_id
+            )
+        ]
+    )
+    assert len(downloaded) == stored_backup.size
+    with tarfile.open(fileobj=BytesIO(downloaded)) as backup_file:
+        assert backup_file.getnames() == ["./backup.json", "homeassistant.tar"]
+
+    await agent.async_delete_backup(stored_backup.backup_id)
+    assert await agent.async_list_backups() == []
+    with pytest.raises(BackupNotFound):
+        await agent.async_get_backup(stored_backup.backup_id)
+
+    # Turning the option off removes the agent
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_DEDUPLICATED_BACKUPS: False}
+    )
+    await hass.async_block_till_done()
+    assert "backup.deduplicated" not in manager.backup_agents
@@ -0,0 +1,207 @@
+"""Tests for the deduplicating chunk store of the Backup integration."""
+
+import gzip
+import io
+import json
+from pathlib import Path
+import random
+import shutil
+import tarfile
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.backup import DOMAIN
+from homeassistant.components.backup.chunk_store import (
+    CHUNK_MAX_SIZE,
+    CHUNK_MIN_SIZE,
+    MIN_FREE_SPACE,
+    ChunkStore,
+    InsufficientSpaceError,
+    find_chunk_end,
+)
+from homeassistant.components.backup.models import InvalidBackupFilename
+
+from .common import TEST_BACKUP_ABC123
+
+from tests.common import get_fixture_path
+
+
+def _make_backup(files: dict[str, bytes], protected: bool = False) -> bytes:
+    """Return a backup with a compressed inner archive holding the files."""
+    inner = io.BytesIO()
+    with (
+        gzip.GzipFile(fileobj=inner, mode="wb", compresslevel=1, mtime=0) as gzip_file,
+        tarfile.open(fileobj=gzip_file, mode="w|") as inner_tar,
+    ):
+        for name, data in files.items():
+            tar_info = tarfile.TarInfo(f"data/{name}")
+            tar_info.size = len(data)
+            inner_tar.addfile(tar_info, io.BytesIO(data))
+    outer = io.BytesIO()
+    with tarfile.open(fileobj=outer, mode="w") as outer_tar:
+        raw_bytes = json.dumps(
+            {"compressed": True, "protected": protected, "slug": "abc123"}
+        ).encode()
+        tar_info = tarfile.TarInfo("./backup.json")
+        tar_info.size = len(raw_bytes)
+        outer_tar.addfile(tar_info, io.BytesIO(raw_bytes))
+        tar_info = tarfile.TarInfo("./homeassistant.tar.gz")
+        tar_info.size = inner.tell()
+        inner.seek(0)
+        outer_tar.addfile(tar_info, inner)
+    return outer.getvalue()
+
+
+def _read_backup(store: ChunkStore, chunks: list[str]) -> tarfile.TarFile:
+    """Return the backup reassembled from its chunks."""
+    return tarfile.open(
+        fileobj=io.BytesIO(b"".join(store.read_chunk(chunk) for chunk in chunks))
+    )
+
+
+def test_find_chunk_end() -> None:
+    """Test chunks end before a tar header or after the maximum size."""
+    buffer = bytearray(CHUNK_MAX_SIZE + 2048)
+    assert find_chunk_end(buffer, 0) == CHUNK_MAX_SIZE
+    assert find_chunk_end(buffer[:1000], 0) == 1000
+
+    # Headers are found by their magic at offset 257
+    header = CHUNK_MIN_SIZE + 1024
+    buffer[header + 257 : header + 262] = b"ustar"
+    assert find_chunk_end(buffer, 0) == header
+    # Headers are aligned to 512 bytes in the stream
+    assert find_chunk_end(buffer, 100) == CHUNK_MAX_SIZE
+
+    # Headers before the minimum size are skipped
+    buffer = bytearray(CHUNK_MAX_SIZE + 2048)
+    buffer[512 + 257 : 512 + 262] = b"ustar"
+    assert find_chunk_end(buffer, 0) == CHUNK_MAX_SIZE
+
+
+def test_add_backup_deduplicates(tmp_path: Path) -> None:
+    """Test chunks shared by backups are stored once."""
+    rng = random.Random(0)
+    database = bytearray(rng.randbytes(3 * CHUNK_MAX_SIZE))
+    files = {
+        **{f"config_{idx}.yaml": rng.randbytes(100000) for idx in range(10)},
+        "home-assistant_v2.db": bytes(database),
+    }
+    store = ChunkStore(tmp_path)
+    first = store.add_backup(io.BytesIO(_make_backup(files)), TEST_BACKUP_ABC123)
+
+    # A file changes in size and a part of the database changes in place
+    files["config_0.yaml"] += b"more"
+    database[CHUNK_MAX_SIZE : CHUNK_MAX_SIZE + 4096] = rng.randbytes(4096)
+    files["home-assistant_v2.db"] = bytes(database)
+    second = store.add_backup(io.BytesIO(_make_backup(files)), TEST_BACKUP_ABC123)
+
+    assert len(set(second.chunks) - set(first.chunks)) <= 3
+    assert len(list(tmp_path.glob("chunks/*/*"))) == len(
+        set(first.chunks) | set(second.chunks)
+    )
+
+    # Unprotected backups are stored with an uncompressed inner archive
+    with _read_backup(store, second.chunks) as backup:
+        assert backup.getnames() == ["./backup.json", "./homeassistant.tar"]
+        backup_json = backup.extractfile("./backup.json")
+        assert json.loads(backup_json.read())["compressed"] is False
+        with tarfile.open(
+            fileobj=backup.extractfile("./homeassistant.tar")
+        ) as inner_tar:
+            for name, data in files.items():
+                assert inner_tar.extractfile(f"data/{name}").read() == data
+    assert second.backup.size == sum(
+        len(store.read_chunk(chunk)) for chunk in second.chunks
+    )
+
+
+def test_add_backup_protected(tmp_path: Path) -> None:
+    """Test protected backups are stored unchanged."""
+    raw_backup = _make_backup({"secrets.yaml": b"secret"}, protected=True)
+    store = ChunkStore(tmp_path)
+    manifest = store.add_backup(io.BytesIO(raw_backup), TEST_BACKUP_ABC123)
+
+    with (
+        _read_backup(store, manifest.chunks) as backup,
+        tarfile.open(fileobj=io.BytesIO(raw_backup)) as original,
+    ):
+        assert backup.getnames() == ["./backup.json", "./homeassistant.tar.gz"]
+        for name in backup.getnames():
+            assert backup.extractfile(name).read() == original.extractfile(name).read()
+
+
+def test_add_backup_fixture(tmp_path: Path) -> None:
+    """Test a backup created by Home Assistant is decompressed."""
+    backup_path = get_fixture_path("test_backups/backup_compressed.tar", DOMAIN)
+    store = ChunkStore(tmp_path)
+    with backup_path.open("rb") as reader:
+        manifest = store.add_backup(reader, TEST_BACKUP_ABC123)
+
+    with (
+        _read_backup(store, manifest.chunks) as backup,
+        tarfile.open(backup_path) as original,
+    ):
+        inner = gzip.decompress(original.extractfile("homeassistant.tar.gz").read())
+        assert backup.extractfile("homeassistant.tar").read() == inner
+
+
+def test_manifests_and_remove_backup(tmp_path: Path) -> None:
+    """Test manifests are read back and unreferenced chunks are removed."""
+    store = ChunkStore(tmp_path)
+    first = store.add_backup(
+        io.BytesIO(_make_backup({"a.yaml": b"a"})), TEST_BACKUP_ABC123
+    )
+    # An interrupted backup leaves chunks without a manifest
+    store.add_chunk(b"orphan")
+
+    assert store.read_manifests() == {TEST_BACKUP_ABC123.backup_id: first}
+    assert first.backup.size != TEST_BACKUP_ABC123.size
+
+    store.remove_unreferenced_chunks()
+    assert {path.name for path in tmp_path.glob("chunks/*/*")} == set(first.chunks)
+
+    store.remove_backup(TEST_BACKUP_ABC123.backup_id)
+    assert store.read_manifests() == {}
+    assert list(tmp_path.glob("chunks/*/*")) == []
+
+
+def test_corrupt_chunk(tmp_path: Path) -> None:
+    """Test reading a corrupt chunk raises."""
+    store = ChunkStore(tmp_path)
+    chunk_id = store.add_chunk(b"data")
+    assert store.read_chunk(chunk_id) == b"data"
+
+    other_id = store.add_chunk(b"other")
+    (tmp_path / "chunks" / chunk_id[:2] / chunk_id).write_bytes(
+        (tmp_path / "chunks" / other_id[:2] / other_id).read_bytes()
+    )
+    with pytest.raises(ValueError, match="is corrupt"):
+        store.read_chunk(chunk_id)
+
+
+@pytest.mark.parametrize("backup_id", ["", "..", "../abc123", "abc/123"])
+def test_invalid_backup_id(tmp_path: Path, backup_id: str) -> None:
+    """Test backups with an id which is not a file name are refused."""
+    store = ChunkStore(tmp_path)
+    with pytest.raises(InvalidBackupFilename):
+        store.remove_backup(backup_id)
+
+
+@pytest.mark.parametrize("protected", [False, True])
+def test_add_backup_insufficient_space(tmp_path: Path, protected: bool) -> None:
+    """Test storing a backup fails when free disk space runs low."""
+    store = ChunkStore(tmp_path)
+    usage = shutil.disk_usage(tmp_path)
+    with (
+        patch(
+            "homeassistant.components.backup.chunk_store.shutil.disk_usage",
+            return_value=usage._replace(free=MIN_FREE_SPACE - 1),
+        ),
+        pytest.raises(InsufficientSpaceError, match="Not enough free disk space"),
+    ):
+        store.add_backup(
+            io.BytesIO(_make_backup({"a.yaml": b"a"}, protected=protected)),
+            TEST_BACKUP_ABC123,
+        )
+    assert store.read_manifests() == {}
@@ -24,7 +24,7 @@ from unittest.mock import (
 from aiohttp import FormData
 from freezegun.api import FrozenDateTimeFactory
 import pytest
-from securetar import SecureTarArchive, SecureTarFile
+from securetar import SecureTarArchive, SecureTarFile, SecureTarRootKeyContext
 
 from homeassistant.components.backup import (
     DOMAIN,
@@ -41,6 +41,7 @@ from homeassistant.components.backup.manager import (
     BackupManagerError,
     BackupManagerExceptionGroup,
     BackupManagerState,
+    CreateBackupProgressEvent,
     CreateBackupStage,
     CreateBackupState,
     NewBackup,
@@ -3622,6 +3623,10 @@ async def test_initiate_backup_per_agent_encryption(
             autospec=True,
             wraps=SecureTarArchive.__init__,
         ) as mock_secure_tar_archive,
+        patch(
+            "homeassistant.components.backup.manager.SecureTarRootKeyContext",
+            wraps=SecureTarRootKeyContext,
+        ) as mock_root_key_context,
     ):
         await ws_client.send_json_auto_id(
             {
@@ -3647,7 +3652,15 @@ async def test_initiate_backup_per_agent_encryption(
         await hass.async_block_till_done()
 
     assert mock_secure_tar_archive.mock_calls[0] == call(
-        ANY, ANY, "w", bufsize=4194304, create_version=3, password=inner_tar_password
+        ANY,
+        ANY,
+        "w",
+        bufsize=4194304,
+        create_version=3,
+        root_key_context=None if inner_tar_password is None else ANY,
+    )
+    assert mock_root_key_context.mock_calls == (
+        [] if inner_tar_password is None else [call(inner_tar_password)]
     )
 
     result = await ws_client.receive_json()
@@ -3939,6 +3952,52 @@ async def test_upload_progress_event(
     assert result["event"] == {"manager_state": BackupManagerState.IDLE}
 
 
+async def test_create_progress_event(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    generate_backup_id: MagicMock,
+) -> None:
+    """Test that progress events are fired while the core tar is written."""
+    await setup_backup_integration(hass)
+    manager = hass.data[DATA_MANAGER]
+
+    events: list[Any] = []
+    manager.async_subscribe_events(events.append)
+
+    ws_client = await hass_ws_client(hass)
+
+    with (
+        patch("pathlib.Path.open", mock_open(read_data=b"test")),
+        patch(
+            "homeassistant.components.backup.manager.CREATE_PROGRESS_INTERVAL_SECONDS",
+            1e-9,
+        ),
+    ):
+        await ws_client.send_json_auto_id(
+            {"type": "backup/generate", "agent_ids": [LOCAL_AGENT_ID]}
+        )
+        result = await ws_client.receive_json()
+        assert result["success"] is True
+
+        await hass.async_block_till_done()
+
+    stages = [getattr(e, "stage", None) for e in events]
+    first_progress = next(
+        idx for idx, e in enumerate(events) if isinstance(e, CreateBackupProgressEvent)
+    )
+    assert stages.index(CreateBackupStage.HOME_ASSISTANT) < first_progress
+    assert first_progress < stages.index(CreateBackupStage.UPLOAD_TO_AGENTS)
+
+    progress_events = [e for e in events if isinstance(e, CreateBackupProgressEvent)]
+    assert all(
+        e.stage == CreateBackupStage.HOME_ASSISTANT
+        and e.state == CreateBackupState.IN_PROGRESS
+        and e.bytes_processed > 0
+        and e.bytes_per_second > 0
+        for e in progress_events
+    )
+
+
 async def test_upload_progress_debounced(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
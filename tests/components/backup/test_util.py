@@ -2,8 +2,11 @@
 
 import asyncio
 from collections.abc import AsyncIterator
+from contextlib import ExitStack
 import dataclasses
+import gzip
 import hashlib
+from io import BytesIO
 import os
 from pathlib import Path
 import tarfile
@@ -18,6 +21,8 @@ from homeassistant.components.backup.models import InvalidBackupFilename
 from homeassistant.components.backup.util import (
     DecryptedBackupStreamer,
     EncryptedBackupStreamer,
+    ParallelGzipWriter,
+    open_inner_tar_stream,
     read_backup,
     suggested_filename,
     validate_password,
@@ -784,3 +789,103 @@ def test_suggested_filename(name: str, resulting_filename: str) -> None:
         size=1234,
     )
     assert suggested_filename(backup) == resulting_filename
+
+
+@pytest.mark.parametrize("size", [0, 1000, 2**16 * 5 + 123])
+def test_parallel_gzip_writer(size: int) -> None:
+    """Test the parallel gzip writer produces a valid gzip stream."""
+    data = (os.urandom(2**12) + b"home assistant" * 2**10) * (size // 18480 + 1)
+    data = data[:size]
+    output = BytesIO()
+    with ParallelGzipWriter(output, workers=3, block_size=2**16) as writer:
+        for idx in range(0, size, 1000):
+            writer.write(data[idx : idx + 1000])
+    assert gzip.decompress(output.getvalue()) == data
+
+
+def test_parallel_gzip_writer_progress() -> None:
+    """Test the parallel gzip writer reports the uncompressed bytes written."""
+    progress: list[int] = []
+    with ParallelGzipWriter(
+        BytesIO(), workers=2, block_size=2**16, on_progress=progress.append
+    ) as writer:
+        writer.write(b"a" * (2**16 * 3 + 5))
+    assert progress == [2**16, 2**16 * 2, 2**16 * 3, 2**16 * 3 + 5]
+
+
+def test_parallel_gzip_writer_tar() -> None:
+    """Test writing a tar stream with the parallel gzip writer."""
+    content = b"test content" * 2**14
+    output = BytesIO()
+    with (
+        ParallelGzipWriter(output, workers=2, block_size=2**16) as writer,
+        tarfile.open(fileobj=writer, mode="w|") as tar,
+    ):
+        tar_info = tarfile.TarInfo(name="data/test.txt")
+        tar_info.size = len(content)
+        tar.addfile(tar_info, BytesIO(content))
+
+    output.seek(0)
+    with tarfile.open(fileobj=output, mode="r|gz") as tar:
+        member = tar.next()
+        assert member.name == "data/test.txt"
+        assert tar.extractfile(member).read() == content
+
+
+def test_parallel_gzip_writer_error() -> None:
+    """Test the gzip trailer is not written if there is an error."""
+    output = BytesIO()
+    writer = ParallelGzipWriter(output, workers=2)
+
+    def write_and_fail() -> None:
+        with writer:
+            writer.write(b"test")
+            raise ValueError("Boom")
+
+    with pytest.raises(ValueError, match="Boom"):
+        write_and_fail()
+    with pytest.raises(EOFError):
+        gzip.decompress(output.getvalue())
+    with pytest.raises(ValueError, match="closed"):
+        writer.write(b"test")
+
+
+@pytest.mark.parametrize("password", [None, "hunter2"])
+def test_open_inner_tar_stream(tmp_path: Path, password: str | None) -> None:
+    """Test streaming a member of unknown size into a backup archive."""
+    content = os.urandom(2**20) + b"home assistant" * 2**16
+    backup_path = tmp_path / "backup.tar"
+    root_key_context = securetar.SecureTarRootKeyContext(password) if password else None
+    with securetar.SecureTarArchive(
+        backup_path, "w", create_version=3, root_key_context=root_key_context
+    ) as archive:
+        with (
+            open_inner_tar_stream(
+                archive.tar, "./homeassistant.tar.gz", root_key_context
+            ) as fileobj,
+            ParallelGzipWriter(fileobj, workers=2) as writer,
+            tarfile.open(fileobj=writer, mode="w|") as inner_tar,
+        ):
+            tar_info = tarfile.TarInfo(name="data/test.bin")
+            tar_info.size = len(content)
+            inner_tar.addfile(tar_info, BytesIO(content))
+        tar_info = tarfile.TarInfo(name="./backup.json")
+        tar_info.size = 2
+        archive.tar.addfile(tar_info, BytesIO(b"{}"))
+
+    with securetar.SecureTarArchive(backup_path, "r", password=password) as archive:
+        assert archive.tar.getnames() == ["./homeassistant.tar.gz", "./backup.json"]
+        assert archive.tar.extractfile("./backup.json").read() == b"{}"
+        member = archive.tar.getmember("./homeassistant.tar.gz")
+        with ExitStack() as stack:
+            if password is None:
+                inner_fileobj = archive.tar.extractfile(member)
+            else:
+                assert archive.validate(member)
+                inner_fileobj = stack.enter_context(archive.extract_tar(member))
+            inner_tar = stack.enter_context(
+                tarfile.open(fileobj=inner_fileobj, mode="r|gz")
+            )
+            inner_member = inner_tar.next()
+            assert inner_member.name == "data/test.bin"
+            assert inner_tar.extractfile(inner_member).read() == content
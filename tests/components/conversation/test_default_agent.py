@@ -1,6 +1,7 @@
 """Test for the default agent."""
 
 from collections import defaultdict
+from datetime import timedelta
 import os
 import tempfile
 from typing import Any
@@ -59,12 +60,14 @@ from homeassistant.helpers import (
     intent,
 )
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from . import expose_entity, expose_new
 
 from tests.common import (
     MockConfigEntry,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     setup_test_component_platform,
 )
@@ -3583,3 +3586,129 @@ async def test_intent_tool_call_with_error_response(hass: HomeAssistant) -> None
 
     # No tool call should be stored since the entity could not be matched
     assert not tool_call_found
+
+
+@pytest.mark.usefixtures("init_components")
+async def test_entity_names_updated_per_entity(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test only the names of a changed entity are recomputed."""
+    for object_id in ("kitchen", "bedroom"):
+        entity_registry.async_get_or_create(
+            "light", "demo", object_id, suggested_object_id=object_id
+        )
+        hass.states.async_set(
+            f"light.{object_id}",
+            "off",
+            attributes={ATTR_FRIENDLY_NAME: object_id.capitalize()},
+        )
+        expose_entity(hass, f"light.{object_id}", True)
+
+    calls = async_mock_service(hass, "light", "turn_on")
+    result = await conversation.async_converse(
+        hass, "turn on kitchen", None, Context(), None
+    )
+    assert result.response.response_type is intent.IntentResponseType.ACTION_DONE
+
+    with patch.object(
+        default_agent.DefaultAgent,
+        "_make_entity_names",
+        autospec=True,
+        side_effect=default_agent.DefaultAgent._make_entity_names,
+    ) as mock_make_entity_names:
+        entity_registry.async_update_entity("light.bedroom", aliases=["Guest room"])
+        result = await conversation.async_converse(
+            hass, "turn on guest room", None, Context(), None
+        )
+
+    assert result.response.response_type is intent.IntentResponseType.ACTION_DONE
+    assert [call.data["entity_id"] for call in calls] == [
+        ["light.kitchen"],
+        ["light.bedroom"],
+    ]
+    updated = {call[0][2].entity_id for call in mock_make_entity_names.call_args_list}
+    assert "light.bedroom" in updated
+    assert "light.kitchen" not in updated
+
+
+@pytest.mark.usefixtures("init_components")
+async def test_entity_names_updated_on_friendly_name_change(
+    hass: HomeAssistant,
+) -> None:
+    """Test the names of an entity are updated when its friendly name changes."""
+    hass.states.async_set(
+        "light.kitchen", "off", attributes={ATTR_FRIENDLY_NAME: "Kitchen"}
+    )
+    expose_entity(hass, "light.kitchen", True)
+
+    calls = async_mock_service(hass, "light", "turn_on")
+    result = await conversation.async_converse(
+        hass, "turn on kitchen", None, Context(), None
+    )
+    assert result.response.response_type is intent.IntentResponseType.ACTION_DONE
+
+    hass.states.async_set(
+        "light.kitchen", "off", attributes={ATTR_FRIENDLY_NAME: "Cooking area"}
+    )
+    await hass.async_block_till_done()
+    result = await conversation.async_converse(
+        hass, "turn on cooking area", None, Context(), None
+    )
+    assert result.response.response_type is intent.IntentResponseType.ACTION_DONE
+
+    result = await conversation.async_converse(
+        hass, "turn on kitchen", None, Context(), None
+    )
+    assert result.response.response_type is intent.IntentResponseType.ERROR
+    assert [call.data["entity_id"] for call in calls] == [
+        ["light.kitchen"],
+        ["light.kitchen"],
+    ]
+
+
+@pytest.mark.usefixtures("init_components")
+async def test_intents_cache(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test parsed sentence templates are stored and restored."""
+    agent = async_get_agent(hass)
+    assert isinstance(agent, default_agent.DefaultAgent)
+    language = hass.config.language
+    storage_key = f"{DOMAIN}.intents_cache.{language}"
+
+    await agent.async_reload(language)
+    await agent.async_get_or_load_intents(language)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert hass_storage[storage_key]["data"]["key"]["language"] == language
+
+    # The stored sentences are restored instead of parsed
+    await agent.async_reload(language)
+    with patch.object(
+        default_agent, "_dump_sentences", wraps=default_agent._dump_sentences
+    ) as mock_dump_sentences:
+        await agent.async_get_or_load_intents(language)
+    mock_dump_sentences.assert_not_called()
+
+    hass.states.async_set(
+        "light.kitchen", "off", attributes={ATTR_FRIENDLY_NAME: "Kitchen"}
+    )
+    expose_entity(hass, "light.kitchen", True)
+    calls = async_mock_service(hass, "light", "turn_on")
+    result = await conversation.async_converse(
+        hass, "turn on the kitchen", None, Context(), None
+    )
+    assert result.response.response_type is intent.IntentResponseType.ACTION_DONE
+    assert [call.data["entity_id"] for call in calls] == [["light.kitchen"]]
+
+    # Changed intents are parsed and stored again
+    hass_storage[storage_key]["data"]["key"]["custom_sentences"] = {
+        "custom_sentences/en/removed.yaml": 0
+    }
+    await agent.async_reload(language)
+    with patch.object(
+        default_agent, "_dump_sentences", wraps=default_agent._dump_sentences
+    ) as mock_dump_sentences:
+        await agent.async_get_or_load_intents(language)
+    mock_dump_sentences.assert_called_once()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert hass_storage[storage_key]["data"]["key"]["custom_sentences"] == {}
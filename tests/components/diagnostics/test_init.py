@@ -127,6 +127,8 @@ async def test_download_diagnostics(
     assert response == {
         "home_assistant": hass_sys_info,
         "setup_times": {},
+        "add_entities_times": {},
+        "entity_service_calls": {},
         "custom_components": {
             "test": {
                 "documentation": "http://example.com",
@@ -328,6 +330,8 @@ async def test_download_diagnostics(
             },
         ],
         "setup_times": {},
+        "add_entities_times": {},
+        "entity_service_calls": {},
     }
 
 
@@ -436,6 +436,68 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+@pytest.mark.usefixtures("recorder_mock")
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states with max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, DOMAIN, {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now) as freezer:
+        for idx in range(100):
+            freezer.move_to(now + timedelta(seconds=idx + 1))
+            hass.states.async_set("sensor.power", str(idx % 7))
+            hass.states.async_set("binary_sensor.door", "on" if idx % 2 else "off")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "end_time": (now + timedelta(seconds=101)).isoformat(),
+            "entity_ids": ["sensor.power", "binary_sensor.door"],
+            "significant_changes_only": False,
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    power_history = response["result"]["sensor.power"]
+    assert 2 < len(power_history) <= 12
+    assert power_history[0]["s"] == "0"
+    assert {"0", "6"} <= {state["s"] for state in power_history}
+    assert len(response["result"]["binary_sensor.door"]) == 100
+
+
+@pytest.mark.usefixtures("recorder_mock")
+async def test_history_during_period_bad_max_points(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period rejects a max_points below 2."""
+    await async_setup_component(hass, DOMAIN, {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "entity_ids": ["sensor.power"],
+            "start_time": dt_util.utcnow().isoformat(),
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_history_during_period_bad_start_time(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -579,6 +641,49 @@ async def test_history_stream_historical_only(
     }
 
 
+@pytest.mark.usefixtures("recorder_mock")
+async def test_history_stream_historical_only_chunked(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends historical states in entity chunks."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, DOMAIN, {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on")
+    hass.states.async_set("sensor.two", "off")
+    hass.states.async_set("sensor.three", "off")
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "MAX_HISTORY_STREAM_CHUNK_ENTITIES", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["type"] == "result"
+
+        response = await client.receive_json()
+        assert response["type"] == "event"
+        assert set(response["event"]["states"]) == {"sensor.one", "sensor.two"}
+
+        response = await client.receive_json()
+        assert response["type"] == "event"
+        assert set(response["event"]["states"]) == {"sensor.three"}
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -2614,3 +2614,101 @@ async def test_open_block_precision_same_second(
     assert hass.states.get("sensor.precision_count").state == "1"
     assert hass.states.get("sensor.precision_time").state == "0.0"
     assert hass.states.get("sensor.precision_ratio").state == "0.0"
+
+
+async def test_sensors_of_same_entity_share_history(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test sensors of the same entity query the recorder once between them."""
+    await hass.config.async_set_time_zone("UTC")
+    start_time = dt_util.utcnow().replace(hour=12, minute=0, second=0, microsecond=0)
+    queries = 0
+
+    def _fake_states(*args, **kwargs):
+        nonlocal queries
+        queries += 1
+        return {
+            "binary_sensor.state": [
+                ha.State(
+                    "binary_sensor.state",
+                    "off",
+                    last_changed=start_time.replace(hour=0),
+                    last_updated=start_time.replace(hour=0),
+                ),
+                ha.State(
+                    "binary_sensor.state",
+                    "on",
+                    last_changed=start_time.replace(hour=11),
+                    last_updated=start_time.replace(hour=11),
+                ),
+            ]
+        }
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        freeze_time(start_time),
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.state",
+                        "name": f"sensor{hour}",
+                        "state": "on",
+                        "start": (
+                            f"{{{{ utcnow().replace(hour={hour}, minute=0,"
+                            " second=0, microsecond=0) }}"
+                        ),
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    }
+                    for hour in (0, 6, 10)
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor0").state == "1.0"
+    assert hass.states.get("sensor.sensor6").state == "1.0"
+    assert hass.states.get("sensor.sensor10").state == "1.0"
+    setup_queries = queries
+    assert setup_queries <= 3
+
+    time = start_time + timedelta(minutes=30)
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        freeze_time(time),
+    ):
+        hass.states.async_set("binary_sensor.state", "off")
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor0").state == "1.5"
+    assert hass.states.get("sensor.sensor6").state == "1.5"
+    assert hass.states.get("sensor.sensor10").state == "1.5"
+    # The history is caught up once after it is kept up to date from events
+    assert queries == setup_queries + 1
+
+    time += timedelta(minutes=30)
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        freeze_time(time),
+    ):
+        async_fire_time_changed(hass, time)
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor0").state == "1.5"
+    assert hass.states.get("sensor.sensor6").state == "1.5"
+    assert hass.states.get("sensor.sensor10").state == "1.5"
+    assert queries == setup_queries + 1
@@ -1480,6 +1480,90 @@ async def test_subscribe_unsubscribe_logbook_stream(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_subscribe_logbook_stream_recent_events_from_memory(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a stream starting inside the recent window backfills from memory."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, domain, {})
+            for domain in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    await hass.async_block_till_done()
+    await asyncio.sleep(0.001)
+    now = dt_util.utcnow()
+
+    hass.states.async_set("binary_sensor.is_light", STATE_ON)
+    hass.states.async_set("binary_sensor.is_light", STATE_OFF)
+    state: State = hass.states.get("binary_sensor.is_light")
+    hass.states.async_set("binary_sensor.other", STATE_ON)
+    hass.states.async_set("binary_sensor.other", STATE_OFF)
+    await hass.async_block_till_done()
+
+    websocket_client = await hass_ws_client()
+    with patch.object(
+        websocket_api, "_async_get_ws_stream_events"
+    ) as mock_get_ws_stream_events:
+        await websocket_client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": ["binary_sensor.is_light"],
+            }
+        )
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == TYPE_RESULT
+        assert msg["success"]
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert msg["event"]["events"] == [
+            {
+                "entity_id": "binary_sensor.is_light",
+                "state": "off",
+                "when": state.last_updated_timestamp,
+            }
+        ]
+        assert msg["event"]["start_time"] == now.timestamp()
+        assert msg["event"]["partial"] is True
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert "partial" not in msg["event"]
+        assert msg["event"]["events"] == []
+
+        hass.states.async_set("binary_sensor.is_light", STATE_ON)
+        on_state: State = hass.states.get("binary_sensor.is_light")
+        await hass.async_block_till_done()
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert msg["event"]["events"] == [
+            {
+                "entity_id": "binary_sensor.is_light",
+                "state": "on",
+                "when": on_state.last_updated_timestamp,
+            }
+        ]
+
+    assert not mock_get_ws_stream_events.called
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 8
+    assert msg["success"]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_logbook_stream_state_attributes(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -1914,6 +1998,148 @@ async def test_subscribe_unsubscribe_logbook_stream_big_query(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_subscribe_unsubscribe_logbook_stream_big_query_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a large time frame is delivered in daily chunks, newest first."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, domain, {})
+            for domain in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    two_days_ago = now - timedelta(days=2, hours=1)
+    four_days_ago = now - timedelta(days=4, hours=1)
+    five_days_ago = now - timedelta(days=5)
+
+    with freeze_time(four_days_ago):
+        hass.states.async_set("binary_sensor.four_days_ago", STATE_ON)
+        hass.states.async_set("binary_sensor.four_days_ago", STATE_OFF)
+        four_day_old_state: State = hass.states.get("binary_sensor.four_days_ago")
+        await hass.async_block_till_done()
+
+    with freeze_time(two_days_ago):
+        hass.states.async_set("binary_sensor.two_days_ago", STATE_ON)
+        hass.states.async_set("binary_sensor.two_days_ago", STATE_OFF)
+        two_day_old_state: State = hass.states.get("binary_sensor.two_days_ago")
+        await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": five_days_ago.isoformat(),
+            "end_time": (now - timedelta(minutes=1)).isoformat(),
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    # Older chunks come in newest first and only chunks with events are sent
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["partial"] is True
+    assert msg["event"]["events"] == [
+        {
+            "entity_id": "binary_sensor.two_days_ago",
+            "state": "off",
+            "when": two_day_old_state.last_updated_timestamp,
+        }
+    ]
+
+    # The last chunk is not partial since no more historical data is coming
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert "partial" not in msg["event"]
+    assert msg["event"]["events"] == [
+        {
+            "entity_id": "binary_sensor.four_days_ago",
+            "state": "off",
+            "when": four_day_old_state.last_updated_timestamp,
+        }
+    ]
+
+
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_subscribe_unsubscribe_logbook_stream_big_query_partial_day(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test an empty oldest chunk shorter than a day is not sent when live."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, domain, {})
+            for domain in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    two_days_ago = now - timedelta(days=2, hours=1)
+
+    with freeze_time(two_days_ago):
+        hass.states.async_set("binary_sensor.two_days_ago", STATE_ON)
+        hass.states.async_set("binary_sensor.two_days_ago", STATE_OFF)
+        two_day_old_state: State = hass.states.get("binary_sensor.two_days_ago")
+        await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": (now - timedelta(days=4, hours=5)).isoformat(),
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["partial"] is True
+    assert msg["event"]["events"] == [
+        {
+            "entity_id": "binary_sensor.two_days_ago",
+            "state": "off",
+            "when": two_day_old_state.last_updated_timestamp,
+        }
+    ]
+
+    # The empty chunks are skipped and the end of the
+    # historical data is signaled once
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert "partial" not in msg["event"]
+    assert msg["event"]["events"] == []
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+
+    assert msg["id"] == 8
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_device(
     recorder_mock: Recorder,
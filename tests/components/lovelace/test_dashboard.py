@@ -138,6 +138,70 @@ async def test_lovelace_from_storage_migration(
     assert not response["success"]
 
 
+async def test_lovelace_config_known_hash(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the config is only sent if it differs from the known hash."""
+    hass_storage[dashboard.CONFIG_STORAGE_KEY_DEFAULT] = {
+        "version": 1,
+        "key": dashboard.CONFIG_STORAGE_KEY_DEFAULT,
+        "data": {"config": {"views": [{"title": "Home"}]}},
+    }
+    assert await async_setup_component(hass, DOMAIN, {})
+    client = await hass_ws_client(hass)
+
+    await client.send_json(
+        {"id": 5, "type": "lovelace/config", "url_path": "lovelace", "known_hash": None}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    config_hash = response["result"]["hash"]
+    assert response["result"] == {
+        "hash": config_hash,
+        "unchanged": False,
+        "config": {"views": [{"title": "Home"}]},
+    }
+
+    await client.send_json(
+        {
+            "id": 6,
+            "type": "lovelace/config",
+            "url_path": "lovelace",
+            "known_hash": config_hash,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"hash": config_hash, "unchanged": True}
+
+    await client.send_json(
+        {
+            "id": 7,
+            "type": "lovelace/config/save",
+            "url_path": "lovelace",
+            "config": {"yo": "hello"},
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    await client.send_json(
+        {
+            "id": 8,
+            "type": "lovelace/config",
+            "url_path": "lovelace",
+            "known_hash": config_hash,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["hash"] != config_hash
+    assert response["result"]["unchanged"] is False
+    assert response["result"]["config"] == {"yo": "hello"}
+
+
 async def test_lovelace_dashboard_deleted_re_registers_panel(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
@@ -22,6 +22,7 @@ from homeassistant.components.profiler.services import (
     SERVICE_DUMP_SOCKETS,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_POLL_SCHEDULE,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
@@ -35,6 +36,7 @@ from homeassistant.components.profiler.services import (
 from homeassistant.const import CONF_ENABLED, CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.poll_scheduler import async_get_poll_scheduler
 from homeassistant.util import dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -272,6 +274,35 @@ async def test_log_scheduled(
     await hass.async_block_till_done()
 
 
+async def test_log_poll_schedule(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test we can log the pollers scheduled per second."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_POLL_SCHEDULE)
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_POLL_SCHEDULE, {}, blocking=True)
+    assert "Pollers scheduled per second from now: none" in caplog.text
+    caplog.clear()
+
+    poller = object()
+    async_get_poll_scheduler(hass).async_scheduled(poller, hass.loop.time() + 5.5)
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_POLL_SCHEDULE, {}, blocking=True)
+    assert "Pollers scheduled per second from now: 5s: 1" in caplog.text
+    caplog.clear()
+
+    async_get_poll_scheduler(hass).async_unscheduled(poller)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 @pytest.mark.usefixtures("socket_enabled")
 async def test_dump_sockets(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
@@ -343,6 +374,10 @@ async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture)
     assert "_dummy_test_lru_stats" in caplog.text
     assert "CacheInfo" in caplog.text
     assert "sqlalchemy_test" in caplog.text
+    assert (
+        "Cache stats for shared condition results: "
+        "{'conditions': 0, 'hits': 0, 'misses': 0}"
+    ) in caplog.text
 
 
 async def test_log_object_sources(
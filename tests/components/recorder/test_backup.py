@@ -1,10 +1,15 @@
 """Test backup platform for the Recorder integration."""
 
 from contextlib import AbstractContextManager, nullcontext as does_not_raise
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from homeassistant.components.backup import (
+    BackupFileSnapshots,
+    current_backup_file_snapshots,
+)
 from homeassistant.components.recorder.backup import async_post_backup, async_pre_backup
 from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
@@ -110,3 +115,54 @@ async def test_async_post_backup_failure(hass: HomeAssistant) -> None:
     ):
         await async_post_backup(hass)
     assert unlock_mock.called
+
+
+@pytest.mark.parametrize(
+    ("database_included", "snapshot_result", "lock_calls", "unlock_calls"),
+    [(True, True, 0, 0), (True, False, 1, 1), (False, True, 1, 1)],
+)
+@pytest.mark.usefixtures("recorder_mock")
+async def test_async_pre_post_backup_snapshot(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    database_included: bool,
+    snapshot_result: bool,
+    lock_calls: int,
+    unlock_calls: int,
+) -> None:
+    """Test the database is copied instead of locked during a Core backup."""
+    file_snapshots = BackupFileSnapshots(
+        database_included=database_included, directory=tmp_path
+    )
+    token = current_backup_file_snapshots.set(file_snapshots)
+    with (
+        patch(
+            "homeassistant.components.recorder.backup._database_name",
+            return_value="home-assistant_v2.db",
+        ),
+        patch(
+            "homeassistant.components.recorder.core.Recorder.async_snapshot_database",
+            return_value=snapshot_result,
+        ) as snapshot_mock,
+        patch(
+            "homeassistant.components.recorder.core.Recorder.lock_database"
+        ) as lock_mock,
+        patch(
+            "homeassistant.components.recorder.core.Recorder.unlock_database"
+        ) as unlock_mock,
+    ):
+        await async_pre_backup(hass)
+        await async_post_backup(hass)
+    current_backup_file_snapshots.reset(token)
+
+    assert len(lock_mock.mock_calls) == lock_calls
+    assert len(unlock_mock.mock_calls) == unlock_calls
+    if lock_calls:
+        assert file_snapshots.files == {}
+    else:
+        snapshot_mock.assert_called_once_with(tmp_path / "home-assistant_v2.db")
+        assert file_snapshots.files == {
+            "home-assistant_v2.db": tmp_path / "home-assistant_v2.db",
+            "home-assistant_v2.db-shm": None,
+            "home-assistant_v2.db-wal": None,
+        }
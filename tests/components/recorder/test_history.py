@@ -1039,3 +1039,50 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+async def test_get_significant_states_max_points(hass: HomeAssistant) -> None:
+    """Test numeric states are downsampled when max_points is set."""
+    start = dt_util.utcnow()
+    values = [50, 10, 90, 30, 40, 60, 20, 80, 70, 55] * 10
+
+    with freeze_time(start) as freezer:
+        for idx, value in enumerate(values):
+            freezer.move_to(start + timedelta(seconds=idx + 1))
+            hass.states.async_set("sensor.power", str(value))
+            hass.states.async_set("switch.test", "on" if idx % 2 else "off")
+        freezer.move_to(start + timedelta(seconds=len(values) + 1))
+        hass.states.async_set("sensor.power", "unavailable")
+        hass.states.async_set("sensor.power", "42")
+    await async_wait_recording_done(hass)
+    end = start + timedelta(seconds=len(values) + 2)
+
+    full = history.get_significant_states(
+        hass,
+        start,
+        end,
+        entity_ids=["sensor.power", "switch.test"],
+        significant_changes_only=False,
+    )
+    hist = history.get_significant_states(
+        hass,
+        start,
+        end,
+        entity_ids=["sensor.power", "switch.test"],
+        significant_changes_only=False,
+        max_points=10,
+    )
+
+    assert len(full["sensor.power"]) == len(values) + 2
+    power_states = [state.state for state in hist["sensor.power"]]
+    assert len(power_states) <= 15
+    assert power_states[0] == "50"
+    assert power_states[-2:] == ["unavailable", "42"]
+    assert "10" in power_states
+    assert "90" in power_states
+    assert [state.last_updated for state in hist["sensor.power"]] == sorted(
+        state.last_updated for state in hist["sensor.power"]
+    )
+    assert [state.state for state in hist["switch.test"]] == [
+        state.state for state in full["switch.test"]
+    ]
@@ -40,6 +40,7 @@ from homeassistant.components.recorder.util import (
     retryable_database_job,
     retryable_database_job_method,
     session_scope,
+    snapshot_db_sqlite,
 )
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
@@ -1239,3 +1240,55 @@ def test_retryable_database_job_method(
         assert test.job(instance) == retval
 
     assert len(mock_job.mock_calls) == 1
+
+
+def test_snapshot_db_sqlite(tmp_path: Path) -> None:
+    """Test snapshotting a SQLite database while it is written to."""
+    database_path = tmp_path / "test.db"
+    snapshot_path = tmp_path / "snapshots" / "test.db"
+    writer = sqlite3.connect(database_path, isolation_level=None)
+    writer.execute("PRAGMA journal_mode=WAL")
+    writer.execute("CREATE TABLE test (data BLOB)")
+    writer.executemany(
+        "INSERT INTO test VALUES (?)", ((os.urandom(512),) for _ in range(5000))
+    )
+
+    def _progress(status: int, remaining: int, total: int) -> None:
+        writer.execute("INSERT INTO test VALUES (?)", (b"new",))
+
+    class _WritingConnection(sqlite3.Connection):
+        """Connection which writes to the database between backup steps."""
+
+        def backup(self, target: sqlite3.Connection, **kwargs: Any) -> None:
+            super().backup(target, pages=kwargs["pages"], progress=_progress)
+
+    real_connect = sqlite3.connect
+
+    def _connect(*args: Any, **kwargs: Any) -> sqlite3.Connection:
+        return real_connect(*args, factory=_WritingConnection, **kwargs)
+
+    with (
+        patch.object(util, "DB_SNAPSHOT_PAGES", 10),
+        patch("homeassistant.components.recorder.util.sqlite3.connect", _connect),
+    ):
+        assert snapshot_db_sqlite(str(database_path), snapshot_path) is True
+
+    snapshot = sqlite3.connect(snapshot_path)
+    assert snapshot.execute("SELECT COUNT(*) FROM test").fetchone() == (5000,)
+    assert snapshot.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+    snapshot.close()
+    assert writer.execute("SELECT COUNT(*) FROM test").fetchone()[0] > 5000
+    writer.close()
+
+
+def test_snapshot_db_sqlite_not_wal(tmp_path: Path) -> None:
+    """Test a SQLite database which is not in WAL mode is not snapshotted."""
+    database_path = tmp_path / "test.db"
+    snapshot_path = tmp_path / "snapshot.db"
+    assert snapshot_db_sqlite(str(database_path), snapshot_path) is False
+
+    connection = sqlite3.connect(database_path)
+    connection.execute("CREATE TABLE test (data BLOB)")
+    connection.close()
+    assert snapshot_db_sqlite(str(database_path), snapshot_path) is False
+    assert not snapshot_path.exists()
@@ -0,0 +1,142 @@
+"""Test the incrementally updated statistics."""
+
+from collections import deque
+from collections.abc import Callable
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.incremental import (
+    DistanceAbsolute,
+    IncrementalStatistic,
+    Mean,
+    Median,
+    Percentile,
+    StandardDeviation,
+    Sum,
+    ValueMax,
+    ValueMin,
+    Variance,
+)
+
+
+def _percentile_95(samples: deque[float]) -> float:
+    """Return the 95th percentile the way the statistics sensor did."""
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="exclusive")[94]
+
+
+@pytest.mark.parametrize(
+    ("incremental_statistic", "expected_fn"),
+    [
+        (Mean, statistics.mean),
+        (Sum, math.fsum),
+        (
+            Variance,
+            lambda samples: statistics.variance(samples) if len(samples) > 1 else 0.0,
+        ),
+        (
+            StandardDeviation,
+            lambda samples: statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        ),
+        (Median, statistics.median),
+        (Percentile, _percentile_95),
+        (ValueMax, max),
+        (ValueMin, min),
+        (DistanceAbsolute, lambda samples: max(samples) - min(samples)),
+    ],
+)
+@pytest.mark.parametrize("buffer_size", [1, 2, 7, 50])
+def test_sliding_window(
+    incremental_statistic: Callable[[], IncrementalStatistic],
+    expected_fn: Callable[[deque[float]], float],
+    buffer_size: int,
+) -> None:
+    """Test the statistics equal the ones calculated from all samples."""
+    rng = random.Random(buffer_size)
+    statistic = incremental_statistic()
+    samples: deque[float] = deque()
+    assert statistic.value(95) is None
+
+    for _ in range(500):
+        value = rng.choice(
+            (
+                rng.uniform(-1000, 1000),
+                float(rng.randint(-3, 3)),
+                rng.gauss(0, 1) * 10 ** rng.randint(-100, 100),
+            )
+        )
+        if len(samples) == buffer_size:
+            statistic.remove(samples.popleft())
+        samples.append(value)
+        statistic.add(value)
+        if len(samples) > 1 and rng.random() < 0.1:
+            statistic.remove(samples.popleft())
+
+        assert statistic.value(95) == expected_fn(samples)
+
+    while samples:
+        statistic.remove(samples.popleft())
+    assert statistic.value(95) is None
+
+
+@pytest.mark.parametrize(
+    ("incremental_statistic", "expected"),
+    [
+        (Mean, 2.0),
+        (Sum, 2.0),
+        (Variance, 0.0),
+        (StandardDeviation, 0.0),
+        (Median, 2.0),
+        (Percentile, 2.0),
+        (ValueMax, 2.0),
+        (ValueMin, 2.0),
+        (DistanceAbsolute, 0.0),
+    ],
+)
+def test_nan_sample(
+    incremental_statistic: Callable[[], IncrementalStatistic], expected: float
+) -> None:
+    """Test a NaN sample makes the statistic NaN until it leaves the window."""
+    statistic = incremental_statistic()
+    for value in (1.0, math.nan, 2.0):
+        statistic.add(value)
+    assert math.isnan(statistic.value(50))
+
+    statistic.remove(1.0)
+    statistic.remove(math.nan)
+    assert statistic.value(50) == expected
+
+
+def test_infinite_samples() -> None:
+    """Test infinite samples are summed without losing the finite ones."""
+    mean = Mean()
+    for value in (1.0, math.inf, 2.0):
+        mean.add(value)
+    assert mean.value(50) == math.inf
+
+    mean.add(-math.inf)
+    assert math.isnan(mean.value(50))
+
+    mean.remove(1.0)
+    mean.remove(math.inf)
+    assert mean.value(50) == -math.inf
+
+    mean.remove(2.0)
+    mean.remove(-math.inf)
+    mean.add(1e308)
+    mean.add(1e308)
+    assert mean.value(50) == 1e308
+
+
+def test_standard_deviation_factor() -> None:
+    """Test the standard deviation is multiplied by the factor."""
+    distance = StandardDeviation(2 * 1.96)
+    distance.add(1.0)
+    assert distance.value(50) == 0.0
+
+    distance.add(3.0)
+    assert distance.value(50) == 2 * 1.96 * statistics.stdev([1.0, 3.0])
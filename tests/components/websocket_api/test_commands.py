@@ -50,8 +50,13 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration, async_get_integration
-from homeassistant.setup import async_set_domains_to_be_loaded, async_setup_component
+from homeassistant.setup import (
+    async_defer_setup_component,
+    async_set_domains_to_be_loaded,
+    async_setup_component,
+)
 from homeassistant.util.json import json_loads
 from homeassistant.util.yaml.loader import JSON_TYPE, parse_yaml
 
@@ -931,6 +936,40 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+async def test_get_state_changes(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_state_changes command."""
+    hass.states.async_set("greeting.hello", "world")
+    hass.states.async_set("greeting.bye", "universe")
+
+    await websocket_client.send_json_auto_id({"type": "get_state_changes", "since": 0})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "version": hass.states.async_version(),
+        "reset": True,
+        "changed": [state.as_dict() for state in hass.states.async_all()],
+        "removed": [],
+    }
+
+    version = msg["result"]["version"]
+    hass.states.async_set("greeting.hello", "again")
+    hass.states.async_remove("greeting.bye")
+
+    await websocket_client.send_json_auto_id(
+        {"type": "get_state_changes", "since": version}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "version": hass.states.async_version(),
+        "reset": False,
+        "changed": [hass.states.get("greeting.hello").as_dict()],
+        "removed": ["greeting.bye"],
+    }
+
+
 async def test_get_services(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -1239,6 +1278,27 @@ async def test_get_config(
     assert result == config
 
 
+async def test_get_config_deferred_integration(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_config lists integrations deferred at startup as loaded."""
+    setup_calls = 0
+
+    async def mock_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+        nonlocal setup_calls
+        setup_calls += 1
+        return True
+
+    mock_integration(hass, MockModule("lazy", async_setup=mock_setup))
+    async_defer_setup_component(hass, "lazy", {})
+
+    await websocket_client.send_json_auto_id({"type": "get_config"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert "lazy" in msg["result"]["components"]
+    assert setup_calls == 0
+
+
 async def test_ping(websocket_client: MockHAClientWebSocket) -> None:
     """Test get_panels command."""
     await websocket_client.send_json_auto_id({"type": "ping"})
@@ -6,11 +6,16 @@ from aiohttp import WSMsgType
 import voluptuous as vol
 
 from homeassistant.components.websocket_api import (
+    ActiveConnection,
     async_register_command,
     const,
     messages,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.setup import async_defer_setup_component
+
+from tests.common import MockModule, mock_integration
 
 
 async def test_invalid_message_format(websocket_client) -> None:
@@ -53,6 +58,45 @@ async def test_unknown_command(websocket_client) -> None:
     assert msg["error"]["code"] == const.ERR_UNKNOWN_COMMAND
 
 
+async def test_command_of_deferred_integration(
+    hass: HomeAssistant, websocket_client
+) -> None:
+    """Test a command of a deferred integration sets it up first."""
+
+    def handle_info(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict
+    ) -> None:
+        connection.send_result(msg["id"], {"set_up": True})
+
+    async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+        async_register_command(
+            hass,
+            "lazy/info",
+            handle_info,
+            messages.BASE_COMMAND_MESSAGE_SCHEMA.extend({"type": "lazy/info"}),
+        )
+        return True
+
+    mock_integration(hass, MockModule("lazy", async_setup=async_setup))
+    async_defer_setup_component(hass, "lazy", {})
+    # The stub of the deferred integration counts as loaded
+    assert "lazy" in hass.config.components
+
+    await websocket_client.send_json({"id": 5, "type": "lazy/info"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    assert msg["result"] == {"set_up": True}
+    assert "lazy" in hass.config.components
+
+    # Unknown commands of a deferred integration are still unknown
+    await websocket_client.send_json({"id": 6, "type": "lazy/unknown"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNKNOWN_COMMAND
+
+
 async def test_handler_failing(hass: HomeAssistant, websocket_client) -> None:
     """Test a command that raises."""
     async_register_command(
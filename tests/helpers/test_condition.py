@@ -71,6 +71,7 @@ from homeassistant.helpers.condition import (
     EntityNumericalConditionWithUnitBase,
     _async_get_condition_platform,
     _HistoryPrimingManager,
+    async_get_condition_memo_stats,
     async_validate_condition_config,
     make_entity_numerical_condition,
     make_entity_numerical_condition_with_unit,
@@ -4212,6 +4213,181 @@ async def test_state_condition_multiple_target_states(hass: HomeAssistant) -> No
     assert test.async_check() is False
 
 
+async def test_state_condition_shared_result(hass: HomeAssistant) -> None:
+    """Test identical state conditions share their result for unchanged states."""
+    condition_cls = make_entity_state_condition(_DEFAULT_DOMAIN_SPECS, STATE_ON)
+
+    async def async_get_conditions(
+        hass: HomeAssistant,
+    ) -> dict[str, type[Condition]]:
+        return {"_": condition_cls}
+
+    mock_integration(hass, MockModule("test"))
+    mock_platform(
+        hass, "test.condition", Mock(async_get_conditions=async_get_conditions)
+    )
+
+    config = await async_validate_condition_config(
+        hass,
+        {
+            CONF_CONDITION: "test",
+            CONF_TARGET: {CONF_ENTITY_ID: ["test.entity_1", "test.entity_2"]},
+            CONF_OPTIONS: {ATTR_BEHAVIOR: BEHAVIOR_ANY},
+        },
+    )
+    test_1 = await condition.async_from_config(hass, config)
+    test_2 = await condition.async_from_config(hass, config)
+    assert async_get_condition_memo_stats(hass) == {
+        "conditions": 1,
+        "hits": 0,
+        "misses": 0,
+    }
+
+    hass.states.async_set("test.entity_1", STATE_OFF)
+    hass.states.async_set("test.entity_2", STATE_ON)
+    with patch.object(
+        condition_cls, "is_valid_state", autospec=True, return_value=True
+    ) as is_valid_state_mock:
+        assert test_1.async_check() is True
+        assert test_2.async_check() is True
+    assert len(is_valid_state_mock.mock_calls) == 1
+    assert async_get_condition_memo_stats(hass) == {
+        "conditions": 1,
+        "hits": 1,
+        "misses": 1,
+    }
+
+    hass.states.async_set("test.entity_2", STATE_OFF)
+    assert test_2.async_check() is False
+    assert test_1.async_check() is False
+    assert async_get_condition_memo_stats(hass) == {
+        "conditions": 1,
+        "hits": 2,
+        "misses": 2,
+    }
+
+    test_1.async_unload()
+    assert async_get_condition_memo_stats(hass)["conditions"] == 1
+    test_2.async_unload()
+    assert async_get_condition_memo_stats(hass)["conditions"] == 0
+
+
+async def test_legacy_state_condition_shared_result(hass: HomeAssistant) -> None:
+    """Test identical legacy state conditions share their result until a change."""
+    config = {
+        "condition": "state",
+        "entity_id": ["sensor.temperature_1", "sensor.temperature_2"],
+        "state": "100",
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test_1 = await condition.async_from_config(hass, config)
+    test_2 = await condition.async_from_config(hass, config)
+    assert async_get_condition_memo_stats(hass) == {
+        "conditions": 1,
+        "hits": 0,
+        "misses": 0,
+    }
+
+    hass.states.async_set("sensor.temperature_1", 100)
+    hass.states.async_set("sensor.temperature_2", 101)
+    expected_trace = {
+        "": [{"result": {"result": False}}],
+        "entity_id/0": [
+            {"result": {"result": True, "state": "100", "wanted_state": "100"}}
+        ],
+        "entity_id/1": [
+            {"result": {"result": False, "state": "101", "wanted_state": "100"}}
+        ],
+    }
+    with patch(
+        "homeassistant.helpers.condition.state", wraps=condition.state
+    ) as state_mock:
+        assert not test_1.async_check()
+        assert_condition_trace(expected_trace)
+        # The result and the entity traces are reused
+        assert not test_2.async_check()
+        assert_condition_trace(expected_trace)
+    assert len(state_mock.mock_calls) == 2
+    assert async_get_condition_memo_stats(hass) == {
+        "conditions": 1,
+        "hits": 1,
+        "misses": 1,
+    }
+
+    # Any state change invalidates the result
+    hass.states.async_set("sensor.temperature_2", 100)
+    assert test_2.async_check()
+    assert test_1.async_check()
+    assert async_get_condition_memo_stats(hass) == {
+        "conditions": 1,
+        "hits": 2,
+        "misses": 2,
+    }
+
+    test_1.async_unload()
+    assert async_get_condition_memo_stats(hass)["conditions"] == 1
+    test_2.async_unload()
+    assert async_get_condition_memo_stats(hass)["conditions"] == 0
+
+
+async def test_legacy_numeric_state_condition_shared_result(
+    hass: HomeAssistant,
+) -> None:
+    """Test legacy numeric state conditions share results of their thresholds."""
+    config = {
+        "condition": "numeric_state",
+        "entity_id": "sensor.temperature",
+        "above": "input_number.low",
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test_1 = await condition.async_from_config(hass, config)
+    test_2 = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 20)
+    hass.states.async_set("input_number.low", 10)
+    assert test_1.async_check()
+    assert test_2.async_check()
+
+    hass.states.async_set("input_number.low", 30)
+    assert not test_1.async_check()
+    assert not test_2.async_check()
+    assert async_get_condition_memo_stats(hass) == {
+        "conditions": 1,
+        "hits": 2,
+        "misses": 2,
+    }
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "condition": "numeric_state",
+            "entity_id": "sensor.temperature",
+            "value_template": "{{ state.state | float * 2 }}",
+            "below": 110,
+        },
+        {
+            "condition": "state",
+            "entity_id": "sensor.temperature",
+            "state": "100",
+            "for": {"seconds": 5},
+        },
+        {"condition": "template", "value_template": "{{ true }}"},
+    ],
+)
+async def test_legacy_condition_result_not_shared(
+    hass: HomeAssistant, config: ConfigType
+) -> None:
+    """Test legacy conditions depending on templates or time are not shared."""
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    await condition.async_from_config(hass, config)
+    assert async_get_condition_memo_stats(hass)["conditions"] == 0
+
+
 @pytest.mark.parametrize(
     "state_value",
     [STATE_UNAVAILABLE, STATE_UNKNOWN],
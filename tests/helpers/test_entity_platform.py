@@ -40,6 +40,8 @@ from homeassistant.helpers.entity_component import (
 from homeassistant.helpers.entity_platform import (
     AddConfigEntryEntitiesCallback,
     AddEntitiesCallback,
+    EntityPlatform,
+    async_get_add_entities_times,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
@@ -582,6 +584,45 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
     assert peak_update_count == 1
 
 
+async def test_parallel_service_calls_shared_by_config_entry(
+    hass: HomeAssistant,
+) -> None:
+    """Test platforms of a config entry share the service call limit."""
+    config_entry = MockConfigEntry(domain="hub")
+    config_entry.add_to_hass(hass)
+    other_config_entry = MockConfigEntry(domain="hub")
+    other_config_entry.add_to_hass(hass)
+    platform = MockPlatform()
+    platform.PARALLEL_SERVICE_CALLS = 2
+
+    platforms: list[EntityPlatform] = []
+    for domain, entry in (
+        ("light", config_entry),
+        ("switch", config_entry),
+        ("light", other_config_entry),
+    ):
+        entity_platform = MockEntityPlatform(
+            hass, domain=domain, platform_name="hub", platform=platform
+        )
+        entity_platform.config_entry = entry
+        entity_platform.async_prepare()
+        platforms.append(entity_platform)
+
+    light_platform, switch_platform, other_light_platform = platforms
+    semaphore = light_platform.async_get_parallel_service_calls_semaphore()
+    assert semaphore is not None
+    assert semaphore._value == 2
+    assert switch_platform.async_get_parallel_service_calls_semaphore() is semaphore
+    other_semaphore = other_light_platform.async_get_parallel_service_calls_semaphore()
+    assert other_semaphore is not None
+    assert other_semaphore is not semaphore
+
+    no_limit_platform = MockEntityPlatform(
+        hass, domain="light", platform_name="other", platform=MockPlatform()
+    )
+    assert no_limit_platform.async_get_parallel_service_calls_semaphore() is None
+
+
 async def test_raise_error_on_update(hass: HomeAssistant) -> None:
     """Test the add entity if they raise an error on update."""
     updates = []
@@ -1524,6 +1565,158 @@ async def test_device_info_called(
     assert device.via_device_id == via.id
 
 
+async def test_add_entities_times(hass: HomeAssistant) -> None:
+    """Test the number of entities added and the time it took are recorded."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddConfigEntryEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        async_add_entities([MockEntity(unique_id=str(idx)) for idx in range(10)])
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    assert async_get_add_entities_times(hass, config_entry.domain) == {}
+    assert await entity_platform.async_setup_entry(config_entry)
+    await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 10
+    times = async_get_add_entities_times(hass, config_entry.domain)
+    assert times[entity_platform.domain]["entities"] == 10
+    assert times[entity_platform.domain]["seconds"] > 0
+
+
+async def test_add_entities_times_exclude_update(hass: HomeAssistant) -> None:
+    """Test the update before adding is not counted as time adding entities."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+
+    async def async_update() -> None:
+        """Mock a slow update."""
+        await asyncio.sleep(0.1)
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddConfigEntryEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        entity = MockEntity(unique_id="slow")
+        entity.async_update = async_update
+        async_add_entities([entity], update_before_add=True)
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    assert await entity_platform.async_setup_entry(config_entry)
+    await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 1
+    times = async_get_add_entities_times(hass, config_entry.domain)
+    assert times[entity_platform.domain]["entities"] == 1
+    assert 0 < times[entity_platform.domain]["seconds"] < 0.1
+
+
+async def test_device_info_resolved_once_per_batch(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test entities sharing a device info resolve it once per call."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+    device_info = DeviceInfo(identifiers={("hue", "1234")}, name="Light")
+    other_info = DeviceInfo(identifiers={("hue", "1234")}, name="Renamed")
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddConfigEntryEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                *(
+                    MockEntity(unique_id=str(idx), device_info=device_info)
+                    for idx in range(10)
+                ),
+                MockEntity(unique_id="other", device_info=other_info),
+                MockEntity(unique_id="last", device_info=device_info),
+            ]
+        )
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with patch.object(
+        device_registry,
+        "async_get_or_create",
+        wraps=device_registry.async_get_or_create,
+    ) as mock_get_or_create:
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    # A different device info for the same device is resolved again
+    assert mock_get_or_create.call_count == 3
+    device = device_registry.async_get_device(identifiers={("hue", "1234")})
+    assert device is not None
+    assert device.name == "Light"
+    assert len(hass.states.async_entity_ids()) == 12
+
+
+async def test_device_info_via_device_added_later(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test a via device added later in the same call is linked."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+    device_info = DeviceInfo(
+        identifiers={("hue", "1234")}, name="Light", via_device=("hue", "via-id")
+    )
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddConfigEntryEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(unique_id="light-1", device_info=device_info),
+                MockEntity(
+                    unique_id="bridge",
+                    device_info=DeviceInfo(
+                        identifiers={("hue", "via-id")}, name="Bridge"
+                    ),
+                ),
+                MockEntity(unique_id="light-2", device_info=device_info),
+            ]
+        )
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    assert await entity_platform.async_setup_entry(config_entry)
+    await hass.async_block_till_done()
+
+    via = device_registry.async_get_device(identifiers={("hue", "via-id")})
+    device = device_registry.async_get_device(identifiers={("hue", "1234")})
+    assert via is not None
+    assert device is not None
+    assert device.via_device_id == via.id
+
+
 async def test_device_info_not_overrides(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
@@ -1068,6 +1068,51 @@ async def test_track_template_result(hass: HomeAssistant) -> None:
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_shares_renders(hass: HomeAssistant) -> None:
+    """Test identical templates are rendered once per state change."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.office", "off")
+    source = (
+        "{{ [states('light.kitchen'), states('light.office')]"
+        " | select('eq', 'on') | list | count }}"
+    )
+    templates = [Template(source, hass), Template(source, hass)]
+    with_variables = Template(source, hass)
+    runs: list[list[int]] = [[], [], []]
+
+    def _make_callback(run: list[int]) -> Callable[..., None]:
+        @ha.callback
+        def _callback(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            run.append(updates.pop().result)
+
+        return _callback
+
+    for template, variables, run in zip(
+        [*templates, with_variables], [None, None, {"x": 1}], runs, strict=True
+    ):
+        async_track_template_result(
+            hass, [TrackTemplate(template, variables)], _make_callback(run)
+        )
+    await hass.async_block_till_done()
+    renders = [template._renders for template in (*templates, with_variables)]
+
+    hass.states.async_set("light.office", "on")
+    await hass.async_block_till_done()
+    assert runs == [[2], [2], [2]]
+    # The second tracker reuses the render of the first one
+    assert templates[0]._renders == renders[0] + 1
+    assert templates[1]._renders == renders[1]
+    # Templates with variables are not shared
+    assert with_variables._renders == renders[2] + 1
+
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert runs == [[2, 1], [2, 1], [2, 1]]
+
+
 async def test_track_template_result_none(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -195,3 +195,30 @@ async def test_script_vars_parallel() -> None:
 
     assert script_vars._full_scope == {"x": "b", "y": 1, "z": 1}
     assert script_vars.local_scope == {"x": "b", "y": 1, "z": 1}
+
+
+async def test_script_vars_non_parallel_snapshot() -> None:
+    """Test snapshots are shared between scopes until a variable is assigned."""
+    script_vars = ScriptRunVariables.create_top_level({"x": 1})
+    script_vars_2 = script_vars.enter_scope()
+
+    snapshot = script_vars.non_parallel_snapshot()
+    assert snapshot == {"x": 1}
+    assert script_vars_2.non_parallel_snapshot() is snapshot
+    with pytest.raises(TypeError):
+        snapshot["x"] = 2  # type: ignore[index]
+
+    script_vars_2["x"] = 2
+    assert snapshot == {"x": 1}
+    snapshot_2 = script_vars_2.non_parallel_snapshot()
+    assert snapshot_2 == {"x": 2}
+    assert script_vars.non_parallel_snapshot() is snapshot_2
+
+    script_vars_2.define_local("y", 1)
+    assert script_vars_2.non_parallel_snapshot() == {"x": 2, "y": 1}
+    assert script_vars.non_parallel_snapshot() == {"x": 2}
+
+    script_vars_3 = script_vars.enter_scope(parallel=True)
+    script_vars_3.assign_parallel_protected("z", 1)
+    assert script_vars_3.non_parallel_snapshot() == {"z": 1}
+    assert script_vars.non_parallel_snapshot() == {"x": 2}
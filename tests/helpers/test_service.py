@@ -6,7 +6,7 @@ from copy import deepcopy
 import io
 import threading
 from typing import Any
-from unittest.mock import AsyncMock, Mock, call as mock_call, patch
+from unittest.mock import ANY, AsyncMock, Mock, call as mock_call, patch
 
 import pytest
 from pytest_unordered import unordered
@@ -61,6 +61,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockModule,
+    MockPlatform,
     MockUser,
     RegistryEntryWithDefaults,
     async_mock_service,
@@ -1742,6 +1743,61 @@ async def test_call_single_entity_uses_parallel_updates(
     mock_entities_method.assert_called_once_with(entity)
 
 
+async def test_call_multiple_entities_uses_parallel_service_calls(
+    hass: HomeAssistant,
+    mock_entities: dict[str, MockEntity],
+    mock_entities_method: AsyncMock,
+) -> None:
+    """Check calls to entities of one config entry share its service call limit."""
+    config_entry = MockConfigEntry(domain="hub")
+    config_entry.add_to_hass(hass)
+    platform = MockPlatform()
+    platform.PARALLEL_SERVICE_CALLS = 1
+    entity_platform = MockEntityPlatform(hass, platform_name="hub", platform=platform)
+    entity_platform.config_entry = config_entry
+    kitchen = mock_entities["light.kitchen"]
+    living_room = mock_entities["light.living_room"]
+    kitchen.platform = entity_platform
+    living_room.platform = entity_platform
+
+    semaphore = entity_platform.async_get_parallel_service_calls_semaphore()
+    assert semaphore is not None
+    # Hold the semaphore so the service would block if it respects it
+    await semaphore.acquire()
+
+    task = hass.async_create_task(
+        service.entity_service_call(
+            hass,
+            mock_entities,
+            "test_method",
+            ServiceCall(
+                hass,
+                "test_domain",
+                "test_service",
+                {"entity_id": ["light.kitchen", "light.living_room"]},
+            ),
+        )
+    )
+    await asyncio.sleep(0)
+    mock_entities_method.assert_not_called()
+
+    semaphore.release()
+    await task
+
+    assert mock_entities_method.call_count == 2
+    stats = service.async_get_entity_service_call_stats(hass, config_entry.entry_id)
+    assert stats == {
+        "calls": 2,
+        "mean_seconds": ANY,
+        "max_seconds": ANY,
+        "mean_queue_seconds": ANY,
+        "max_queue_seconds": ANY,
+    }
+    # Both calls waited for the semaphore held above
+    assert stats["max_queue_seconds"] > 0
+    assert service.async_get_entity_service_call_stats(hass, "unknown") == {}
+
+
 async def test_call_context_user_not_exist(hass: HomeAssistant) -> None:
     """Check we don't allow deleted users to do things."""
     with pytest.raises(exceptions.UnknownUser) as err:
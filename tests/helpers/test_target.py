@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Mapping
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -1097,3 +1098,60 @@ async def test_target_trickle_down_to_splits(
     assert selected.referenced_devices == splits
     assert COMPOSITE_ID not in selected.referenced_devices
     assert selected.indirectly_referenced == {"sensor.a", "sensor.b"}
+
+
+async def test_extract_referenced_entity_ids_cached(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+) -> None:
+    """Test registry resolution is cached until a registry changes."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    floor = floor_registry.async_create("Floor 2")
+    area = area_registry.async_create("Kitchen", floor_id=floor.floor_id)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("test", "device")},
+    )
+    device_registry.async_update_device(device.id, area_id=area.id)
+    device_light = entity_registry.async_get_or_create(
+        "light", "test", "device_light", device_id=device.id
+    )
+    target_selection = target.TargetSelection({ATTR_FLOOR_ID: floor.floor_id})
+
+    with patch.object(
+        target,
+        "_async_resolve_registry_targets",
+        wraps=target._async_resolve_registry_targets,
+    ) as mock_resolve:
+        selected = target.async_extract_referenced_entity_ids(hass, target_selection)
+        assert selected.indirectly_referenced == {device_light.entity_id}
+        assert selected.referenced_areas == {area.id}
+        assert selected.referenced_devices == {device.id}
+        assert mock_resolve.call_count == 1
+
+        # The caller owns the returned sets
+        selected.indirectly_referenced.clear()
+        selected = target.async_extract_referenced_entity_ids(hass, target_selection)
+        assert selected.indirectly_referenced == {device_light.entity_id}
+        assert mock_resolve.call_count == 1
+
+        # An entity added to the area invalidates the cached result
+        area_light = entity_registry.async_get_or_create("light", "test", "area_light")
+        entity_registry.async_update_entity(area_light.entity_id, area_id=area.id)
+        selected = target.async_extract_referenced_entity_ids(hass, target_selection)
+        assert selected.indirectly_referenced == {
+            device_light.entity_id,
+            area_light.entity_id,
+        }
+        assert mock_resolve.call_count == 2
+
+        # Moving the area off the floor invalidates the cached result
+        area_registry.async_update(area.id, floor_id=None)
+        selected = target.async_extract_referenced_entity_ids(hass, target_selection)
+        assert selected.indirectly_referenced == set()
+        assert selected.referenced_areas == set()
+        assert mock_resolve.call_count == 3
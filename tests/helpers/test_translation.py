@@ -1,6 +1,7 @@
 """Test the translation helper."""
 
 import asyncio
+from datetime import timedelta
 import pathlib
 from typing import Any
 from unittest.mock import Mock, call, patch
@@ -12,6 +13,9 @@ from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import translation
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture(autouse=True)
@@ -509,6 +513,76 @@ async def test_caching(hass: HomeAssistant) -> None:
         assert len(mock_build.mock_calls) > 1
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_translation_bundle(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test unchanged translation files are loaded from the bundle."""
+    en_file = hass.config.path("custom_components", "test", "translations", "en.json")
+    # Files of domains which are not requested are not saved again
+    hass_storage["core.translations.en"] = {
+        "version": translation.TRANSLATION_BUNDLE_STORAGE_VERSION,
+        "key": "core.translations.en",
+        "data": {"files": {"removed": ["/removed/en.json", 1, 2, {"title": "Gone"}]}},
+    }
+    translations = await translation.async_get_translations(
+        hass, "en", "entity", ["test"]
+    )
+    assert translations["component.test.entity.switch.other1.name"] == "Other 1"
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow()
+        + timedelta(seconds=translation.TRANSLATION_BUNDLE_SAVE_DELAY + 1),
+    )
+    await hass.async_block_till_done()
+    bundled_files = hass_storage["core.translations.en"]["data"]["files"]
+    assert list(bundled_files) == ["test"]
+    assert bundled_files["test"][0] == en_file
+    assert bundled_files["test"][3]["entity"]["switch"]["other1"]["name"] == "Other 1"
+
+    # A new cache takes the unchanged file from the bundle
+    with patch(
+        "homeassistant.helpers.translation.load_json",
+        side_effect=translation.load_json,
+    ) as mock_load_json:
+        assert (
+            await translation._TranslationCache(hass).async_fetch(
+                "en", "entity", {"test"}
+            )
+            == translations
+        )
+    assert mock_load_json.mock_calls == []
+
+    # Changed files are read again
+    bundled_files["test"][1] -= 1
+    with patch(
+        "homeassistant.helpers.translation.load_json",
+        side_effect=translation.load_json,
+    ) as mock_load_json:
+        assert (
+            await translation._TranslationCache(hass).async_fetch(
+                "en", "entity", {"test"}
+            )
+            == translations
+        )
+    assert mock_load_json.mock_calls == [call(pathlib.Path(en_file))]
+
+    # Moved files are read again
+    bundled_files["test"][0] = "/old/path/en.json"
+    with patch(
+        "homeassistant.helpers.translation.load_json",
+        side_effect=translation.load_json,
+    ) as mock_load_json:
+        assert (
+            await translation._TranslationCache(hass).async_fetch(
+                "en", "entity", {"test"}
+            )
+            == translations
+        )
+    assert mock_load_json.mock_calls == [call(pathlib.Path(en_file))]
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_custom_component_translations(hass: HomeAssistant) -> None:
     """Test getting translation from custom components."""
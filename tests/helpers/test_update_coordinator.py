@@ -23,6 +23,7 @@ from homeassistant.exceptions import (
     OAuth2TokenRequestReauthError,
 )
 from homeassistant.helpers import frame, update_coordinator
+from homeassistant.helpers.poll_scheduler import async_get_poll_scheduler
 from homeassistant.util.dt import utcnow
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -1020,6 +1021,84 @@ async def test_always_callback_when_always_update_is_true(
     remove_callbacks()
 
 
+async def test_keyed_coordinator_updates_changed_keys(hass: HomeAssistant) -> None:
+    """Test only listeners of changed keys are called by a keyed coordinator."""
+    mocked_data: dict[str, int] = {}
+    mocked_exception: Exception | None = None
+
+    async def _update_method() -> dict[str, int]:
+        if mocked_exception is not None:
+            raise mocked_exception
+        return dict(mocked_data)
+
+    crd = update_coordinator.KeyedDataUpdateCoordinator[str, int](
+        hass,
+        _LOGGER,
+        config_entry=None,
+        name="test",
+        update_method=_update_method,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+    )
+    callbacks = {key: Mock() for key in ("a", "b", "c")}
+    unkeyed_callback = Mock()
+    remove_callbacks = [
+        crd.async_add_listener(update_callback, key)
+        for key, update_callback in callbacks.items()
+    ]
+    remove_callbacks.append(crd.async_add_listener(unkeyed_callback))
+
+    def called() -> set[str | None]:
+        """Return the keys of the called listeners and reset them."""
+        keys: set[str | None] = {
+            key for key, update_callback in callbacks.items() if update_callback.called
+        }
+        if unkeyed_callback.called:
+            keys.add(None)
+        for update_callback in (*callbacks.values(), unkeyed_callback):
+            update_callback.reset_mock()
+        return keys
+
+    mocked_data = {"a": 1, "b": 1}
+    await crd.async_refresh()
+    assert called() == {"a", "b", "c", None}
+
+    await crd.async_refresh()
+    assert called() == {None}
+
+    mocked_data = {"a": 2, "b": 1}
+    await crd.async_refresh()
+    assert called() == {"a", None}
+
+    mocked_data = {"a": 2, "c": 1}
+    await crd.async_refresh()
+    assert called() == {"b", "c", None}
+
+    mocked_exception = aiohttp.ClientError("Client Failure")
+    await crd.async_refresh()
+    assert called() == {"a", "b", "c", None}
+
+    mocked_exception = None
+    await crd.async_refresh()
+    assert called() == {"a", "b", "c", None}
+
+    crd.async_set_updated_data({"a": 2, "c": 2})
+    assert called() == {"c", None}
+
+    # The mapping can be changed in place by push updates
+    data = dict(crd.data)
+    crd.async_set_updated_data(data)
+    assert called() == {None}
+    data["a"] = 3
+    crd.async_set_updated_data(data)
+    assert called() == {"a", None}
+    del data["c"]
+    crd.async_set_updated_data(data)
+    assert called() == {"c", None}
+
+    for remove_callback in remove_callbacks:
+        remove_callback()
+
+
 async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     """Test last_update_success_time is set before calling listeners."""
     last_update_success_times: list[datetime | None] = []
@@ -1383,3 +1462,110 @@ async def test_callbacks_does_not_stop_coordinator(
     assert crd.last_update_success is True
 
     await crd.async_shutdown()
+
+
+async def test_refreshes_spread_during_startup(hass: HomeAssistant) -> None:
+    """Test coordinators set up during startup spread their first refresh."""
+    hass.set_state(CoreState.starting)
+    crds = [get_crd(hass, timedelta(seconds=30)) for _ in range(16)]
+    unsubs = [crd.async_add_listener(lambda: None) for crd in crds]
+
+    with (
+        patch.object(hass.loop, "time", return_value=1_000.0),
+        patch.object(hass.loop, "call_at") as mock_call_at,
+    ):
+        for crd in crds:
+            await crd.async_refresh()
+
+        seconds = [int(call[0][0]) - 1_000 for call in mock_call_at.call_args_list]
+        assert all(15 <= second <= 30 for second in seconds)
+        # Every coordinator got a second of its own
+        assert len(set(seconds)) == 16
+
+        poll_scheduler = async_get_poll_scheduler(hass)
+        assert sum(poll_scheduler.async_load_per_second().values()) == 16
+
+        # Once started the regular interval is used again
+        hass.set_state(CoreState.running)
+        mock_call_at.reset_mock()
+        crds[0]._schedule_refresh()
+        when = mock_call_at.call_args[0][0]
+        assert when == 1_030.0 + crds[0]._microsecond
+
+    for unsub in unsubs:
+        unsub()
+    assert poll_scheduler.async_load_per_second() == {}
+
+
+async def test_adaptive_update_interval(hass: HomeAssistant) -> None:
+    """Test the update interval adapts to how often the data changes."""
+    data = 1
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        config_entry=None,
+        name="test",
+        update_method=AsyncMock(side_effect=lambda: data),
+        update_interval=timedelta(seconds=40),
+        min_update_interval=timedelta(seconds=10),
+        max_update_interval=timedelta(seconds=60),
+    )
+    unsub = crd.async_add_listener(lambda: None)
+    await crd.async_refresh()
+    assert crd._update_interval_seconds == 40
+
+    # Refreshes which are not scheduled do not adapt the interval
+    await crd.async_refresh()
+    assert crd._update_interval_seconds == 40
+
+    await crd._handle_refresh_interval()
+    assert crd._update_interval_seconds == 60
+    await crd._handle_refresh_interval()
+    assert crd._update_interval_seconds == 60
+
+    data = 2
+    await crd._handle_refresh_interval()
+    assert crd._update_interval_seconds == 30
+    data = 3
+    await crd._handle_refresh_interval()
+    assert crd._update_interval_seconds == 15
+    data = 4
+    await crd._handle_refresh_interval()
+    assert crd._update_interval_seconds == 10
+
+    await crd._handle_refresh_interval()
+    assert crd._update_interval_seconds == 15
+    assert crd.update_interval == timedelta(seconds=15)
+
+    unsub()
+    await crd.async_shutdown()
+
+
+@pytest.mark.parametrize(
+    ("update_interval", "min_update_interval", "max_update_interval"),
+    [
+        (timedelta(seconds=40), timedelta(seconds=10), None),
+        (timedelta(seconds=40), None, timedelta(seconds=60)),
+        (timedelta(seconds=40), timedelta(seconds=60), timedelta(seconds=10)),
+        (timedelta(seconds=5), timedelta(seconds=10), timedelta(seconds=60)),
+        (timedelta(seconds=90), timedelta(seconds=10), timedelta(seconds=60)),
+    ],
+)
+async def test_adaptive_update_interval_invalid_bounds(
+    hass: HomeAssistant,
+    update_interval: timedelta,
+    min_update_interval: timedelta | None,
+    max_update_interval: timedelta | None,
+) -> None:
+    """Test invalid bounds of the adaptive update interval are rejected."""
+    with pytest.raises(ValueError):
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            config_entry=None,
+            name="test",
+            update_method=AsyncMock(return_value=1),
+            update_interval=update_interval,
+            min_update_interval=min_update_interval,
+            max_update_interval=max_update_interval,
+        )
@@ -0,0 +1,91 @@
+"""Test the benchmark script results."""
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.scripts import benchmark
+from homeassistant.scripts.benchmark.results import (
+    RESULTS_VERSION,
+    BenchmarkResult,
+    compare_with_baseline,
+    percentile,
+    results_as_dict,
+)
+
+
+def test_percentile() -> None:
+    """Test percentiles are interpolated between values."""
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 90) == pytest.approx(4.6)
+    assert percentile(values, 100) == 5.0
+    assert percentile([2.0], 99) == 2.0
+
+
+def test_results_as_dict() -> None:
+    """Test summarizing the runs of benchmarks."""
+    results = results_as_dict(
+        {"bench": BenchmarkResult(runtimes=(3.0, 1.0, 2.0), peak_memory=1024)}
+    )
+    assert results["version"] == RESULTS_VERSION
+    assert results["benchmarks"] == {
+        "bench": {
+            "runs": 3,
+            "min": 1.0,
+            "max": 3.0,
+            "mean": 2.0,
+            "median": 2.0,
+            "p90": pytest.approx(2.8),
+            "p95": pytest.approx(2.9),
+            "p99": pytest.approx(2.98),
+            "peak_memory": 1024,
+        }
+    }
+
+
+def test_compare_with_baseline() -> None:
+    """Test regressions beyond the tolerance are reported."""
+    baseline = results_as_dict(
+        {
+            "faster": BenchmarkResult(runtimes=(2.0,), peak_memory=1000),
+            "slower": BenchmarkResult(runtimes=(1.0,), peak_memory=1000),
+            "more_memory": BenchmarkResult(runtimes=(1.0,), peak_memory=1000),
+            "within_tolerance": BenchmarkResult(runtimes=(1.0,), peak_memory=1000),
+        }
+    )
+    results = results_as_dict(
+        {
+            "faster": BenchmarkResult(runtimes=(1.0,), peak_memory=1000),
+            "slower": BenchmarkResult(runtimes=(1.5,), peak_memory=1000),
+            "more_memory": BenchmarkResult(runtimes=(1.0,), peak_memory=2000),
+            "within_tolerance": BenchmarkResult(runtimes=(1.05,), peak_memory=1050),
+            "new": BenchmarkResult(runtimes=(1.0,), peak_memory=1000),
+        }
+    )
+
+    assert compare_with_baseline(results, baseline, 10) == [
+        "slower: median 1 -> 1.5 (+50.0%)",
+        "more_memory: peak_memory 1000 -> 2000 (+100.0%)",
+    ]
+    assert compare_with_baseline(results, baseline, 200) == []
+
+
+def test_compare_with_unsupported_baseline() -> None:
+    """Test comparing with a baseline of another version raises."""
+    results = results_as_dict(
+        {"bench": BenchmarkResult(runtimes=(1.0,), peak_memory=1000)}
+    )
+    with pytest.raises(ValueError, match="Unsupported baseline version"):
+        compare_with_baseline(results, {**results, "version": 0}, 10)
+
+
+@pytest.mark.parametrize("runs", ["0", "-1", "one"])
+def test_invalid_runs(runs: str) -> None:
+    """Test the number of runs must be a positive integer."""
+    with (
+        patch("sys.argv", ["hass", "--script", "benchmark", "all", "--runs", runs]),
+        pytest.raises(SystemExit),
+    ):
+        benchmark.run([])
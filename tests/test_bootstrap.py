@@ -12,7 +12,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from homeassistant import bootstrap, config as config_util, core, loader, runner
+from homeassistant import bootstrap, config as config_util, core, loader, runner, setup
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     BASE_PLATFORMS,
@@ -719,6 +719,39 @@ async def test_setup_after_deps_not_trigger_load(hass: HomeAssistant) -> None:
     assert "second_dep" in hass.config.components
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_deferrable_integrations(hass: HomeAssistant) -> None:
+    """Test deferrable integrations are set up on first use."""
+    mock_integration(
+        hass, MockModule(domain="lazy", partial_manifest={"deferrable": True})
+    )
+    mock_integration(
+        hass, MockModule(domain="lazy_dep", partial_manifest={"deferrable": True})
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="root", partial_manifest={"after_dependencies": ["lazy_dep"]}
+        ),
+    )
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"lazy": {}, "lazy_dep": {}, "root": {}}
+    )
+
+    # Deferrable integrations other integrations depend on are not deferred
+    assert "root" in hass.config.components
+    assert "lazy_dep" in hass.config.components
+    assert not setup.async_is_setup_deferred(hass, "lazy_dep")
+    # Deferred integrations count as loaded until they are set up
+    assert "lazy" in hass.config.components
+    assert setup.async_is_setup_deferred(hass, "lazy")
+
+    assert await setup.async_setup_deferred_component(hass, "lazy")
+    assert "lazy" in hass.config.components
+    assert not setup.async_is_setup_deferred(hass, "lazy")
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_not_present(hass: HomeAssistant) -> None:
     """Test after_dependencies when referenced integration doesn't exist."""
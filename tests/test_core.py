@@ -1729,6 +1729,59 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_changes_since(hass: HomeAssistant) -> None:
+    """Test getting the states changed and removed since a version."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.kitchen", "on")
+    version = hass.states.async_version()
+    assert hass.states.async_changes_since(version) == ([], [])
+
+    hass.states.async_set("light.bowl", "off")
+    # Reported states do not change the version
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_remove("light.kitchen")
+    hass.states.async_set("switch.ac", "on")
+    assert hass.states.async_version() == version + 3
+
+    changed, removed = hass.states.async_changes_since(version)
+    assert [state.entity_id for state in changed] == ["switch.ac", "light.bowl"]
+    assert removed == ["light.kitchen"]
+    changed, removed = hass.states.async_changes_since(version + 2)
+    assert [state.entity_id for state in changed] == ["switch.ac"]
+    assert removed == []
+
+    # Adding a removed entity back is a change
+    hass.states.async_set("light.kitchen", "off")
+    changed, removed = hass.states.async_changes_since(version)
+    assert [state.entity_id for state in changed] == [
+        "light.kitchen",
+        "switch.ac",
+        "light.bowl",
+    ]
+    assert removed == []
+
+    # Versions not handed out by this state machine are unknown
+    assert hass.states.async_changes_since(0) is None
+    assert hass.states.async_changes_since(hass.states.async_version() + 1) is None
+
+
+async def test_statemachine_changes_since_forgotten_removals(
+    hass: HomeAssistant,
+) -> None:
+    """Test changes are unknown once the removals have been forgotten."""
+    version = hass.states.async_version()
+    with patch.object(ha, "MAX_REMOVED_STATE_VERSIONS", 2):
+        for entity_id in ("light.one", "light.two", "light.three"):
+            hass.states.async_set(entity_id, "on")
+            hass.states.async_remove(entity_id)
+
+    assert hass.states.async_changes_since(version) is None
+    assert hass.states.async_changes_since(version + 2) == (
+        [],
+        ["light.three", "light.two"],
+    )
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
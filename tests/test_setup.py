@@ -1449,3 +1449,33 @@ async def test_async_wait_component(hass: HomeAssistant) -> None:
     # Clear the event, then call again to make sure we don't block
     setup_stall.clear()
     assert await setup.async_wait_component(hass, "test") is True
+
+
+async def test_async_setup_deferred_component(hass: HomeAssistant) -> None:
+    """Test setting up a deferred component on first use."""
+    setup_calls = []
+
+    async def mock_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+        setup_calls.append(config)
+        return True
+
+    mock_integration(hass, MockModule("test", async_setup=mock_setup))
+
+    # Components which were not deferred are not set up
+    assert setup.async_is_setup_deferred(hass, "test") is False
+    assert await setup.async_setup_deferred_component(hass, "test") is False
+    assert "test" not in hass.config.components
+
+    setup.async_defer_setup_component(hass, "test", {"test": {"key": "value"}})
+    assert setup.async_is_setup_deferred(hass, "test") is True
+    # Deferred components count as loaded until they are set up
+    assert "test" in hass.config.components
+    assert setup_calls == []
+
+    assert await setup.async_setup_deferred_component(hass, "test") is True
+    assert "test" in hass.config.components
+    assert setup.async_is_setup_deferred(hass, "test") is False
+    assert setup_calls == [{"test": {"key": "value"}}]
+
+    assert await setup.async_setup_deferred_component(hass, "test") is True
+    assert len(setup_calls) == 1
@@ -0,0 +1,68 @@
+"""Test the fnmatch index util."""
+
+import pytest
+
+from homeassistant.util.fnmatch_index import (
+    FnmatchIndex,
+    is_fnmatch_pattern,
+    memorized_fnmatch,
+)
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("lutron-*", True),
+        ("esp_??", True),
+        ("[ba][lk]*", True),
+        ("airthings-view", False),
+        ("", False),
+    ],
+)
+def test_is_fnmatch_pattern(pattern: str, expected: bool) -> None:
+    """Test detecting fnmatch patterns."""
+    assert is_fnmatch_pattern(pattern) is expected
+
+
+def test_memorized_fnmatch() -> None:
+    """Test the memorized fnmatch."""
+    assert memorized_fnmatch("lutron-1234", "lutron-*")
+    assert not memorized_fnmatch("lutron", "lutron-*")
+    assert memorized_fnmatch("bl_1234", "[ba][lk]*")
+
+
+def test_fnmatch_index() -> None:
+    """Test exact and wildcard lookups in the index."""
+    index: FnmatchIndex[str] = FnmatchIndex(
+        [
+            ("airthings-view", "airthings"),
+            ("lutron-*", "lutron_caseta"),
+            ("lutron-abc*", "lutron_abc"),
+            ("*-hub", "any_hub"),
+            ("esp_??", "esphome"),
+            ("[ba][lk]*", "flux_led"),
+        ]
+    )
+    assert len(index) == 6
+
+    assert index.match("airthings-view") == ["airthings"]
+    assert index.match("airthings-view2") == []
+    assert index.match("lutron-1234") == ["lutron_caseta"]
+    assert index.match("lutron-abcd") == ["lutron_caseta", "lutron_abc"]
+    assert index.match("lutron-hub") == ["lutron_caseta", "any_hub"]
+    assert index.match("esp_12") == ["esphome"]
+    assert index.match("esp_123") == []
+    assert index.match("bk1234") == ["flux_led"]
+    assert index.match("") == []
+
+
+def test_fnmatch_index_preserves_insertion_order() -> None:
+    """Test values are returned in the order their patterns were added."""
+    index: FnmatchIndex[int] = FnmatchIndex()
+    index.add("*", 0)
+    index.add("device", 1)
+    index.add("dev*", 2)
+    index.add("device", 3)
+
+    assert index.match("device") == [0, 1, 2, 3]
+    assert index.match("dev") == [0, 2]